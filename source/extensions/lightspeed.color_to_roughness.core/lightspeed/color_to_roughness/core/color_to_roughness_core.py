@@ -31,6 +31,7 @@ import carb.tokens
 # import numpy as np
 import omni.usd
 from lightspeed.common import constants
+from omni.flux.utils.common.texture_process_scheduler import run_texture_process as _run_texture_process
 from PIL import Image, ImageOps
 
 
@@ -67,12 +68,11 @@ class ColorToRoughnessCore:
         # Convert the input image to a PNG if it already isn't
         if not texture.lower().endswith(".png"):
             png_texture_path = Path(temp_dir).joinpath(original_texture_name + ".png")
-            with subprocess.Popen(
+            _run_texture_process(
                 [str(nvtt_path), texture, "--output", str(png_texture_path)],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.STDOUT,
-            ) as convert_png_process:
-                convert_png_process.wait()
+            )
             # use PILLOW as a fallback if nvtt fails
             if png_texture_path.exists():
                 with contextlib.suppress(NotImplementedError):
@@ -137,7 +137,7 @@ class ColorToRoughnessCore:
             return
         # Convert to DDS if necessary, and generate mips (note dont use the temp dir for this)
         if output_texture.lower().endswith(".dds"):
-            with subprocess.Popen(
+            _run_texture_process(
                 [
                     str(nvtt_path),
                     str(result_path),
@@ -147,8 +147,7 @@ class ColorToRoughnessCore:
                 + constants.TEXTURE_INFO[constants.MATERIAL_INPUTS_REFLECTIONROUGHNESS_TEXTURE].to_nvtt_flag_array(),
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.STDOUT,
-            ) as compress_mip_process:
-                compress_mip_process.wait()
+            )
         else:
             shutil.copy(str(result_path), output_texture)
 
@@ -805,34 +805,32 @@ class LayerManagerCore:
             A dictionary of the various hashes found and their respective prims
         """
 
-        def get_prims_recursive_no_comp_arcs(parents: List[Sdf.PrimSpec]):
-            """
-            Composition Arcs are not taken in consideration when fetching the prims.
-            The prims will therefore all belong to the same layer but prims in
-            sub-layers will be ignored.
-            """
-            prims = set()
-            for prim in parents:
-                prims.add(prim)
-                prims = prims.union(get_prims_recursive_no_comp_arcs(prim.nameChildren))
-            return prims
-
         hashes = {}
+        path_lengths = {}
         regex_hash = re.compile(REGEX_HASH)
         regex_instance = re.compile(REGEX_INSTANCE_PATH)
-        for prim in get_prims_recursive_no_comp_arcs(layer.rootPrims):
-            match = regex_hash.match(str(prim.path))
+        # Walk the prim specs of the layer in a single pass. Only the prim children are visited, so the prims in
+        # variants and the prims composed through composition arcs are ignored.
+        prims = list(layer.rootPrims)
+        while prims:
+            prim = prims.pop()
+            prims.extend(prim.nameChildren)
+            path = prim.path
+            path_str = path.pathString
+            match = regex_hash.match(path_str)
             if not match:
                 continue
-            if regex_instance.match(str(prim.path)):
+            if regex_instance.match(path_str):
                 continue
             # Always select the shortest path. This is an optimized way to make this function deterministic.
             # Otherwise, the order of the prim paths is not guaranteed, and we sometimes return:
             # - `/RootNode/meshes/mesh_6CA2F12444DEBE09/mesh` or `/RootNode/meshes/mesh_6CA2F12444DEBE09`
             # - `/RootNode/Looks/mat_8D1946B4993CE5A3/Shader` or `/RootNode/Looks/mat_8D1946B4993CE5A3`
             # etc.
-            if match.group(3) not in hashes or len(str(prim.path)) < len(str(hashes[match.group(3)])):
-                hashes[match.group(3)] = prim.path
+            prim_hash = match.group(3)
+            if prim_hash not in hashes or len(path_str) < path_lengths[prim_hash]:
+                hashes[prim_hash] = path
+                path_lengths[prim_hash] = len(path_str)
         return hashes
 
     def open_stage(self, layer_identifier: str, callback: Callable[[], None] = None) -> str:
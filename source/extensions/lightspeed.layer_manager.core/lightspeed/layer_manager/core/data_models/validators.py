@@ -23,6 +23,7 @@ from omni.flux.layer_tree.usd.core import LayerCustomData
 from omni.flux.utils.common.omni_url import OmniUrl
 from pxr import Sdf
 
+from ..layer_type_index import get_layer_type_index as _get_layer_type_index
 from .enums import LayerType, LayerTypeKeys
 
 
@@ -170,6 +171,9 @@ class LayerManagerValidators:
         """
         Helper method used to find layers of a given type up to a certain number of results.
 
+        The layers are looked up in the layer type index of the context, so the sublayer tree is only walked again
+        after it changed.
+
         Args:
             layer_type: The type of layer to look for. None layer type is valid.
             max_results: The maximum number of results to find before quick-returning
@@ -179,31 +183,9 @@ class LayerManagerValidators:
         Returns:
             A list of all the layers matching the given layer_type
         """
-        layers = []
-
-        stage = omni.usd.get_context(context_name).get_stage()
-        if stage is None:
-            return layers
-
-        for layer_identifier in omni.usd.get_all_sublayers(
-            stage, include_session_layers=False, include_only_omni_layers=False, include_anonymous_layers=True
-        ):
-            if max_results >= 0 and max_results == len(layers):
-                return layers
-
-            if not find_muted_layers and stage.IsLayerMuted(layer_identifier):
-                continue
-
-            layer = Sdf.Layer.FindOrOpen(layer_identifier)
-            if not layer:
-                continue
-
-            if layer.customLayerData.get(LayerTypeKeys.layer_type.value) == (
-                layer_type.value if layer_type is not None else None
-            ):
-                layers.append(layer)
-
-        return layers
+        return _get_layer_type_index(context_name).get_layers(
+            layer_type, max_results=max_results, find_muted_layers=find_muted_layers
+        )
 
     @classmethod
     def __is_layer_excluded(cls, layer_id: Path, excluded_types: list[LayerType], context_name: str):
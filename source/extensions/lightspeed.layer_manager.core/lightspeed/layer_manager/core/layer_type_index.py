@@ -0,0 +1,176 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["LayerTypeIndex", "get_layer_type_index"]
+
+import threading
+
+import omni.usd
+from pxr import Sdf, Tf, Usd
+
+from .data_models.enums import LayerType, LayerTypeKeys
+
+_INDEXES: dict[str, "LayerTypeIndex"] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_layer_type_index(context_name: str = "") -> "LayerTypeIndex":
+    """
+    Get the layer type index of a context. The index is created on the first call for the context.
+
+    Args:
+        context_name: The context name to use
+
+    Returns:
+        The layer type index of the context
+    """
+    with _INDEXES_LOCK:
+        if context_name not in _INDEXES:
+            _INDEXES[context_name] = LayerTypeIndex(context_name=context_name)
+        return _INDEXES[context_name]
+
+
+class LayerTypeIndex:
+    def __init__(self, context_name: str = ""):
+        """
+        An index of the layer identifiers of the sublayer tree of a context's stage, grouped by layer type.
+
+        The sublayer tree is only walked when the index is first used for a stage, and again after the sublayers of an
+        indexed layer changed or a layer was muted or unmuted. Layer type changes are applied to the index directly.
+
+        Args:
+            context_name: The context name to use
+        """
+        self._context_name = context_name
+        self._lock = threading.RLock()
+        self._stage_id = None
+        self._dirty = True
+        # The identifiers in sublayer tree order, with their layer type & sublayer paths when indexed
+        self._order: list[str] = []
+        self._layers: dict[str, tuple[str | None, list[str]]] = {}
+        self._identifiers_by_type: dict[str | None, list[str]] = {}
+        self._unresolved: list[str] = []
+
+        self._layers_listener = Tf.Notice.RegisterGlobally(Sdf.Notice.LayersDidChange, self._on_layers_changed)
+        self._muting_listener = None
+
+    def get_layers(
+        self, layer_type: LayerType | None, max_results: int = -1, find_muted_layers: bool = True
+    ) -> list[Sdf.Layer]:
+        """
+        Get the layers of a given type, in sublayer tree order.
+
+        Args:
+            layer_type: The type of layer to look for. None layer type is valid.
+            max_results: The maximum number of results to find before quick-returning
+            find_muted_layers: Whether to look for muted layers or not
+
+        Returns:
+            A list of all the layers matching the given layer_type
+        """
+        layers = []
+
+        context = omni.usd.get_context(self._context_name)
+        stage = context.get_stage()
+        if stage is None:
+            return layers
+
+        with self._lock:
+            self._update(context.get_stage_id(), stage)
+            identifiers = list(self._identifiers_by_type.get(layer_type.value if layer_type is not None else None, []))
+
+        for identifier in identifiers:
+            if max_results >= 0 and max_results == len(layers):
+                return layers
+
+            if not find_muted_layers and stage.IsLayerMuted(identifier):
+                continue
+
+            layer = Sdf.Layer.FindOrOpen(identifier)
+            if not layer:
+                continue
+
+            layers.append(layer)
+
+        return layers
+
+    def invalidate(self):
+        """
+        Walk the sublayer tree again on the next lookup
+        """
+        with self._lock:
+            self._dirty = True
+
+    def _update(self, stage_id: int, stage: Usd.Stage):
+        if stage_id != self._stage_id:
+            self._stage_id = stage_id
+            self._muting_listener = Tf.Notice.Register(Usd.Notice.LayerMutingChanged, self._on_muting_changed, stage)
+            self._dirty = True
+
+        # Layers that couldn't be opened when the tree was walked could exist now
+        if not self._dirty and any(Sdf.Layer.FindOrOpen(identifier) for identifier in self._unresolved):
+            self._dirty = True
+
+        if not self._dirty:
+            return
+
+        self._order = []
+        self._layers = {}
+        self._unresolved = []
+        for layer_identifier in omni.usd.get_all_sublayers(
+            stage, include_session_layers=False, include_only_omni_layers=False, include_anonymous_layers=True
+        ):
+            layer = Sdf.Layer.FindOrOpen(layer_identifier)
+            if not layer:
+                self._unresolved.append(layer_identifier)
+                continue
+            self._order.append(layer_identifier)
+            self._layers[layer_identifier] = (
+                layer.customLayerData.get(LayerTypeKeys.layer_type.value),
+                list(layer.subLayerPaths),
+            )
+        self._group_by_type()
+        self._dirty = False
+
+    def _group_by_type(self):
+        self._identifiers_by_type = {}
+        for identifier in self._order:
+            self._identifiers_by_type.setdefault(self._layers[identifier][0], []).append(identifier)
+
+    def _on_layers_changed(self, notice, _):
+        with self._lock:
+            if self._dirty:
+                return
+            types_changed = False
+            for layer in notice.GetLayers():
+                indexed = self._layers.get(layer.identifier)
+                if indexed is None:
+                    continue
+                layer_type, sublayer_paths = indexed
+                if list(layer.subLayerPaths) != sublayer_paths:
+                    # The tree changed, walk it again on the next lookup
+                    self._dirty = True
+                    return
+                new_layer_type = layer.customLayerData.get(LayerTypeKeys.layer_type.value)
+                if new_layer_type != layer_type:
+                    self._layers[layer.identifier] = (new_layer_type, sublayer_paths)
+                    types_changed = True
+            if types_changed:
+                self._group_by_type()
+
+    def _on_muting_changed(self, *_):
+        self.invalidate()
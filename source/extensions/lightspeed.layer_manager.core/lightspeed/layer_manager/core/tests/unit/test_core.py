@@ -17,12 +17,15 @@
 
 import contextlib
 import pathlib
+import re
+import time
 from types import NoneType
 from typing import Union
 from unittest.mock import Mock, call, patch
 
+import carb
 import omni.usd
-from lightspeed.common.constants import REMIX_CAPTURE_FOLDER, REMIX_FOLDER
+from lightspeed.common.constants import REGEX_HASH, REGEX_INSTANCE_PATH, REMIX_CAPTURE_FOLDER, REMIX_FOLDER
 from lightspeed.layer_manager.core import LayerManagerCore, LayerType, LayerTypeKeys
 from lightspeed.layer_manager.core.data_models import LayerManagerValidators
 from lightspeed.layer_manager.core.layers.autoupscale import AutoUpscaleLayer
@@ -39,6 +42,60 @@ from omni.kit.usd.layers import LayerUtils
 from pxr import Sdf, Usd
 
 
+def _get_layer_hashes_reference(layer: Sdf.Layer):
+    """The original implementation, merging the prims of every level of the hierarchy in a new set"""
+
+    def get_prims_recursive(parents):
+        prims = set()
+        for prim in parents:
+            prims.add(prim)
+            prims = prims.union(get_prims_recursive(prim.nameChildren))
+        return prims
+
+    hashes = {}
+    for prim in get_prims_recursive(layer.rootPrims):
+        match = re.match(REGEX_HASH, str(prim.path))
+        if not match or re.match(REGEX_INSTANCE_PATH, str(prim.path)):
+            continue
+        if match.group(3) not in hashes or len(str(prim.path)) < len(str(hashes[match.group(3)])):
+            hashes[match.group(3)] = prim.path
+    return hashes
+
+
+def _generate_replacement_layer(hash_count: int) -> Sdf.Layer:
+    """Generate a replacement layer with 40 specs per mesh"""
+    attributes = "".join(f"                float attr_{index} = {index}\n" for index in range(4))
+    meshes, materials, instances = [], [], []
+    for index in range(hash_count):
+        mesh_hash = f"{index:016X}"
+        material_hash = f"{index + hash_count:016X}"
+        meshes.append(
+            f'            over "mesh_{mesh_hash}" {{\n{attributes}'
+            f'                over "mesh" {{\n{attributes}                }}\n'
+            f'                over "group_{index}" {{\n{attributes}'
+            f'                    over "mesh_{material_hash}_{index}" {{\n{attributes}                    }}\n'
+            "                }\n            }\n"
+        )
+        materials.append(
+            f'            over "mat_{material_hash}" {{\n{attributes}'
+            f'                over "Shader" {{\n{attributes}                }}\n            }}\n'
+        )
+        instances.append(
+            f'            over "inst_{mesh_hash}_0" {{\n{attributes}'
+            f'                over "mesh" {{\n{attributes}                }}\n            }}\n'
+        )
+    layer = Sdf.Layer.CreateAnonymous()
+    layer.ImportFromString(
+        "#usda 1.0\n"
+        'over "RootNode" {\n'
+        f'        over "meshes" {{\n{"".join(meshes)}        }}\n'
+        f'        over "Looks" {{\n{"".join(materials)}        }}\n'
+        f'        over "instances" {{\n{"".join(instances)}        }}\n'
+        "}\n"
+    )
+    return layer
+
+
 class TestLayerManagerCore(AsyncTestCase):
     # Before running each test
     async def setUp(self):
@@ -770,6 +827,47 @@ class TestLayerManagerCore(AsyncTestCase):
                 # Assert
                 self.assertDictEqual(value, expected_hashes)
 
+    async def test_get_layer_hashes_no_comp_arcs_should_match_reference_implementation(self):
+        # Arrange
+        layer = _generate_replacement_layer(50)
+
+        # Act
+        value = self.layer_manager.get_layer_hashes_no_comp_arcs(layer)
+
+        # Assert
+        self.assertEqual(100, len(value))
+        self.assertDictEqual(_get_layer_hashes_reference(layer), value)
+
+    async def test_get_layer_hashes_no_comp_arcs_benchmark_should_match_reference_implementation(self):
+        # Arrange
+        layer = _generate_replacement_layer(5000)
+        spec_count = 0
+
+        def count_specs(_):
+            nonlocal spec_count
+            spec_count += 1
+
+        layer.Traverse(Sdf.Path.absoluteRootPath, count_specs)
+
+        # Act
+        start = time.perf_counter()
+        value = self.layer_manager.get_layer_hashes_no_comp_arcs(layer)
+        duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected_value = _get_layer_hashes_reference(layer)
+        reference_duration = time.perf_counter() - start
+
+        carb.log_info(
+            f"Found {len(value)} hashes in {spec_count} specs in {duration:.3f}s "
+            f"({reference_duration:.3f}s merging the prims of every level)"
+        )
+
+        # Assert
+        self.assertGreaterEqual(spec_count, 200_000)
+        self.assertEqual(10000, len(value))
+        self.assertDictEqual(expected_value, value)
+
     async def __run_create_layer(
         self,
         should_raise: bool,
@@ -0,0 +1,108 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from unittest.mock import patch
+
+import omni.usd
+from lightspeed.layer_manager.core import LayerType, LayerTypeKeys
+from lightspeed.layer_manager.core.layer_type_index import LayerTypeIndex
+from omni.flux.utils.common.omni_url import OmniUrl
+from omni.flux.utils.tests.context_managers import open_test_project
+from omni.kit.test.async_unittest import AsyncTestCase
+from omni.kit.test_suite.helpers import wait_stage_loading
+from pxr import Sdf
+
+
+class TestLayerTypeIndex(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.context = omni.usd.get_context()
+        await self.context.new_stage_async()
+
+    # After running each test
+    async def tearDown(self):
+        await wait_stage_loading()
+        if self.context.can_close_stage():
+            await self.context.close_stage_async()
+        self.context = None
+
+    async def test_get_layers_should_only_walk_sublayer_tree_once(self):
+        # Arrange
+        async with open_test_project("usd/full_project/full_project.usda", __name__) as project_url:
+            index = LayerTypeIndex()
+            capture_identifier = (OmniUrl(project_url.parent_url) / "capture.usda").path
+
+            with patch.object(omni.usd, "get_all_sublayers", wraps=omni.usd.get_all_sublayers) as walk_mock:
+                # Act
+                values = [index.get_layers(LayerType.capture) for _ in range(3)]
+
+            # Assert
+            self.assertEqual(1, walk_mock.call_count)
+            for value in values:
+                self.assertListEqual([capture_identifier], [layer.identifier for layer in value])
+
+    async def test_get_layers_should_update_when_sublayers_change(self):
+        # Arrange
+        async with open_test_project("usd/full_project/full_project.usda", __name__) as project_url:
+            index = LayerTypeIndex()
+            capture_identifier = (OmniUrl(project_url.parent_url) / "capture.usda").path
+            index.get_layers(LayerType.capture)
+
+            new_capture = Sdf.Layer.CreateAnonymous(tag="new_capture")
+            new_capture.customLayerData = {LayerTypeKeys.layer_type.value: LayerType.capture.value}
+
+            # Act
+            self.context.get_stage().GetRootLayer().subLayerPaths.insert(0, new_capture.identifier)
+            value = index.get_layers(LayerType.capture)
+
+            # Assert
+            self.assertListEqual([new_capture.identifier, capture_identifier], [layer.identifier for layer in value])
+
+    async def test_get_layers_should_update_when_layer_type_changes(self):
+        # Arrange
+        async with open_test_project("usd/full_project/full_project.usda", __name__) as project_url:
+            index = LayerTypeIndex()
+            sublayer = Sdf.Layer.FindOrOpen((OmniUrl(project_url.parent_url) / "sublayer.usda").path)
+            index.get_layers(LayerType.capture)
+
+            # Act
+            custom_data = sublayer.customLayerData
+            custom_data[LayerTypeKeys.layer_type.value] = LayerType.capture.value
+            sublayer.customLayerData = custom_data
+
+            with patch.object(omni.usd, "get_all_sublayers", wraps=omni.usd.get_all_sublayers) as walk_mock:
+                value = index.get_layers(LayerType.capture)
+
+            # Assert
+            self.assertIn(sublayer.identifier, [layer.identifier for layer in value])
+            self.assertEqual(0, walk_mock.call_count)
+
+    async def test_get_layers_should_skip_muted_layers(self):
+        # Arrange
+        async with open_test_project("usd/full_project/full_project.usda", __name__) as project_url:
+            index = LayerTypeIndex()
+            capture_identifier = (OmniUrl(project_url.parent_url) / "capture.usda").path
+            index.get_layers(LayerType.capture)
+
+            # Act
+            self.context.get_stage().MuteLayer(capture_identifier)
+            muted_value = index.get_layers(LayerType.capture, find_muted_layers=True)
+            unmuted_value = index.get_layers(LayerType.capture, find_muted_layers=False)
+
+            # Assert
+            self.assertListEqual([capture_identifier], [layer.identifier for layer in muted_value])
+            self.assertListEqual([], unmuted_value)
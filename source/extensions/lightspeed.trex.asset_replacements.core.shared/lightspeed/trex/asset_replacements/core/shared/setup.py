@@ -38,7 +38,7 @@ from lightspeed.trex.utils.common.asset_utils import is_texture_from_capture as
 from lightspeed.trex.utils.common.prim_utils import filter_prims_paths as _filter_prims_paths
 from lightspeed.trex.utils.common.prim_utils import get_children_prims
 from lightspeed.trex.utils.common.prim_utils import get_extended_selection as _get_extended_selection
-from lightspeed.trex.utils.common.prim_utils import get_prim_paths as _get_prim_paths
+from lightspeed.trex.utils.common.prim_utils import get_prim_query_engine as _get_prim_query_engine
 from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS as _SUPPORTED_TEXTURE_EXTENSIONS
 from omni.flux.asset_importer.core.data_models import TextureTypes as _TextureTypes
 from omni.flux.utils.common import path_utils as _path_utils
@@ -93,22 +93,19 @@ class Setup:
         self.select_prim_paths(body.asset_path)
 
     def get_prim_paths_with_data_model(self, query: GetPrimsQueryModel) -> PrimsResponseModel:
-        prim_paths = []
-
         selection = None
         if query.return_selection:
             selection = _get_extended_selection(self._context_name)
 
-        for prim_type in query.asset_types if query.asset_types is not None else [None]:
-            prim_paths += _get_prim_paths(
-                asset_hashes=query.asset_hashes,
-                prim_type=prim_type,
-                selection=selection,
-                filter_session_prims=query.filter_session_prims,
-                layer_id=query.layer_identifier,
-                exists=query.exists,
-                context_name=self._context_name,
-            )
+        # Get the prims of every asset type in a single stage traversal
+        prim_paths = _get_prim_query_engine(self._context_name).get_prim_paths(
+            prim_types=query.asset_types,
+            asset_hashes=query.asset_hashes,
+            selection=selection,
+            filter_session_prims=query.filter_session_prims,
+            layer_id=query.layer_identifier,
+            exists=query.exists,
+        )
 
         return PrimsResponseModel(asset_paths=prim_paths)
 
@@ -200,6 +197,21 @@ class Setup:
 
         return AssetPathResponseModel(asset_path=str(output_directory))
 
+    def get_stage_revision(self, include_properties: bool = False, include_selection: bool = False) -> str:
+        """
+        Get an identifier of the state of the stage. The result of a query can only change when the identifier changes.
+
+        Args:
+            include_properties: Whether the property changes, such as attribute values, also change the identifier
+            include_selection: Whether the selection changes also change the identifier
+
+        Returns:
+            The revision of the stage
+        """
+        return _get_prim_query_engine(self._context_name).get_revision(
+            include_properties=include_properties, include_selection=include_selection
+        )
+
     # TRADITIONAL FUNCTIONS
 
     def get_children_from_prim(
@@ -23,10 +23,11 @@ import omni.kit.commands
 import omni.usd
 from lightspeed.trex.asset_replacements.core.shared import Setup as _AssetReplacementsCore
 from lightspeed.trex.asset_replacements.core.shared import usd_copier as _usd_copier
+from lightspeed.trex.utils.common import prim_utils as _prim_utils
 from omni.flux.utils.widget.resources import get_test_data as _get_test_data
 from omni.kit.test.async_unittest import AsyncTestCase
 from omni.kit.test_suite.helpers import open_stage, wait_stage_loading
-from pxr import Sdf
+from pxr import Sdf, UsdLux
 
 
 class TestAssetReplacementsCore(AsyncTestCase):
@@ -146,6 +147,110 @@ class TestAssetReplacementsCore(AsyncTestCase):
             [],
         )
 
+    async def test_prim_query_engine_should_match_filtered_prims(self):
+        # Arrange
+        engine = _prim_utils.PrimQueryEngine()
+        type_predicates = {
+            _prim_utils.PrimTypes.LIGHTS: _prim_utils.is_light,
+            _prim_utils.PrimTypes.MATERIALS: _prim_utils.is_material,
+            _prim_utils.PrimTypes.MODELS: _prim_utils.is_model,
+        }
+
+        def get_expected_paths(prim_type, asset_hashes=None):
+            def predicate(prim):
+                if prim_type is None:
+                    is_type = any(type_predicate(prim) for type_predicate in type_predicates.values())
+                else:
+                    is_type = type_predicates[prim_type](prim)
+                return is_type and _prim_utils.includes_hash(prim, asset_hashes)
+
+            return _prim_utils.filter_prims_paths(predicate, filter_session_prims=True)
+
+        for prim_types, asset_hashes in [
+            (None, None),
+            ([_prim_utils.PrimTypes.LIGHTS], None),
+            ([_prim_utils.PrimTypes.MATERIALS], None),
+            ([_prim_utils.PrimTypes.MODELS], None),
+            ([_prim_utils.PrimTypes.MODELS, _prim_utils.PrimTypes.LIGHTS], None),
+            (None, {"BAC90CAA733B0859", "9907D0B07D040077"}),
+            ([_prim_utils.PrimTypes.MODELS], {"BAC90CAA733B0859"}),
+            (None, set()),
+        ]:
+            with self.subTest(name=f"Types: {prim_types}     Hashes: {asset_hashes}"):
+                expected_paths = []
+                for prim_type in prim_types if prim_types is not None else [None]:
+                    expected_paths += get_expected_paths(prim_type, asset_hashes)
+
+                # Act
+                prim_paths = engine.get_prim_paths(prim_types=prim_types, asset_hashes=asset_hashes)
+                cached_prim_paths = engine.get_prim_paths(prim_types=prim_types, asset_hashes=asset_hashes)
+
+                # Assert
+                self.assertListEqual(expected_paths, prim_paths)
+                self.assertListEqual(expected_paths, cached_prim_paths)
+
+    async def test_prim_query_engine_path_prefix_should_only_return_prims_under_prefix(self):
+        # Arrange
+        engine = _prim_utils.PrimQueryEngine()
+        expected_paths = [path for path in engine.get_prim_paths() if path.startswith("/RootNode/meshes/")]
+
+        # Act
+        prim_paths = engine.get_prim_paths(path_prefix="/RootNode/meshes")
+        missing_prefix_paths = engine.get_prim_paths(path_prefix="/RootNode/does_not_exist")
+
+        # Assert
+        self.assertTrue(expected_paths)
+        self.assertListEqual(expected_paths, prim_paths)
+        self.assertListEqual([], missing_prefix_paths)
+
+    async def test_prim_query_engine_should_invalidate_results_when_prims_change(self):
+        # Arrange
+        engine = _prim_utils.PrimQueryEngine()
+        stage = self.context.get_stage()
+        light_path = "/RootNode/lights/light_0123456789ABCDEF"
+
+        lights = engine.get_prim_paths(prim_types=[_prim_utils.PrimTypes.LIGHTS])
+        generation = engine.generation
+
+        # Act
+        light = UsdLux.SphereLight.Define(stage, light_path)
+        new_lights = engine.get_prim_paths(prim_types=[_prim_utils.PrimTypes.LIGHTS])
+        new_generation = engine.generation
+
+        light.CreateIntensityAttr().Set(1234.0)
+        cached_lights = engine.get_prim_paths(prim_types=[_prim_utils.PrimTypes.LIGHTS])
+
+        # Assert
+        self.assertGreater(new_generation, generation)
+        self.assertNotIn(light_path, lights)
+        self.assertListEqual(sorted([*lights, light_path]), sorted(new_lights))
+        self.assertEqual(new_generation, engine.generation)
+        self.assertListEqual(new_lights, cached_lights)
+
+    async def test_prim_query_engine_revision_should_change_with_stage(self):
+        # Arrange
+        engine = _prim_utils.PrimQueryEngine()
+        stage = self.context.get_stage()
+        light = UsdLux.SphereLight.Define(stage, "/RootNode/lights/light_0123456789ABCDEF")
+
+        revision = engine.get_revision()
+        properties_revision = engine.get_revision(include_properties=True)
+
+        # Act
+        engine.get_prim_paths()
+        light.CreateIntensityAttr().Set(1234.0)
+        value_change_revision = engine.get_revision()
+        value_change_properties_revision = engine.get_revision(include_properties=True)
+
+        stage.DefinePrim("/RootNode/lights/light_FEDCBA9876543210", "SphereLight")
+        prim_change_revision = engine.get_revision()
+
+        # Assert
+        self.assertEqual(revision, value_change_revision)
+        self.assertNotEqual(properties_revision, value_change_properties_revision)
+        self.assertNotEqual(revision, prim_change_revision)
+        self.assertNotEqual(revision, _prim_utils.PrimQueryEngine().get_revision())
+
     async def test_asset_is_in_proj_dir(self):
         # Arrange
         core = _AssetReplacementsCore("")
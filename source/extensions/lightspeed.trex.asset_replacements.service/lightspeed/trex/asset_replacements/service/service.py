@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
+from fastapi import Request, Response
 from lightspeed.trex.asset_replacements.core.shared import Setup as AssetReplacementsCore
 from lightspeed.trex.asset_replacements.core.shared.data_models import (
     AssetReplacementsValidators,
@@ -67,6 +68,8 @@ class AssetReplacementsService(ServiceBase):
             response_model=PrimsResponseModel,
         )
         async def get_assets(
+            request: Request,
+            response: Response,
             asset_hashes: set[str] | None = ServiceBase.describe_query_param(  # noqa B008
                 None, "Filter assets to keep specific hashes"
             ),
@@ -90,19 +93,33 @@ class AssetReplacementsService(ServiceBase):
                 "Filter an asset if it exists or not on a given layer. Use in conjunction with `layer_identifier` "
                 "to filter on a given layer, otherwise this parameter will be ignored.",
             ),
+            offset: int = ServiceBase.describe_query_param(0, "The number of assets to skip"),  # noqa B008
+            limit: int | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The maximum number of assets to return. All the assets are returned if not set."
+            ),
         ) -> PrimsResponseModel:
             try:
-                return self.__asset_core.get_prim_paths_with_data_model(
-                    GetPrimsQueryModel(
-                        asset_hashes=asset_hashes,
-                        asset_types=asset_types,
-                        return_selection=selection,
-                        filter_session_prims=filter_session_assets,
-                        layer_identifier=layer_identifier,
-                        exists=exists,
-                        context_name=context_name,
-                    )
+                query = GetPrimsQueryModel(
+                    asset_hashes=asset_hashes,
+                    asset_types=asset_types,
+                    return_selection=selection,
+                    filter_session_prims=filter_session_assets,
+                    layer_identifier=layer_identifier,
+                    exists=exists,
+                    context_name=context_name,
+                )
+                # Only query the stage if the client doesn't have the current response
+                etag = ServiceBase.get_etag(
+                    self.__asset_core.get_stage_revision(include_properties=selection, include_selection=selection),
+                    query,
+                    offset,
+                    limit,
                 )
+                if ServiceBase.is_not_modified(request, etag):
+                    return ServiceBase.not_modified(etag)
+                asset_paths = self.__asset_core.get_prim_paths_with_data_model(query).asset_paths
+                response.headers["ETag"] = etag
+                return PrimsResponseModel(asset_paths=ServiceBase.paginate(asset_paths, offset, limit, response))
             except ValueError as e:
                 ServiceBase.raise_error(422, e)
 
@@ -126,6 +143,8 @@ class AssetReplacementsService(ServiceBase):
             response_model=TexturesResponseModel,
         )
         async def get_material_textures(
+            request: Request,
+            response: Response,
             asset_path: str = ServiceBase.validate_path_param(  # noqa B008
                 PrimTexturesPathParamModel,
                 description=asset_path_description.format("textures"),  # noqa B008
@@ -134,10 +153,25 @@ class AssetReplacementsService(ServiceBase):
             texture_types: set[TextureTypeNames] | None = ServiceBase.describe_query_param(  # noqa B008
                 None, "The type of textures to look for in the given material."
             ),
+            offset: int = ServiceBase.describe_query_param(0, "The number of textures to skip"),  # noqa B008
+            limit: int | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The maximum number of textures to return. All the textures are returned if not set."
+            ),
         ) -> TexturesResponseModel:
-            return self.__asset_core.get_textures_with_data_model(
-                asset_path, GetTexturesQueryModel(texture_types=texture_types)
-            )
+            try:
+                query = GetTexturesQueryModel(texture_types=texture_types)
+                # Only query the stage if the client doesn't have the current response. The textures are attribute
+                # values, so any property change can change the response.
+                etag = ServiceBase.get_etag(
+                    self.__asset_core.get_stage_revision(include_properties=True), asset_path, query, offset, limit
+                )
+                if ServiceBase.is_not_modified(request, etag):
+                    return ServiceBase.not_modified(etag)
+                textures = self.__asset_core.get_textures_with_data_model(asset_path, query).textures
+                response.headers["ETag"] = etag
+                return TexturesResponseModel(textures=ServiceBase.paginate(textures, offset, limit, response))
+            except ValueError as e:
+                ServiceBase.raise_error(422, e)
 
         @self.router.get(
             path="/{asset_path:path}/file-paths",
@@ -0,0 +1,110 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["CaptureCatalog", "get_capture_catalog"]
+
+from typing import Optional
+
+import carb
+from lightspeed.layer_manager.core.data_models import LayerType, LayerTypeKeys
+from omni.flux.utils.common.json_index import JsonIndex as _JsonIndex
+from omni.flux.utils.common.json_index import get_file_signature as _get_file_signature
+from omni.flux.utils.common.json_index import is_signature_unchanged as _is_signature_unchanged
+from pxr import Sdf, Tf
+
+DEFAULT_CATALOG_PATH = "${data}/lightspeed.trex.capture.core.shared/capture_catalog.json"
+
+
+def get_capture_catalog(index_path: str = DEFAULT_CATALOG_PATH) -> "CaptureCatalog":
+    """
+    Get the capture catalog using the given index file
+
+    Args:
+        index_path: the path of the index file. Can contain tokens.
+
+    Returns:
+        The capture catalog
+    """
+    return CaptureCatalog.get_shared(index_path)
+
+
+class CaptureCatalog(_JsonIndex):
+    def __init__(self, index_path: str):
+        """
+        An on-disk index of the layer type of USD files, used to find the capture layers of a directory without opening
+        them.
+
+        The layer type is read from the layer metadata only, and is stored with the size & modification time of the
+        file, so a file is only read again when it changes.
+
+        Args:
+            index_path: the path of the index file
+        """
+        super().__init__(index_path, ["layers"], display_name="capture catalog")
+
+    def is_capture_file(self, path: str) -> bool:
+        """
+        Check whether a USD file is a capture layer
+
+        Args:
+            path: the path of the USD file
+
+        Returns:
+            True if the layer type of the file is capture, False otherwise
+        """
+        return self.get_layer_type(path) == LayerType.capture.value
+
+    def get_layer_type(self, path: str) -> Optional[str]:
+        """
+        Get the layer type stored in the custom layer data of a USD file
+
+        Args:
+            path: the path of the USD file
+
+        Returns:
+            The layer type, or None if the file doesn't have a layer type or can't be read
+        """
+        # A layer that is already loaded can have unsaved changes, so it is always used directly
+        layer = Sdf.Layer.Find(path)
+        if layer:
+            return layer.customLayerData.get(LayerTypeKeys.layer_type.value)
+
+        signature = _get_file_signature(path)
+        if signature is None:
+            # Not a local file: can't tell whether it changed, so read the metadata every time
+            self._remove_entry("layers", path)
+            return self._read_layer_type(path)
+
+        entry = self._get_entry("layers", path)
+        if _is_signature_unchanged(entry, signature):
+            return entry["layer_type"]
+
+        layer_type = self._read_layer_type(path)
+        self._set_entry("layers", path, {**signature, "layer_type": layer_type})
+        return layer_type
+
+    @staticmethod
+    def _read_layer_type(path: str) -> Optional[str]:
+        # Only parse the layer metadata: capture layers can be hundreds of MB
+        try:
+            layer = Sdf.Layer.OpenAsAnonymous(path, metadataOnly=True)
+        except Tf.ErrorException as e:
+            carb.log_verbose(f"Unable to read the layer metadata of {path}: {e}")
+            return None
+        if not layer:
+            return None
+        return layer.customLayerData.get(LayerTypeKeys.layer_type.value)
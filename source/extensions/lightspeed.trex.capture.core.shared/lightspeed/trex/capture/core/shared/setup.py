@@ -32,6 +32,8 @@ from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from PIL import Image
 from pxr import Sdf, Usd, UsdGeom
 
+from .capture_catalog import get_capture_catalog as _get_capture_catalog
+
 
 class Setup:
     def __init__(self, context_name: str):
@@ -155,8 +157,10 @@ class Setup:
 
     @staticmethod
     def is_capture_file(path: str) -> bool:
-        layer = Sdf.Layer.FindOrOpen(path)
-        return Setup.is_layer_a_capture_file(layer)
+        catalog = _get_capture_catalog()
+        result = catalog.is_capture_file(path)
+        catalog.save()
+        return result
 
     @staticmethod
     def is_layer_a_capture_file(layer: Sdf.Layer) -> bool:
@@ -186,13 +190,17 @@ class Setup:
         await callback(result)
 
     def get_capture_files(self) -> List[str]:
+        # Only the captures that changed since the directory was last listed are read
+        catalog = _get_capture_catalog()
+
         def _get_files(_file):
-            return _file.is_file() and _file.suffix in constants.USD_EXTENSIONS and self.is_capture_file(str(_file))
+            return _file.is_file() and _file.suffix in constants.USD_EXTENSIONS and catalog.is_capture_file(str(_file))
 
         if not self._check_directory():
             return []
 
         result = [str(path) for path in Path(self.__directory).iterdir() if _get_files(path)]
+        catalog.save()
 
         # It will deadlock
         # result = []
@@ -15,4 +15,5 @@
 * limitations under the License.
 """
 
+from .unit.test_capture_catalog import *
 from .unit.test_setup import *
@@ -0,0 +1,102 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import omni.kit.test
+from lightspeed.layer_manager.core import LayerManagerCore as _LayerManagerCore
+from lightspeed.layer_manager.core import LayerType as _LayerType
+from lightspeed.trex.capture.core.shared.capture_catalog import CaptureCatalog as _CaptureCatalog
+from pxr import Sdf
+
+
+class TestCaptureCatalog(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index_path = str(Path(self.temp_dir.name) / "catalog" / "capture_catalog.json")
+
+    # After running each test
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def __create_layer(self, name: str, layer_type: _LayerType = None) -> str:
+        path = str(Path(self.temp_dir.name) / name)
+        layer = Sdf.Layer.CreateNew(path)
+        if layer_type is not None:
+            _LayerManagerCore.set_custom_data_layer_type(layer, layer_type)
+        Sdf.CreatePrimInLayer(layer, "/RootNode/meshes/mesh_0123456789ABCDEF")
+        layer.Save()
+        # Release the layer so the catalog has to read the file
+        del layer
+        return path
+
+    async def test_is_capture_file_should_read_layer_type(self):
+        # Arrange
+        capture_path = self.__create_layer("capture.usda", _LayerType.capture)
+        replacement_path = self.__create_layer("replacement.usda", _LayerType.replacement)
+        no_type_path = self.__create_layer("no_type.usda")
+        catalog = _CaptureCatalog(self.index_path)
+
+        # Act
+        values = [
+            catalog.is_capture_file(capture_path),
+            catalog.is_capture_file(replacement_path),
+            catalog.is_capture_file(no_type_path),
+            catalog.is_capture_file(str(Path(self.temp_dir.name) / "missing.usda")),
+        ]
+
+        # Assert
+        self.assertListEqual([True, False, False, False], values)
+
+    async def test_is_capture_file_should_use_saved_index(self):
+        # Arrange
+        capture_path = self.__create_layer("capture.usda", _LayerType.capture)
+        catalog = _CaptureCatalog(self.index_path)
+        catalog.is_capture_file(capture_path)
+        catalog.save()
+
+        # Act
+        with patch.object(Sdf.Layer, "OpenAsAnonymous") as open_mock:
+            value = _CaptureCatalog(self.index_path).is_capture_file(capture_path)
+
+        # Assert
+        self.assertTrue(value)
+        self.assertEqual(0, open_mock.call_count)
+
+    async def test_is_capture_file_should_read_changed_files(self):
+        # Arrange
+        capture_path = self.__create_layer("capture.usda", _LayerType.capture)
+        catalog = _CaptureCatalog(self.index_path)
+        catalog.is_capture_file(capture_path)
+
+        layer = Sdf.Layer.FindOrOpen(capture_path)
+        _LayerManagerCore.set_custom_data_layer_type(layer, _LayerType.replacement)
+        layer.Save()
+        del layer
+        # Make sure the modification time changes even on file systems with a coarse resolution
+        stat = os.stat(capture_path)
+        os.utime(capture_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        # Act
+        value = catalog.is_capture_file(capture_path)
+
+        # Assert
+        self.assertFalse(value)
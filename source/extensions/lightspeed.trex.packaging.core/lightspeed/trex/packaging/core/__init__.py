@@ -15,7 +15,16 @@
 * limitations under the License.
 """
 
-__all__ = ["ModPackagingSchema", "PackagingCore"]
+__all__ = [
+    "DependencyGraph",
+    "ModPackagingSchema",
+    "PACKAGE_MANIFEST_NAME",
+    "PackageManifest",
+    "PackageManifestEntry",
+    "PackagingCore",
+]
 
+from .dependencies import DependencyGraph
 from .items import ModPackagingSchema
+from .manifest import PACKAGE_MANIFEST_NAME, PackageManifest, PackageManifestEntry
 from .packaging import PackagingCore
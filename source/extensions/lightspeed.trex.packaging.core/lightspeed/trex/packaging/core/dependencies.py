@@ -0,0 +1,150 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+import omni.client
+from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from pxr import Sdf, UsdUtils
+
+
+class DependencyGraph:
+    def __init__(self, layers: List[Sdf.Layer], assets: List[str], unresolved_paths: List[str]):
+        """
+        The dependencies of a root layer, computed once and shared by every packaging stage.
+
+        The existence and stat results of every path are cached, so the file system is only queried once per path.
+
+        Args:
+            layers: Every layer used by the root layer, including the root layer itself
+            assets: The resolved paths of every non-layer asset used by the layers
+            unresolved_paths: The asset paths that could not be resolved
+        """
+        self._layers = layers
+        self._assets = assets
+        self._unresolved_paths = unresolved_paths
+
+        # Resolved dependencies are known to exist, no need to stat them to check for existence
+        self._resolved_paths = {_OmniUrl(layer.identifier).path for layer in layers}
+        self._resolved_paths.update(_OmniUrl(asset).path for asset in assets)
+
+        self._stat_cache: Dict[str, Optional[omni.client.ListEntry]] = {}
+
+    @classmethod
+    def compute(cls, root_layer_identifier: str) -> "DependencyGraph":
+        """
+        Compute the full dependency graph of a layer.
+
+        Args:
+            root_layer_identifier: The identifier of the layer to compute the dependencies for
+
+        Returns:
+            The dependency graph of the layer
+        """
+        layers, assets, unresolved_paths = UsdUtils.ComputeAllDependencies(root_layer_identifier)
+        return cls(list(layers), list(assets), list(unresolved_paths))
+
+    @property
+    def layers(self) -> List[Sdf.Layer]:
+        """
+        Every layer in the graph, including the root layer
+        """
+        return self._layers
+
+    @property
+    def assets(self) -> List[str]:
+        """
+        The resolved path of every non-layer asset in the graph
+        """
+        return self._assets
+
+    @property
+    def unresolved_paths(self) -> List[str]:
+        """
+        The asset paths that could not be resolved
+        """
+        return self._unresolved_paths
+
+    @property
+    def dependencies(self) -> List[str]:
+        """
+        The path of every layer and asset in the graph
+        """
+        return [*[layer.identifier for layer in self._layers], *self._assets]
+
+    def exists(self, path: str) -> bool:
+        """
+        Check if a path exists. Paths that are part of the graph are known to exist, other paths are queried once.
+
+        Args:
+            path: The path to check
+
+        Returns:
+            True if the path exists, False otherwise
+        """
+        if _OmniUrl(path).path in self._resolved_paths:
+            return True
+        return self.stat(path) is not None
+
+    def stat(self, path: str) -> Optional[omni.client.ListEntry]:
+        """
+        Get the stat result for a path. The result is cached for subsequent calls.
+
+        Args:
+            path: The path to query
+
+        Returns:
+            The file entry or None if the path doesn't exist
+        """
+        key = _OmniUrl(path).path
+        if key not in self._stat_cache:
+            result, entry = omni.client.stat(path)
+            self._stat_cache[key] = entry if result == omni.client.Result.OK else None
+        return self._stat_cache[key]
+
+    async def stat_async(self, paths: Optional[List[str]] = None):
+        """
+        Query the stat results for many paths concurrently and cache them.
+
+        Args:
+            paths: The paths to query. Every dependency in the graph will be queried if no paths are given.
+        """
+        keys = {}
+        for path in self.dependencies if paths is None else paths:
+            key = _OmniUrl(path).path
+            if key not in self._stat_cache:
+                keys[key] = path
+
+        results = await asyncio.gather(*[omni.client.stat_async(path) for path in keys.values()])
+        for key, (result, entry) in zip(keys.keys(), results):
+            self._stat_cache[key] = entry if result == omni.client.Result.OK else None
+
+    async def get_total_size_async(self) -> int:
+        """
+        Get the total size of every dependency in the graph. Useful to preview the size of a package.
+
+        Returns:
+            The total size, in bytes
+        """
+        await self.stat_async()
+        total_size = 0
+        for path in self.dependencies:
+            entry = self.stat(path)
+            if entry:
+                total_size += entry.size
+        return total_size
@@ -41,7 +41,7 @@ class ModPackagingSchema(BaseModel):
     output_directory: Path = Field(
         ...,
         description="The directory where the packaged mod should be stored.\n\n"
-        "WARNING: The directory will be emptied prior to packaging the mod.",
+        "WARNING: The directory will be emptied prior to packaging the mod unless incremental packaging is used.",
     )
     redirect_external_dependencies: Optional[bool] = Field(
         True,
@@ -55,6 +55,25 @@ class ModPackagingSchema(BaseModel):
     mod_name: str = Field(..., description="The display name used for the mod in the RTX Remix Runtime.")
     mod_version: str = Field(..., description="The mod version. Used when building dependency lists.")
     mod_details: Optional[str] = Field(None, description="Optional text used to describe the mod in more details.")
+    incremental: Optional[bool] = Field(
+        False,
+        description="Whether the package should be updated in place rather than rebuilt from scratch.\n\n"
+        "- A manifest of the packaged files is kept in the output directory.\n"
+        "- Only added or changed assets are copied and only changed layers are exported.\n"
+        "- Files from a previous package that are no longer needed are deleted.\n\n"
+        "If no valid manifest exists in the output directory, the package is fully rebuilt.",
+    )
+    deduplicate_assets: Optional[bool] = Field(
+        False,
+        description="Whether identical assets should only be packaged once.\n\n"
+        "Assets with identical contents are stored once in the package and every layer referencing a duplicate is "
+        "updated to reference the packaged copy instead.",
+    )
+    max_concurrent_copies: Optional[int] = Field(
+        16,
+        description="The maximum number of assets copied to the output directory at the same time during the "
+        "collection stage. Higher values speed up packaging of large mods, especially on network drives.",
+    )
 
     @validator("mod_layer_paths", allow_reuse=True)
     def at_least_one(cls, v):  # noqa
@@ -85,6 +104,13 @@ class ModPackagingSchema(BaseModel):
             raise ValueError("The value cannot be empty")
         return v
 
+    @validator("max_concurrent_copies", allow_reuse=True)
+    def is_positive(cls, v):  # noqa
+        """Check that the value is a strictly positive number"""
+        if v is not None and v < 1:
+            raise ValueError("The value must be greater than 0")
+        return v
+
     @validator("mod_version", allow_reuse=True)
     def is_valid_version(cls, v):  # noqa
         """Check that the mod version has a valid format"""
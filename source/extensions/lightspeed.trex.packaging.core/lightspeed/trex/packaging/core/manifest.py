@@ -0,0 +1,110 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import carb
+import omni.client
+from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from omni.flux.utils.common.path_utils import read_json_file as _read_json_file
+from omni.flux.utils.common.path_utils import write_json_file as _write_json_file
+from pydantic import BaseModel, Field
+
+PACKAGE_MANIFEST_NAME = ".package_manifest.json"
+PACKAGE_MANIFEST_VERSION = 1
+
+
+class PackageManifestEntry(BaseModel):
+    source: str = Field(..., description="The path of the file the packaged file was collected from.")
+    size: Optional[int] = Field(None, description="The size of the source file when it was collected, in bytes.")
+    mtime: Optional[float] = Field(None, description="The modification time of the source file when it was collected.")
+    hash: Optional[str] = Field(None, description="The hash of the packaged file contents.")
+
+    def is_unchanged(self, source: str, size: Optional[int], mtime: Optional[float]) -> bool:
+        """
+        Quick check to know if the source file is the same as the one that was collected, without reading it.
+
+        Args:
+            source: The path of the source file
+            size: The current size of the source file
+            mtime: The current modification time of the source file
+
+        Returns:
+            True if the source file was not modified since it was collected, False otherwise
+        """
+        if size is None or mtime is None:
+            return False
+        return self.source == source and self.size == size and self.mtime == mtime
+
+
+class PackageManifest(BaseModel):
+    version: int = Field(PACKAGE_MANIFEST_VERSION, description="The version of the manifest format.")
+    files: Dict[str, PackageManifestEntry] = Field(
+        {}, description="Every packaged file, keyed by their path relative to the output directory."
+    )
+
+    @classmethod
+    def load(cls, output_directory: Union[Path, str]) -> Optional["PackageManifest"]:
+        """
+        Load the manifest stored in a package output directory.
+
+        Args:
+            output_directory: The package output directory
+
+        Returns:
+            The manifest if a valid one was found, None otherwise
+        """
+        manifest_url = _OmniUrl(output_directory) / PACKAGE_MANIFEST_NAME
+        if not manifest_url.exists:
+            return None
+        try:
+            manifest = cls(**_read_json_file(str(manifest_url)))
+        except Exception:  # noqa PLW0718
+            carb.log_warn(f"Unable to read the package manifest: {manifest_url}")
+            return None
+        if manifest.version != PACKAGE_MANIFEST_VERSION:
+            return None
+        return manifest
+
+    def save(self, output_directory: Union[Path, str]) -> bool:
+        """
+        Save the manifest in a package output directory.
+
+        Args:
+            output_directory: The package output directory
+
+        Returns:
+            True if the manifest was written successfully, False otherwise
+        """
+        return _write_json_file(str(_OmniUrl(output_directory) / PACKAGE_MANIFEST_NAME), self.dict())
+
+
+async def get_file_stat(path: str) -> Tuple[Optional[int], Optional[float]]:
+    """
+    Get the size and modification time of a file.
+
+    Args:
+        path: The file path
+
+    Returns:
+        A tuple of (size in bytes, modification timestamp). Both values will be None if the file could not be found.
+    """
+    result, entry = await omni.client.stat_async(path)
+    if result != omni.client.Result.OK or not entry:
+        return None, None
+    return entry.size, entry.modified_time.timestamp() if entry.modified_time else None
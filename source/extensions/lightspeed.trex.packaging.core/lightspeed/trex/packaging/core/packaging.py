@@ -15,12 +15,14 @@
 * limitations under the License.
 """
 
-import re
+import asyncio
+import hashlib
+import posixpath
 import uuid
 from asyncio import ensure_future
 from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 import carb
 import omni.client
@@ -30,16 +32,27 @@ import omni.usd
 from lightspeed.common.constants import REMIX_CAPTURE_FOLDER as _REMIX_CAPTURE_FOLDER
 from lightspeed.common.constants import REMIX_DEPENDENCIES_FOLDER as _REMIX_DEPENDENCIES_FOLDER
 from lightspeed.common.constants import REMIX_MODS_FOLDER as _REMIX_MODS_FOLDER
-from lightspeed.common.constants import REMIX_SUBUSD_RELATIVE_PATH as _REMIX_SUBUSD_RELATIVE_PATH
 from lightspeed.layer_manager.core import LSS_LAYER_MOD_DEPENDENCIES as _LSS_LAYER_MOD_DEPENDENCIES
 from lightspeed.layer_manager.core import LSS_LAYER_MOD_NAME as _LSS_LAYER_MOD_NAME
 from lightspeed.layer_manager.core import LSS_LAYER_MOD_NOTES as _LSS_LAYER_MOD_NOTES
 from lightspeed.layer_manager.core import LSS_LAYER_MOD_VERSION as _LSS_LAYER_MOD_VERSION
+from lightspeed.trex.packaging.core.dependencies import DependencyGraph as _DependencyGraph
 from lightspeed.trex.packaging.core.items import ModPackagingSchema as _ModPackagingSchema
+from lightspeed.trex.packaging.core.manifest import PACKAGE_MANIFEST_NAME as _PACKAGE_MANIFEST_NAME
+from lightspeed.trex.packaging.core.manifest import PackageManifest as _PackageManifest
+from lightspeed.trex.packaging.core.manifest import PackageManifestEntry as _PackageManifestEntry
+from lightspeed.trex.packaging.core.manifest import get_file_stat as _get_file_stat
+from lightspeed.trex.packaging.core.path_utils import clear_caches as _clear_path_caches
+from lightspeed.trex.packaging.core.path_utils import get_package_relative_path as _get_package_relative_path
+from lightspeed.trex.packaging.core.path_utils import get_parent_url as _get_parent_url
+from lightspeed.trex.packaging.core.path_utils import get_url_path as _get_url_path
+from lightspeed.trex.packaging.core.path_utils import resolve_layer_asset_path as _resolve_layer_asset_path
+from lightspeed.trex.packaging.core.path_utils import simplify_path as _simplify_path
 from omni.flux.utils.common import Event as _Event
 from omni.flux.utils.common import EventSubscription as _EventSubscription
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from omni.flux.utils.common.path_utils import hash_file as _hash_file
 from omni.flux.utils.material_converter.utils import MaterialConverterUtils as _MaterialConverterUtils
 from omni.kit.usd.collect.omni_client_wrapper import OmniClientWrapper as _OmniClientWrapper
 from omni.kit.usd.layers import LayerUtils as _LayerUtils
@@ -49,6 +62,13 @@ if TYPE_CHECKING:
     from pxr import Usd
 
 
+class _CollectionItem(NamedTuple):
+    input_path: str
+    source_path: str
+    output_path: _OmniUrl
+    relative_path: str
+
+
 class PackagingCore:
     def __init__(self):
         self.default_attr = {
@@ -56,6 +76,7 @@ class PackagingCore:
             "_current_count": None,
             "_total_count": None,
             "_temp_files": None,
+            "_temp_layers": None,
         }
         for attr, value in self.default_attr.items():
             setattr(self, attr, value)
@@ -63,8 +84,13 @@ class PackagingCore:
         self._cancel_token = False
         self._current_count = 0
         self._total_count = 0
-        self._status = "(0/7) Initializing"
+        # The asset deduplication is an optional stage
+        self._stage_count = 7
+        self._status = self._get_stage_status(0, "Initializing")
         self._temp_files = {}
+        self._temp_layers = {}
+        self._deduplicated_count = 0
+        self._deduplicated_size = 0
 
         self.__packaging_progress = _Event()
         self.__packaging_completed = _Event()
@@ -107,8 +133,11 @@ class PackagingCore:
         Asynchronous implementation of package, but async without error handling.  This is meant for testing.
         """
         errors = []
+        self._deduplicated_count = 0
+        self._deduplicated_size = 0
         try:
             model = _ModPackagingSchema(**schema)
+            self._stage_count = 8 if model.deduplicate_assets else 7
 
             if model.mod_layer_paths[0] not in model.selected_layer_paths:
                 carb.log_warn("The root-level mod layer was not selected. Nothing to package.")
@@ -124,7 +153,7 @@ class PackagingCore:
             temp_root_mod_layer = Sdf.Layer.FindOrOpen(await self._make_temp_layer(root_mod_layer.identifier))
 
             # Remove all deselected sublayers
-            self._packaging_new_stage("(1/7) Filtering the selected layers...", 1)
+            self._packaging_new_stage(self._get_stage_status(1, "Filtering the selected layers..."), 1)
             temp_layers = await self._filter_sublayers(
                 model.context_name,
                 None,
@@ -133,10 +162,13 @@ class PackagingCore:
             )
             self.current_count += 1
 
+            # The dependencies are computed once and shared by every following stage
+            dependency_graph = self.compute_dependencies(temp_root_mod_layer.identifier)
+
             # Get the updated external mods dependencies pointing to the installed external mods
             if model.redirect_external_dependencies:
                 mod_dependencies, redirected_dependencies = self._get_redirected_dependencies(
-                    temp_root_mod_layer, [m for m in model.mod_layer_paths if m not in model.selected_layer_paths]
+                    dependency_graph, [m for m in model.mod_layer_paths if m not in model.selected_layer_paths]
                 )
             # No dependencies will be redirected
             else:
@@ -145,7 +177,16 @@ class PackagingCore:
 
             # Don't use the omni collector because it's not flexible enough
             errors.extend(
-                await self._collect(temp_root_mod_layer, temp_layers, model.output_directory, redirected_dependencies)
+                await self._collect(
+                    temp_root_mod_layer,
+                    dependency_graph,
+                    temp_layers,
+                    model.output_directory,
+                    redirected_dependencies,
+                    model.max_concurrent_copies,
+                    model.incremental,
+                    model.deduplicate_assets,
+                )
             )
 
             exported_mod_layer = Sdf.Layer.FindOrOpen(
@@ -166,6 +207,8 @@ class PackagingCore:
         finally:
             # Cleanup the temp files
             await self._clean_temp_files()
+            # The cached paths are only valid for a single packaging run
+            _clear_path_caches()
             # Reset the cancel state
             self._packaging_completed(errors)
 
@@ -199,6 +242,35 @@ class PackagingCore:
         self._total_count = val
         self._packaging_progress()
 
+    @property
+    def deduplicated_count(self) -> int:
+        """
+        Get the number of duplicate assets that were not collected during the last packaging process
+        """
+        return self._deduplicated_count
+
+    @property
+    def deduplicated_size(self) -> int:
+        """
+        Get the number of bytes saved by deduplicating assets during the last packaging process
+        """
+        return self._deduplicated_size
+
+    @staticmethod
+    def compute_dependencies(layer_identifier: str) -> _DependencyGraph:
+        """
+        Compute the dependency graph of a layer without packaging it.
+
+        The graph can be used to preview the contents and size of a package.
+
+        Args:
+            layer_identifier: The identifier of the root layer to package
+
+        Returns:
+            The dependency graph of the layer, containing every layer, asset and unresolved path
+        """
+        return _DependencyGraph.compute(layer_identifier)
+
     @property
     def status(self) -> str:
         """
@@ -207,14 +279,36 @@ class PackagingCore:
         return self._status
 
     @omni.usd.handle_exception
-    async def _make_temp_layer(self, layer_path: str) -> str:
+    async def _make_temp_layer(self, layer_path: str) -> Optional[str]:
+        """
+        Create an in-memory copy of a layer that can be modified without affecting the original layer.
+
+        The temporary layer uses an identifier located next to the original layer so relative paths resolve the same
+        way, but it is never written to disk.
+
+        Args:
+            layer_path: The path of the layer to copy
+
+        Returns:
+            The identifier of the temporary layer or None if the layer could not be opened
+        """
         layer_url = _OmniUrl(layer_path)
         temp_path = layer_url.with_name(
             _OmniUrl(layer_url.stem + f"_{uuid.uuid4()}").with_suffix(layer_url.suffix).path
         ).path
 
-        await _OmniClientWrapper.copy(layer_path, temp_path, set_target_writable_if_read_only=True)
+        # Make sure unsaved changes are not packaged by reading the layer from disk if it was modified in memory
+        source_layer = Sdf.Layer.Find(layer_path)
+        if not source_layer or source_layer.dirty:
+            source_layer = Sdf.Layer.OpenAsAnonymous(layer_path)
+        if not source_layer:
+            return None
+
+        temp_layer = Sdf.Layer.New(Sdf.FileFormat.FindByExtension(temp_path), temp_path)
+        temp_layer.TransferContent(source_layer)
 
+        # Keep a reference to the temporary layer, so it stays in the layer registry until the packaging is done
+        self._temp_layers[temp_path] = temp_layer
         self._temp_files[temp_path] = layer_url.name
         return temp_path
 
@@ -224,15 +318,16 @@ class PackagingCore:
 
     @omni.usd.handle_exception
     async def _clean_temp_files(self):
-        self._packaging_new_stage("(7/7) Cleaning up temporary layers...", len(self._temp_files))
+        self._packaging_new_stage(
+            self._get_stage_status(self._stage_count, "Cleaning up temporary layers..."), len(self._temp_files)
+        )
 
+        # Temporary layers only live in memory, releasing them is enough to remove them from the layer registry
         for temp_file in self._temp_files:
-            try:
-                await _OmniClientWrapper.delete(str(temp_file))
-            except Exception:  # noqa PLW0718
-                carb.log_warn(f"Unable to cleanup temporary layer: {temp_file}")
+            self._temp_layers.pop(temp_file, None)
             self.current_count += 1
         self._temp_files.clear()
+        self._temp_layers.clear()
 
     @omni.usd.handle_exception
     async def _initialize_usd_stage(self, context_name: str, root_mod_layer_path: str) -> "Usd.Stage":
@@ -286,9 +381,8 @@ class PackagingCore:
         for sublayer_path in temp_layer.subLayerPaths:
             if self._cancel_token:
                 return temp_layers
-            temp_sublayer = Sdf.Layer.FindOrOpen(
-                await self._make_temp_layer(temp_layer.ComputeAbsolutePath(sublayer_path))
-            )
+            temp_sublayer_path = await self._make_temp_layer(temp_layer.ComputeAbsolutePath(sublayer_path))
+            temp_sublayer = Sdf.Layer.FindOrOpen(temp_sublayer_path) if temp_sublayer_path else None
             if not temp_sublayer:
                 self.current_count += 1
                 continue
@@ -299,15 +393,14 @@ class PackagingCore:
         return temp_layers
 
     def _get_redirected_dependencies(
-        self, temp_root_layer: Sdf.Layer, external_mod_paths: List[Path]
+        self, dependency_graph: _DependencyGraph, external_mod_paths: List[Path]
     ) -> Tuple[Set[str], Set[str]]:
         mod_dependencies = set()
         redirected_dependencies = set()
 
-        all_layers, all_assets, _ = UsdUtils.ComputeAllDependencies(temp_root_layer.identifier)
-        all_dependencies = [*[layer.identifier for layer in all_layers], *all_assets]
+        all_dependencies = dependency_graph.dependencies
 
-        self._packaging_new_stage("(2/7) Redirecting dependencies...", len(all_dependencies))
+        self._packaging_new_stage(self._get_stage_status(2, "Redirecting dependencies..."), len(all_dependencies))
 
         # Update all the layer dependencies in this layer
         for dependency in all_dependencies:
@@ -340,18 +433,24 @@ class PackagingCore:
     async def _collect(
         self,
         temp_root_layer: Sdf.Layer,
+        dependency_graph: _DependencyGraph,
         existing_temp_layers: List[str],
         output_directory: Union[Path, str],
         redirected_dependencies: Set[str],
+        max_concurrent_copies: int = 16,
+        incremental: bool = False,
+        deduplicate_assets: bool = False,
     ) -> List[str]:
         errors = []
 
         if self._cancel_token:
             return errors
 
-        all_layers, all_assets, unresolved_paths = UsdUtils.ComputeAllDependencies(temp_root_layer.identifier)
+        all_layers = dependency_graph.layers
+        all_assets = dependency_graph.assets
+        unresolved_paths = dependency_graph.unresolved_paths
 
-        self._packaging_new_stage("(3/7) Creating temporary layers...", len(all_layers))
+        self._packaging_new_stage(self._get_stage_status(3, "Creating temporary layers..."), len(all_layers))
 
         temp_layers_map = {self._get_original_path(temp_layer): temp_layer for temp_layer in existing_temp_layers}
         temp_layers = []
@@ -369,9 +468,9 @@ class PackagingCore:
                 temp_layer_path = temp_layers_map.get(_OmniUrl(layer.identifier).path) or await self._make_temp_layer(
                     layer.identifier
                 )
-            temp_layer = Sdf.Layer.FindOrOpen(temp_layer_path)
+            temp_layer = Sdf.Layer.FindOrOpen(temp_layer_path) if temp_layer_path else None
             if not temp_layer:
-                errors.append(f"Unable to open temporary file: {temp_layer_path}")
+                errors.append(f"Unable to open temporary layer: {temp_layer_path or layer.identifier}")
             else:
                 temp_layers.append(temp_layer)
 
@@ -384,7 +483,7 @@ class PackagingCore:
         temp_layer_paths = {_OmniUrl(temp_layer.identifier).path: temp_layer for temp_layer in temp_layers}
         all_dependencies = [*temp_layer_paths.keys(), *all_assets]
 
-        self._packaging_new_stage("(4/7) Listing assets to collect...", len(all_dependencies))
+        self._packaging_new_stage(self._get_stage_status(4, "Listing assets to collect..."), len(all_dependencies))
 
         updated_dependencies = {}
         shader_subidentifiers = [url.name for url in _MaterialConverterUtils.get_material_library_shader_urls()]
@@ -421,55 +520,76 @@ class PackagingCore:
             if self._get_original_path(temp_layer.identifier) not in redirected_dependencies
         }
 
-        self._packaging_new_stage("(5/7) Updating asset paths...", len(temp_layers))
+        self._packaging_new_stage(self._get_stage_status(5, "Updating asset paths..."), len(temp_layers))
 
         for temp_layer in temp_layers:
             if self._cancel_token:
                 return errors
             self.current_count += 1
-            UsdUtils.ModifyAssetPaths(temp_layer, partial(self._modify_asset_paths, temp_layer, updated_dependencies))
+            UsdUtils.ModifyAssetPaths(
+                temp_layer, partial(self._modify_asset_paths, temp_layer, dependency_graph, updated_dependencies)
+            )
+
+        if deduplicate_assets:
+            await self._deduplicate_assets(dependency_graph, temp_layer_paths, max_concurrent_copies)
 
         # Wrap in a try for when Export fails to write the file
         try:
             if self._cancel_token:
                 return errors
 
+            # An existing package can only be updated in place if a valid manifest was found
+            previous_manifest = _PackageManifest.load(output_directory) if incremental else None
+            manifest = _PackageManifest() if incremental else None
+
             # Make sure to create a clean packaging directory
-            if _OmniUrl(output_directory).exists:
+            if previous_manifest:
+                # The previous manifest will no longer be valid once the package starts being updated
+                await _OmniClientWrapper.delete(str(_OmniUrl(output_directory) / _PACKAGE_MANIFEST_NAME))
+            elif _OmniUrl(output_directory).exists:
                 await _OmniClientWrapper.delete(str(output_directory))
 
-            self._packaging_new_stage("(6/7) Collecting assets...", len(self._collected_dependencies))
-
-            # Copy all collected assets to the output directory
+            # Resolve every output path up-front so the folder tree can be created in a single pass
+            collection_items = []
             for temp_input_path, relative_output_path in self._collected_dependencies.items():
-                if self._cancel_token:
-                    return errors
-
                 output_path = _OmniUrl(output_directory) / relative_output_path
                 input_path = self._get_original_path(temp_input_path)
                 if input_path:
                     output_path = output_path.with_name(_OmniUrl(input_path).name)
+                collection_items.append(
+                    _CollectionItem(
+                        temp_input_path,
+                        input_path or temp_input_path,
+                        output_path,
+                        posixpath.relpath(output_path.path, _OmniUrl(output_directory).path),
+                    )
+                )
 
-                # Create all the missing folders in the tree
-                cumulative_url = None
-                for part in Path(output_path.parent_url).parts:
-                    if not cumulative_url:
-                        cumulative_url = _OmniUrl(part)
-                    else:
-                        cumulative_url /= part
-                    if not str(cumulative_url).startswith(str(output_directory)) or cumulative_url.exists:
-                        continue
-                    await _OmniClientWrapper.create_folder(str(cumulative_url))
-
-                # If the dependency is a layer, export it to the output directory to keep references changes applied
-                input_layer = temp_layer_paths.get(temp_input_path)
-                if input_layer:
-                    input_layer.Export(str(output_path))
-                # Otherwise simply copy the dependency to the output directory
-                else:
-                    await _OmniClientWrapper.copy(temp_input_path, str(output_path))
+            # Files from the previous package that are not collected anymore should be deleted
+            stale_files = []
+            if previous_manifest:
+                collected_files = {item.relative_path for item in collection_items}
+                stale_files = sorted(set(previous_manifest.files.keys()).difference(collected_files))
 
-                self.current_count += 1
+            self._packaging_new_stage(
+                self._get_stage_status(self._stage_count - 1, "Collecting assets..."),
+                len(collection_items) + len(stale_files),
+            )
+
+            await self._create_output_folders(output_directory, [item.output_path for item in collection_items])
+
+            if self._cancel_token:
+                return errors
+
+            errors.extend(
+                await self._copy_assets(
+                    collection_items, temp_layer_paths, max_concurrent_copies, previous_manifest, manifest
+                )
+            )
+            await self._delete_stale_files(output_directory, stale_files)
+
+            if manifest is not None and not errors and not self._cancel_token:
+                manifest.save(output_directory)
         # Make sure to bubble up failures
         except Exception as e:  # noqa PLW0706
             errors.append(e)
@@ -479,6 +599,229 @@ class PackagingCore:
 
         return errors
 
+    async def _deduplicate_assets(
+        self, dependency_graph: _DependencyGraph, layers: Dict[str, Sdf.Layer], max_concurrent_hashes: int
+    ):
+        """
+        Find identical assets marked for collection, only keep one copy of each and update the layers to use it.
+
+        Must be called after the asset paths were updated since it relies on the collected dependencies output paths.
+
+        Args:
+            dependency_graph: The dependency graph of the packaged layers
+            layers: A map of temporary layer path to layer for every layer that will be packaged
+            max_concurrent_hashes: The maximum number of assets to hash at the same time
+        """
+        # Layers are modified during packaging, only other assets are deduplicated
+        assets = [path for path in self._collected_dependencies if path not in layers]
+
+        self._packaging_new_stage(self._get_stage_status(6, "Deduplicating assets..."), len(assets))
+
+        # Files can only be identical if they have the same size, so only files sharing a size need to be hashed
+        await dependency_graph.stat_async(assets)
+        assets_by_size = {}
+        for asset in assets:
+            entry = dependency_graph.stat(asset)
+            if entry:
+                assets_by_size.setdefault(entry.size, []).append(asset)
+        candidates = [asset for group in assets_by_size.values() if len(group) > 1 for asset in group]
+        self.current_count += len(assets) - len(candidates)
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrent_hashes))
+
+        async def hash_asset(asset_path: str) -> Optional[str]:
+            async with semaphore:
+                if self._cancel_token:
+                    return None
+                file_hash = await asyncio.get_event_loop().run_in_executor(None, _hash_file, asset_path)
+                self.current_count += 1
+                return file_hash
+
+        hashes = await asyncio.gather(*[hash_asset(asset) for asset in candidates])
+        if self._cancel_token:
+            return
+
+        assets_by_hash = {}
+        for asset, file_hash in zip(candidates, hashes):
+            if file_hash:
+                assets_by_hash.setdefault(file_hash, []).append(asset)
+
+        # Keep the first copy of every asset and redirect the duplicates to it
+        redirects = {}
+        for duplicates in assets_by_hash.values():
+            if len(duplicates) < 2:
+                continue
+            duplicates.sort(key=lambda a: posixpath.normpath(self._collected_dependencies[a]))
+            canonical_path = posixpath.normpath(self._collected_dependencies[duplicates[0]])
+            for duplicate in duplicates[1:]:
+                redirects[posixpath.normpath(self._collected_dependencies.pop(duplicate))] = canonical_path
+                self._deduplicated_count += 1
+                self._deduplicated_size += dependency_graph.stat(duplicate).size
+
+        if not redirects:
+            return
+
+        for temp_layer_path, layer in layers.items():
+            layer_output_path = self._collected_dependencies.get(temp_layer_path)
+            # Layers that are not collected will not be part of the package
+            if not layer_output_path:
+                continue
+            layer_directory = posixpath.dirname(posixpath.normpath(layer_output_path))
+            UsdUtils.ModifyAssetPaths(layer, partial(self._redirect_to_canonical_asset, layer_directory, redirects))
+
+        carb.log_info(
+            f"Deduplicated {self._deduplicated_count} packaged asset(s), saving {self._deduplicated_size} bytes."
+        )
+
+    def _redirect_to_canonical_asset(self, layer_directory: str, redirects: Dict[str, str], asset_path: str) -> str:
+        if self._cancel_token or Path(asset_path).is_absolute():
+            return asset_path
+
+        output_path = posixpath.normpath(posixpath.join(layer_directory, asset_path))
+        canonical_path = redirects.get(output_path)
+        if not canonical_path:
+            return asset_path
+
+        relative_path = posixpath.relpath(canonical_path, layer_directory or ".")
+        return relative_path if relative_path.startswith("../") else f"./{relative_path}"
+
+    async def _create_output_folders(self, output_directory: Union[Path, str], output_paths: List[_OmniUrl]):
+        """
+        Create every folder required to store the given output paths. Each folder is created once, parents first.
+
+        Args:
+            output_directory: The packaging output directory. Folders outside this directory will not be created.
+            output_paths: The output paths of every asset to collect
+        """
+        folders = set()
+        for output_path in output_paths:
+            cumulative_url = None
+            for part in Path(output_path.parent_url).parts:
+                if not cumulative_url:
+                    cumulative_url = _OmniUrl(part)
+                else:
+                    cumulative_url /= part
+                folder = str(cumulative_url)
+                if folder.startswith(str(output_directory)):
+                    folders.add(folder)
+
+        # Sorting the paths makes sure parent folders are always created before their children
+        for folder in sorted(folders):
+            if self._cancel_token:
+                return
+            await _OmniClientWrapper.create_folder(folder)
+
+    async def _copy_assets(
+        self,
+        collection_items: List["_CollectionItem"],
+        layers: Dict[str, Sdf.Layer],
+        max_concurrent_copies: int,
+        previous_manifest: Optional[_PackageManifest] = None,
+        manifest: Optional[_PackageManifest] = None,
+    ) -> List[str]:
+        """
+        Export the collected layers and copy the collected assets to the output directory.
+
+        Layers are exported sequentially while other assets are copied concurrently, up to `max_concurrent_copies`
+        files at the same time. The progress is updated every time an item is collected.
+
+        If a manifest is given, the packaging is incremental: items that did not change since the previous manifest
+        was written are skipped and every collected item is recorded in the manifest.
+
+        Args:
+            collection_items: Every item to collect
+            layers: A map of input path to layer for every layer that should be exported rather than copied
+            max_concurrent_copies: The maximum number of copy operations to run at the same time
+            previous_manifest: The manifest found in the output directory before packaging, if any
+            manifest: The manifest to fill with the collected items, if packaging incrementally
+
+        Returns:
+            A list of errors that occurred while collecting the items
+        """
+        errors = []
+        semaphore = asyncio.Semaphore(max(1, max_concurrent_copies))
+
+        async def copy_asset(item: _CollectionItem):
+            async with semaphore:
+                if self._cancel_token:
+                    return
+                try:
+                    if manifest is None:
+                        await _OmniClientWrapper.copy(item.input_path, str(item.output_path))
+                    else:
+                        await self._copy_asset_incremental(item, previous_manifest, manifest)
+                except Exception as e:  # noqa PLW0718
+                    errors.append(f"Unable to collect the asset {item.input_path}: {e}")
+                self.current_count += 1
+
+        copy_tasks = []
+        for item in collection_items:
+            if self._cancel_token:
+                break
+            # If the dependency is a layer, export it to the output directory to keep references changes applied
+            input_layer = layers.get(item.input_path)
+            if input_layer:
+                self._export_layer(input_layer, item, previous_manifest, manifest)
+                self.current_count += 1
+            # Otherwise simply copy the dependency to the output directory
+            else:
+                copy_tasks.append(copy_asset(item))
+
+        await asyncio.gather(*copy_tasks)
+
+        return errors
+
+    def _export_layer(
+        self,
+        layer: Sdf.Layer,
+        item: "_CollectionItem",
+        previous_manifest: Optional[_PackageManifest],
+        manifest: Optional[_PackageManifest],
+    ):
+        if manifest is None:
+            layer.Export(str(item.output_path))
+            return
+
+        # Layers are modified during packaging so the exported content is compared instead of the source file
+        layer_hash = hashlib.md5(layer.ExportToString().encode("utf-8")).hexdigest()
+        previous_entry = previous_manifest.files.get(item.relative_path) if previous_manifest else None
+        if not previous_entry or previous_entry.hash != layer_hash or not item.output_path.exists:
+            layer.Export(str(item.output_path))
+
+        manifest.files[item.relative_path] = _PackageManifestEntry(source=item.source_path, hash=layer_hash)
+
+    async def _copy_asset_incremental(
+        self, item: "_CollectionItem", previous_manifest: Optional[_PackageManifest], manifest: _PackageManifest
+    ):
+        size, mtime = await _get_file_stat(item.input_path)
+        previous_entry = previous_manifest.files.get(item.relative_path) if previous_manifest else None
+        # The copy can only be skipped if the previous output is still in the package
+        can_skip_copy = bool(previous_entry) and item.output_path.exists
+
+        # Only read the file if the size or modification time changed since the previous packaging
+        if can_skip_copy and previous_entry.is_unchanged(item.source_path, size, mtime):
+            manifest.files[item.relative_path] = previous_entry
+            return
+
+        file_hash = await asyncio.get_event_loop().run_in_executor(None, _hash_file, item.input_path)
+        if not can_skip_copy or not file_hash or previous_entry.hash != file_hash:
+            await _OmniClientWrapper.copy(item.input_path, str(item.output_path))
+
+        manifest.files[item.relative_path] = _PackageManifestEntry(
+            source=item.source_path, size=size, mtime=mtime, hash=file_hash
+        )
+
+    async def _delete_stale_files(self, output_directory: Union[Path, str], stale_files: List[str]):
+        for stale_file in stale_files:
+            if self._cancel_token:
+                return
+            stale_url = _OmniUrl(output_directory) / stale_file
+            try:
+                await _OmniClientWrapper.delete(str(stale_url))
+            except Exception:  # noqa PLW0718
+                carb.log_warn(f"Unable to delete a file that is no longer part of the package: {stale_url}")
+            self.current_count += 1
+
     def _update_layer_metadata(
         self, model: _ModPackagingSchema, layer: Sdf.Layer, mod_dependencies: Set[str], update_dependencies: bool
     ) -> List[str]:
@@ -538,58 +881,41 @@ class PackagingCore:
         if self._cancel_token:
             return relative_path
 
-        fixed_relative_path = relative_path
-
-        # Make sure absolute paths are converted to relative paths
-        relative_path_is_absolute = Path(relative_path).is_absolute()
-        if relative_path_is_absolute:
-            fixed_relative_path = (_OmniUrl(_REMIX_SUBUSD_RELATIVE_PATH) / _OmniUrl(relative_path).name).path
-
         # If the parent was collected, make sure to add its relative path from the output directory to the child deps.
         # IMPORTANT NOTE: This assumes the parent was collected before the dependency which entirely depends on the
         # USD Utils implementation and there doesn't seem to be any guarantee that this will remain true.
-        parent_relative_path = self._collected_dependencies.get(_OmniUrl(temp_layer.identifier).path, "")
+        parent_relative_path = self._collected_dependencies.get(_get_url_path(temp_layer.identifier), "")
         if parent_relative_path:
-            parent_relative_path = _OmniUrl(parent_relative_path).parent_url
+            parent_relative_path = _get_parent_url(parent_relative_path)
 
-        output_path = self._simplify_relative_path(
-            (_OmniUrl(output_directory) / parent_relative_path / fixed_relative_path).path
+        fixed_relative_path, output_relative_path = _get_package_relative_path(
+            str(output_directory), parent_relative_path, relative_path
         )
 
-        # If the resulting output path is outside the output directory, the relative path should be modified
-        if not str(output_path).startswith(_OmniUrl(output_directory).path):
-            fixed_relative_path = re.sub("^((?:./)*../)+", _REMIX_SUBUSD_RELATIVE_PATH, fixed_relative_path)
-
-        # Normalize the path
-        fixed_relative_path = _OmniUrl(fixed_relative_path).path
-
-        # Make sure to keep the preceding "./" if it was there in the first place
-        if not fixed_relative_path.startswith("./") and not fixed_relative_path.startswith("../"):
-            fixed_relative_path = f"./{fixed_relative_path}"
-
         # Store the dependency's overall relative output path for collection and future dependencies paths
-        self._collected_dependencies[dependency_path] = (_OmniUrl(parent_relative_path) / fixed_relative_path).path
+        self._collected_dependencies[dependency_path] = output_relative_path
 
         return fixed_relative_path
 
     def _modify_asset_paths(
-        self, temp_layer: Sdf.Layer, dependency_updates: Dict[str, Callable[[Sdf.Layer, str], str]], relative_path: str
+        self,
+        temp_layer: Sdf.Layer,
+        dependency_graph: _DependencyGraph,
+        dependency_updates: Dict[str, Callable[[Sdf.Layer, str], str]],
+        relative_path: str,
     ) -> str:
         if self._cancel_token:
             return relative_path
 
         fixed_relative_path = relative_path
 
-        # If the asset is on a different drive, the path will be absolute
-        if Path(relative_path).is_absolute():
-            absolute_url = _OmniUrl(relative_path)
-        else:
-            # Try to resolve the relative path in the current layer to find its absolute path
-            absolute_url = _OmniUrl(_OmniUrl(temp_layer.identifier).parent_url) / relative_path
-        absolute_path = self._simplify_relative_path(absolute_url.path)
+        # Try to resolve the relative path in the current layer to find its absolute path
+        absolute_url, absolute_path = _resolve_layer_asset_path(
+            _get_parent_url(temp_layer.identifier), relative_path
+        )
 
         # If we found an existing resolved asset, and it should be updated, update the reference
-        if absolute_url.exists and absolute_path in dependency_updates:
+        if absolute_path in dependency_updates and dependency_graph.exists(absolute_url):
             fixed_relative_path = dependency_updates[absolute_path](temp_layer, relative_path)
 
         return fixed_relative_path
@@ -604,23 +930,10 @@ class PackagingCore:
         Returns:
             A simplified POSIX path.
         """
-        simplified_path = relative_path
-
-        # Remove `./`
-        pattern_single = re.compile("(.*)[^.]\\.(/.*)")
-        match_single = re.search(pattern_single, simplified_path)
-        while match_single:
-            simplified_path = f"{match_single.group(1)}{match_single.group(2)}"
-            match_single = re.search(pattern_single, simplified_path)
-
-        # Remove `../`
-        pattern_double = re.compile("(.*)/(?!\\.\\.).+?/\\.\\.(/.*)")
-        match_double = re.search(pattern_double, simplified_path)
-        while match_double:
-            simplified_path = f"{match_double.group(1)}{match_double.group(2)}"
-            match_double = re.search(pattern_double, simplified_path)
+        return _simplify_path(relative_path)
 
-        return simplified_path
+    def _get_stage_status(self, stage: int, status: str) -> str:
+        return f"({stage}/{self._stage_count}) {status}"
 
     def _packaging_new_stage(self, status: str, total_count: int):
         self._status = status
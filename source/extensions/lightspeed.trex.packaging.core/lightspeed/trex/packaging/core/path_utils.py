@@ -0,0 +1,163 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import functools
+import re
+from pathlib import Path
+from typing import Tuple
+
+from lightspeed.common.constants import REMIX_SUBUSD_RELATIVE_PATH as _REMIX_SUBUSD_RELATIVE_PATH
+from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+
+# Leading `./` and `../` segments pointing outside a directory
+_OUTSIDE_DIRECTORY_PATTERN = re.compile("^((?:./)*../)+")
+
+
+def _simplify_path(path: str) -> str:
+    """
+    Uncached implementation of `simplify_path`.
+    """
+    segments = path.split("/")
+    if len(segments) < 3:
+        return path
+
+    # The first segment is the root (drive, scheme, `.`, `..` or directory) and is never removed.
+    # The last segment is the file or directory name and is always kept as-is.
+    simplified = [segments[0]]
+    for segment in segments[1:-1]:
+        if segment == ".":
+            continue
+        if segment == ".." and len(simplified) > 1 and simplified[-1] not in ("..", ""):
+            simplified.pop()
+            continue
+        simplified.append(segment)
+    simplified.append(segments[-1])
+
+    return "/".join(simplified)
+
+
+@functools.lru_cache(maxsize=None)
+def simplify_path(path: str) -> str:
+    """
+    Remove `./`, as well as `../` and the parent directory from a path to simplify it.
+
+    The path is processed in a single pass over its segments and results are cached.
+
+    Args:
+        path: A POSIX path (/ separator) to simplify
+
+    Returns:
+        A simplified POSIX path.
+    """
+    return _simplify_path(path)
+
+
+@functools.lru_cache(maxsize=None)
+def get_url_path(url: str) -> str:
+    """
+    Get the normalized path of a URL. Results are cached.
+
+    Args:
+        url: The URL to get the path for
+
+    Returns:
+        The POSIX path of the URL
+    """
+    return _OmniUrl(url).path
+
+
+@functools.lru_cache(maxsize=None)
+def get_parent_url(url: str) -> str:
+    """
+    Get the URL of the directory containing the given URL. Results are cached.
+
+    Args:
+        url: The URL to get the parent for
+
+    Returns:
+        The parent URL
+    """
+    return _OmniUrl(url).parent_url
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_layer_asset_path(layer_directory: str, asset_path: str) -> Tuple[str, str]:
+    """
+    Resolve an asset path authored in a layer to an absolute path. Results are cached per layer directory.
+
+    Args:
+        layer_directory: The URL of the directory containing the layer
+        asset_path: The asset path authored in the layer. Can be relative or absolute.
+
+    Returns:
+        A tuple containing the absolute URL of the asset and its simplified absolute path
+    """
+    # If the asset is on a different drive, the path will be absolute
+    if Path(asset_path).is_absolute():
+        absolute_url = _OmniUrl(asset_path)
+    else:
+        absolute_url = _OmniUrl(layer_directory) / asset_path
+    return str(absolute_url), simplify_path(absolute_url.path)
+
+
+@functools.lru_cache(maxsize=None)
+def get_package_relative_path(output_directory: str, parent_relative_path: str, relative_path: str) -> Tuple[str, str]:
+    """
+    Get the asset path to use in a packaged layer so the asset is collected inside the package output directory.
+    Results are cached per parent layer directory.
+
+    Args:
+        output_directory: The package output directory
+        parent_relative_path: The directory of the parent layer, relative to the output directory
+        relative_path: The asset path authored in the parent layer
+
+    Returns:
+        A tuple containing the updated asset path relative to the parent layer and the asset path relative to the
+        output directory
+    """
+    fixed_relative_path = relative_path
+
+    # Make sure absolute paths are converted to relative paths
+    if Path(relative_path).is_absolute():
+        fixed_relative_path = (_OmniUrl(_REMIX_SUBUSD_RELATIVE_PATH) / _OmniUrl(relative_path).name).path
+
+    output_directory_path = _OmniUrl(output_directory).path
+    output_path = simplify_path((_OmniUrl(output_directory) / parent_relative_path / fixed_relative_path).path)
+
+    # If the resulting output path is outside the output directory, the relative path should be modified
+    if not output_path.startswith(output_directory_path):
+        fixed_relative_path = _OUTSIDE_DIRECTORY_PATTERN.sub(_REMIX_SUBUSD_RELATIVE_PATH, fixed_relative_path)
+
+    # Normalize the path
+    fixed_relative_path = _OmniUrl(fixed_relative_path).path
+
+    # Make sure to keep the preceding "./" if it was there in the first place
+    if not fixed_relative_path.startswith("./") and not fixed_relative_path.startswith("../"):
+        fixed_relative_path = f"./{fixed_relative_path}"
+
+    return fixed_relative_path, (_OmniUrl(parent_relative_path) / fixed_relative_path).path
+
+
+def clear_caches():
+    """
+    Clear the cached results. Should be called once packaging is done.
+    """
+    simplify_path.cache_clear()
+    get_url_path.cache_clear()
+    get_parent_url.cache_clear()
+    resolve_layer_asset_path.cache_clear()
+    get_package_relative_path.cache_clear()
@@ -16,5 +16,8 @@
 """
 
 from .e2e.test_packaging import TestPackagingCoreE2E
+from .unit.test_dependencies import TestDependencyGraph
 from .unit.test_items import TestModPackagingSchema
+from .unit.test_manifest import TestPackageManifest
 from .unit.test_packaging import TestPackagingCoreUnit
+from .unit.test_path_utils import TestPackagingPathUtils
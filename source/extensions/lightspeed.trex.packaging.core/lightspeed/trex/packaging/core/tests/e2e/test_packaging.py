@@ -19,10 +19,12 @@ import filecmp
 import tempfile
 from os import walk
 from pathlib import Path
-from unittest.mock import Mock, call
+from typing import List
+from unittest.mock import Mock, call, patch
 
 import omni.kit.test
-from lightspeed.trex.packaging.core import PackagingCore
+from lightspeed.trex.packaging.core import PACKAGE_MANIFEST_NAME, PackageManifest, PackageManifestEntry, PackagingCore
+from omni.kit.usd.collect.omni_client_wrapper import OmniClientWrapper
 from omni.kit.test_suite.helpers import get_test_data_path
 
 
@@ -99,7 +101,60 @@ class TestPackagingCoreE2E(omni.kit.test.AsyncTestCase):
         self.assertEqual(1, completed_mock.call_count)
         self.assertEqual(call([], False), completed_mock.call_args)
 
-    async def __asset_directories_equal(self, expected: Path, actual: Path):
+    async def test_package_incremental_should_only_collect_changed_items(self):
+        packaging_core = PackagingCore()
+
+        output_dir = Path(self.temp_dir.name) / "package"
+        schema = {
+            "context_name": "PackagingE2E",
+            "mod_layer_paths": [
+                Path(get_test_data_path(__name__, "projects/MainProject/mod.usda")),
+                Path(get_test_data_path(__name__, "projects/MainProject/deps/mods/SubProject/mod.usda")),
+            ],
+            "selected_layer_paths": [
+                Path(get_test_data_path(__name__, "projects/MainProject/mod.usda")),
+                Path(get_test_data_path(__name__, "projects/MainProject/mod_capture_baker.usda")),
+                Path(get_test_data_path(__name__, "projects/MainProject/sublayer.usda")),
+            ],
+            "output_directory": output_dir,
+            "mod_name": "Main Project",
+            "mod_version": "1.0.0",
+            "mod_details": "Main Test Notes",
+            "incremental": True,
+        }
+
+        # The first run has no manifest to compare against so everything is collected
+        await packaging_core.package_async_with_exceptions(schema)
+
+        self.assertTrue((output_dir / PACKAGE_MANIFEST_NAME).exists())
+        await self.__asset_directories_equal(
+            get_test_data_path(__name__, "package"), output_dir, ignored_files=[PACKAGE_MANIFEST_NAME]
+        )
+
+        # Add a stale file that should be removed by the next run
+        stale_file = output_dir / "stale.dds"
+        stale_file.write_bytes(b"stale")
+        manifest = PackageManifest.load(output_dir)
+        manifest.files["stale.dds"] = PackageManifestEntry(source="stale.dds")
+        manifest.save(output_dir)
+
+        completed_mock = Mock()
+        _completed_sub = packaging_core.subscribe_packaging_completed(completed_mock)  # noqa F841
+
+        with patch.object(OmniClientWrapper, "copy", wraps=OmniClientWrapper.copy) as copy_mock:
+            await packaging_core.package_async_with_exceptions(schema)
+
+        # Nothing changed so no asset should be copied again
+        self.assertEqual(0, copy_mock.call_count)
+        self.assertFalse(stale_file.exists())
+        await self.__asset_directories_equal(
+            get_test_data_path(__name__, "package"), output_dir, ignored_files=[PACKAGE_MANIFEST_NAME]
+        )
+
+        self.assertEqual(1, completed_mock.call_count)
+        self.assertEqual(call([], False), completed_mock.call_args)
+
+    async def __asset_directories_equal(self, expected: Path, actual: Path, ignored_files: List[str] = None):
         # Make sure all the files in the expected directory are identical in the actual directory
         for dirpath, _, filenames in walk(expected):
             for filename in filenames:
@@ -116,6 +171,8 @@ class TestPackagingCoreE2E(omni.kit.test.AsyncTestCase):
         # Make sure no extra files exist in the actual directory
         for dirpath, _, filenames in walk(actual):
             for filename in filenames:
+                if ignored_files and filename in ignored_files:
+                    continue
                 actual_path = Path(dirpath) / filename
                 expected_path = expected / actual_path.relative_to(actual)
                 self.assertTrue(
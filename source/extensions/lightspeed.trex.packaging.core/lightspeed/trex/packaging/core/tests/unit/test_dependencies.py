@@ -0,0 +1,107 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+from unittest.mock import Mock, call, patch
+
+import omni.client
+import omni.kit.test
+from lightspeed.trex.packaging.core import DependencyGraph, PackagingCore
+from pxr import UsdUtils
+
+
+class TestDependencyGraph(omni.kit.test.AsyncTestCase):
+    async def test_compute_should_compute_all_dependencies_once(self):
+        # Arrange
+        layer_mock = Mock()
+        layer_mock.identifier = "C:/projects/Project/mod.usda"
+        assets = ["C:/projects/Project/textures/a.dds"]
+        unresolved = ["./missing.dds"]
+
+        with patch.object(UsdUtils, "ComputeAllDependencies") as compute_mock:
+            compute_mock.return_value = ([layer_mock], assets, unresolved)
+
+            # Act
+            graph = PackagingCore.compute_dependencies(layer_mock.identifier)
+
+        # Assert
+        self.assertEqual(1, compute_mock.call_count)
+        self.assertEqual(call(layer_mock.identifier), compute_mock.call_args)
+
+        self.assertListEqual([layer_mock], graph.layers)
+        self.assertListEqual(assets, graph.assets)
+        self.assertListEqual(unresolved, graph.unresolved_paths)
+        self.assertListEqual([layer_mock.identifier, *assets], graph.dependencies)
+
+    async def test_exists_known_dependency_should_not_query_file_system(self):
+        # Arrange
+        layer_mock = Mock()
+        layer_mock.identifier = "C:/projects/Project/mod.usda"
+        graph = DependencyGraph([layer_mock], ["C:/projects/Project/textures/a.dds"], [])
+
+        with patch.object(omni.client, "stat") as stat_mock:
+            # Act
+            val_layer = graph.exists("C:/projects/Project/mod.usda")
+            val_asset = graph.exists("C:\\projects\\Project\\textures\\a.dds")
+
+        # Assert
+        self.assertTrue(val_layer)
+        self.assertTrue(val_asset)
+        self.assertEqual(0, stat_mock.call_count)
+
+    async def test_exists_unknown_path_should_query_file_system_once(self):
+        # Arrange
+        graph = DependencyGraph([], [], [])
+
+        with patch.object(omni.client, "stat") as stat_mock:
+            stat_mock.return_value = (omni.client.Result.ERROR_NOT_FOUND, None)
+
+            # Act
+            val_0 = graph.exists("C:/projects/Project/textures/b.dds")
+            val_1 = graph.exists("C:/projects/Project/textures/b.dds")
+
+        # Assert
+        self.assertFalse(val_0)
+        self.assertFalse(val_1)
+        self.assertEqual(1, stat_mock.call_count)
+
+    async def test_get_total_size_async_should_sum_dependency_sizes(self):
+        # Arrange
+        layer_mock = Mock()
+        layer_mock.identifier = "C:/projects/Project/mod.usda"
+        graph = DependencyGraph([layer_mock], ["C:/a.dds", "C:/b.dds"], [])
+
+        entries = {
+            "C:/projects/Project/mod.usda": Mock(size=10),
+            "C:/a.dds": Mock(size=100),
+            "C:/b.dds": Mock(size=1000),
+        }
+
+        async def stat_async(path):
+            return omni.client.Result.OK, entries[path]
+
+        with (
+            patch.object(omni.client, "stat_async") as stat_async_mock,
+            patch.object(omni.client, "stat") as stat_mock,
+        ):
+            stat_async_mock.side_effect = stat_async
+
+            # Act
+            val = await graph.get_total_size_async()
+
+        # Assert
+        self.assertEqual(1110, val)
+        self.assertEqual(3, stat_async_mock.call_count)
+        self.assertEqual(0, stat_mock.call_count)
@@ -124,6 +124,25 @@ class TestModPackagingSchema(omni.kit.test.AsyncTestCase):
         # Assert
         self.assertEqual(expected, val)
 
+    async def test_is_positive_invalid_should_raise_value_error(self):
+        # Arrange
+        with self.assertRaises(ValueError) as cm:
+            # Act
+            ModPackagingSchema.is_positive(0)
+
+        # Assert
+        self.assertEqual("The value must be greater than 0", str(cm.exception))
+
+    async def test_is_positive_valid_should_return_value(self):
+        # Arrange
+        expected = 8
+
+        # Act
+        val = ModPackagingSchema.is_positive(expected)
+
+        # Assert
+        self.assertEqual(expected, val)
+
     async def test_is_valid_version_invalid_should_raise_value_error(self):
         # Arrange
         with self.assertRaises(ValueError) as cm:
@@ -0,0 +1,119 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+from unittest.mock import Mock, PropertyMock, call, patch
+
+import omni.kit.test
+from lightspeed.trex.packaging.core import PACKAGE_MANIFEST_NAME, PackageManifest, PackageManifestEntry
+from omni.flux.utils.common.omni_url import OmniUrl
+
+
+class TestPackageManifest(omni.kit.test.AsyncTestCase):
+    async def test_is_unchanged_same_stat_should_return_true(self):
+        # Arrange
+        entry = PackageManifestEntry(source="C:/textures/a.dds", size=10, mtime=20.0, hash="hash")
+
+        # Act
+        val = entry.is_unchanged("C:/textures/a.dds", 10, 20.0)
+
+        # Assert
+        self.assertTrue(val)
+
+    async def test_is_unchanged_different_stat_should_return_false(self):
+        # Arrange
+        entry = PackageManifestEntry(source="C:/textures/a.dds", size=10, mtime=20.0, hash="hash")
+
+        # Act
+        val_source = entry.is_unchanged("C:/textures/b.dds", 10, 20.0)
+        val_size = entry.is_unchanged("C:/textures/a.dds", 11, 20.0)
+        val_mtime = entry.is_unchanged("C:/textures/a.dds", 10, 21.0)
+        val_missing = entry.is_unchanged("C:/textures/a.dds", None, None)
+
+        # Assert
+        self.assertFalse(val_source)
+        self.assertFalse(val_size)
+        self.assertFalse(val_mtime)
+        self.assertFalse(val_missing)
+
+    async def test_load_no_manifest_should_return_none(self):
+        # Arrange
+        with (
+            patch.object(OmniUrl, "exists", new_callable=PropertyMock) as exists_mock,
+            patch("lightspeed.trex.packaging.core.manifest._read_json_file") as read_mock,
+        ):
+            exists_mock.return_value = False
+
+            # Act
+            val = PackageManifest.load("S:/mods/ProjectMod")
+
+        # Assert
+        self.assertIsNone(val)
+        self.assertEqual(0, read_mock.call_count)
+
+    async def test_load_invalid_manifest_should_return_none(self):
+        # Arrange
+        with (
+            patch.object(OmniUrl, "exists", new_callable=PropertyMock) as exists_mock,
+            patch("lightspeed.trex.packaging.core.manifest._read_json_file") as read_mock,
+        ):
+            exists_mock.return_value = True
+            read_mock.return_value = {"files": {"a.dds": {"size": "invalid"}}}
+
+            # Act
+            val = PackageManifest.load("S:/mods/ProjectMod")
+
+        # Assert
+        self.assertIsNone(val)
+
+    async def test_load_valid_manifest_should_return_manifest(self):
+        # Arrange
+        with (
+            patch.object(OmniUrl, "exists", new_callable=PropertyMock) as exists_mock,
+            patch("lightspeed.trex.packaging.core.manifest._read_json_file") as read_mock,
+        ):
+            exists_mock.return_value = True
+            read_mock.return_value = {
+                "version": 1,
+                "files": {"textures/a.dds": {"source": "C:/textures/a.dds", "size": 10, "mtime": 20.0, "hash": "h"}},
+            }
+
+            # Act
+            val = PackageManifest.load("S:/mods/ProjectMod")
+
+        # Assert
+        self.assertEqual(
+            PackageManifest(
+                files={
+                    "textures/a.dds": PackageManifestEntry(source="C:/textures/a.dds", size=10, mtime=20.0, hash="h")
+                }
+            ),
+            val,
+        )
+        self.assertEqual(call(f"S:/mods/ProjectMod/{PACKAGE_MANIFEST_NAME}"), read_mock.call_args)
+
+    async def test_save_should_write_manifest_in_output_directory(self):
+        # Arrange
+        manifest = PackageManifest(files={"mod.usda": PackageManifestEntry(source="C:/mod.usda", hash="h")})
+
+        with patch("lightspeed.trex.packaging.core.manifest._write_json_file") as write_mock:
+            write_mock.return_value = Mock()
+
+            # Act
+            val = manifest.save("S:/mods/ProjectMod")
+
+        # Assert
+        self.assertEqual(write_mock.return_value, val)
+        self.assertEqual(call(f"S:/mods/ProjectMod/{PACKAGE_MANIFEST_NAME}", manifest.dict()), write_mock.call_args)
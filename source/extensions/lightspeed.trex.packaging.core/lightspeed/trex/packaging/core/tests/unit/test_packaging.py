@@ -16,7 +16,9 @@
 * limitations under the License.
 """
 import asyncio
+import hashlib
 import sys
+import tempfile
 from pathlib import Path
 from unittest.mock import Mock, PropertyMock, call, patch
 
@@ -29,7 +31,8 @@ from lightspeed.layer_manager.core import (
     LSS_LAYER_MOD_NOTES,
     LSS_LAYER_MOD_VERSION,
 )
-from lightspeed.trex.packaging.core import PackagingCore
+from lightspeed.trex.packaging.core import DependencyGraph, PackageManifest, PackageManifestEntry, PackagingCore
+from lightspeed.trex.packaging.core.packaging import _CollectionItem
 from omni.flux.utils.common.omni_url import OmniUrl
 from omni.flux.utils.material_converter.utils import MaterialConverterUtils
 from omni.kit.usd.collect.omni_client_wrapper import OmniClientWrapper
@@ -166,6 +169,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             patch.object(PackagingCore, "_initialize_usd_stage") as init_usd_mock,
             patch.object(PackagingCore, "_filter_sublayers") as filter_mock,
             patch.object(PackagingCore, "_get_redirected_dependencies") as redirect_mock,
+            patch.object(PackagingCore, "compute_dependencies"),
             patch.object(PackagingCore, "_make_temp_layer") as make_temp_mock,
             patch.object(PackagingCore, "_collect") as collect_mock,
             patch.object(PackagingCore, "_update_layer_metadata") as update_metadata_mock,
@@ -235,6 +239,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             patch.object(PackagingCore, "_initialize_usd_stage") as init_usd_mock,
             patch.object(PackagingCore, "_filter_sublayers") as filter_mock,
             patch.object(PackagingCore, "_get_redirected_dependencies") as redirect_mock,
+            patch.object(PackagingCore, "compute_dependencies") as compute_dependencies_mock,
             patch.object(PackagingCore, "_collect") as collect_mock,
             patch.object(PackagingCore, "_packaging_completed") as completed_mock,
             patch.object(PackagingCore, "_update_layer_metadata") as update_metadata_mock,
@@ -285,9 +290,21 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             call(context_name_mock, None, temp_mod_layer_mock, [OmniUrl(root_mod_mock).path.lower()]),
             filter_mock.call_args,
         )
-        self.assertEqual(call(temp_mod_layer_mock, []), redirect_mock.call_args)
+        self.assertEqual(1, compute_dependencies_mock.call_count)
+        self.assertEqual(call(temp_mod_layer_mock.identifier), compute_dependencies_mock.call_args)
+        self.assertEqual(call(compute_dependencies_mock.return_value, []), redirect_mock.call_args)
         self.assertEqual(
-            call(temp_mod_layer_mock, temp_layers_mock, output_directory_mock, redirected_mock), collect_mock.call_args
+            call(
+                temp_mod_layer_mock,
+                compute_dependencies_mock.return_value,
+                temp_layers_mock,
+                output_directory_mock,
+                redirected_mock,
+                model_mock.return_value.max_concurrent_copies,
+                model_mock.return_value.incremental,
+                model_mock.return_value.deduplicate_assets,
+            ),
+            collect_mock.call_args,
         )
         self.assertEqual(
             call(model_mock(), exported_mod_layer_mock, dependencies_mock, True), update_metadata_mock.call_args_list[0]
@@ -388,6 +405,54 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
     async def test_initialize_usd_stage_existing_context_should_return_stage(self):
         await self.__run_initialize_usd(True)
 
+    async def test_make_temp_layer_should_create_in_memory_copy_without_writing_files(self):
+        # Arrange
+        packaging_core = PackagingCore()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            layer_path = OmniUrl(Path(temp_dir) / "sublayer.usda").path
+            layer = Sdf.Layer.CreateNew(layer_path)
+            layer.subLayerPaths.append("./other.usda")
+            layer.Save()
+
+            # Act
+            temp_layer_path = await packaging_core._make_temp_layer(layer_path)  # noqa PLW0212
+
+            # Assert
+            temp_layer = Sdf.Layer.FindOrOpen(temp_layer_path)
+            self.assertIsNotNone(temp_layer)
+            self.assertEqual(layer.ExportToString(), temp_layer.ExportToString())
+            self.assertEqual(layer.ComputeAbsolutePath("./other.usda"), temp_layer.ComputeAbsolutePath("./other.usda"))
+            self.assertListEqual(["sublayer.usda"], sorted(p.name for p in Path(temp_dir).iterdir()))
+            self.assertEqual(layer_path, packaging_core._get_original_path(temp_layer_path))  # noqa PLW0212
+
+            del temp_layer
+
+            # Act
+            await packaging_core._clean_temp_files()  # noqa PLW0212
+
+            # Assert
+            self.assertIsNone(Sdf.Layer.Find(temp_layer_path))
+            self.assertListEqual(["sublayer.usda"], sorted(p.name for p in Path(temp_dir).iterdir()))
+
+    async def test_make_temp_layer_dirty_layer_should_copy_saved_content(self):
+        # Arrange
+        packaging_core = PackagingCore()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            layer_path = OmniUrl(Path(temp_dir) / "mod.usda").path
+            layer = Sdf.Layer.CreateNew(layer_path)
+            layer.Save()
+            layer.subLayerPaths.append("./unsaved.usda")
+
+            # Act
+            temp_layer_path = await packaging_core._make_temp_layer(layer_path)  # noqa PLW0212
+
+            # Assert
+            self.assertListEqual([], list(Sdf.Layer.FindOrOpen(temp_layer_path).subLayerPaths))
+
+            await packaging_core._clean_temp_files()  # noqa PLW0212
+
     async def test_filter_sublayers_cancel_token_was_set_should_quick_return(self):
         # Arrange
         packaging_core = PackagingCore()
@@ -556,6 +621,276 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
     ):
         await self.__run_collect(False, False)
 
+    async def test_create_output_folders_should_create_each_folder_once_parents_first(self):
+        # Arrange
+        packaging_core = PackagingCore()
+
+        output_directory = "S:/mods/ProjectMod"
+        output_paths = [
+            OmniUrl(output_directory) / "assets/textures/a.dds",
+            OmniUrl(output_directory) / "assets/textures/b.dds",
+            OmniUrl(output_directory) / "assets/meshes/c.usd",
+            OmniUrl(output_directory) / "mod.usda",
+        ]
+
+        with patch.object(OmniClientWrapper, "create_folder") as create_folder_mock:
+            # Act
+            await packaging_core._create_output_folders(output_directory, output_paths)  # noqa PLW0212
+
+        # Assert
+        self.assertListEqual(
+            [
+                call("S:/mods/ProjectMod"),
+                call("S:/mods/ProjectMod/assets"),
+                call("S:/mods/ProjectMod/assets/meshes"),
+                call("S:/mods/ProjectMod/assets/textures"),
+            ],
+            create_folder_mock.call_args_list,
+        )
+
+    async def test_copy_assets_should_export_layers_and_limit_concurrent_copies(self):
+        # Arrange
+        packaging_core = PackagingCore()
+
+        max_concurrent_copies = 3
+        asset_count = 20
+
+        layer_mock = Mock()
+        layer_path = "C:/projects/Project/mod_temp.usda"
+        collection_items = [self.__collection_item(layer_path, "mod.usda")]
+        collection_items.extend(
+            self.__collection_item(f"C:/projects/Project/textures/{i}.dds", f"textures/{i}.dds")
+            for i in range(asset_count)
+        )
+        packaging_core._packaging_new_stage("Test", len(collection_items))  # noqa PLW0212
+
+        running = 0
+        max_running = 0
+
+        async def copy(*_):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        with patch.object(OmniClientWrapper, "copy") as copy_mock:
+            copy_mock.side_effect = copy
+
+            # Act
+            errors = await packaging_core._copy_assets(  # noqa PLW0212
+                collection_items, {layer_path: layer_mock}, max_concurrent_copies
+            )
+
+        # Assert
+        self.assertListEqual([], errors)
+        self.assertEqual(asset_count, copy_mock.call_count)
+        self.assertEqual(max_concurrent_copies, max_running)
+        self.assertEqual(len(collection_items), packaging_core.current_count)
+        self.assertEqual(call("S:/mods/ProjectMod/mod.usda"), layer_mock.Export.call_args)
+
+    async def test_copy_assets_cancel_token_set_should_not_copy(self):
+        # Arrange
+        packaging_core = PackagingCore()
+        packaging_core._cancel_token = True  # noqa PLW0212
+
+        layer_mock = Mock()
+        layer_path = "C:/projects/Project/mod_temp.usda"
+        collection_items = [
+            self.__collection_item(layer_path, "mod.usda"),
+            self.__collection_item("C:/textures/a.dds", "textures/a.dds"),
+        ]
+
+        with patch.object(OmniClientWrapper, "copy") as copy_mock:
+            # Act
+            errors = await packaging_core._copy_assets(collection_items, {layer_path: layer_mock}, 4)  # noqa PLW0212
+
+        # Assert
+        self.assertListEqual([], errors)
+        self.assertEqual(0, copy_mock.call_count)
+        self.assertEqual(0, layer_mock.Export.call_count)
+
+    async def test_copy_assets_copy_failure_should_return_errors(self):
+        # Arrange
+        packaging_core = PackagingCore()
+
+        input_path = "C:/textures/a.dds"
+        collection_items = [self.__collection_item(input_path, "textures/a.dds")]
+
+        with patch.object(OmniClientWrapper, "copy") as copy_mock:
+            copy_mock.side_effect = RuntimeError("Test Error")
+
+            # Act
+            errors = await packaging_core._copy_assets(collection_items, {}, 4)  # noqa PLW0212
+
+        # Assert
+        self.assertListEqual([f"Unable to collect the asset {input_path}: Test Error"], errors)
+
+    async def test_copy_assets_incremental_unchanged_should_skip_copy_and_keep_manifest_entry(self):
+        # Arrange
+        packaging_core = PackagingCore()
+
+        item = self.__collection_item("C:/textures/a.dds", "textures/a.dds")
+        previous_entry = PackageManifestEntry(source=item.source_path, size=10, mtime=20.0, hash="hash")
+        previous_manifest = PackageManifest(files={item.relative_path: previous_entry})
+        manifest = PackageManifest()
+
+        with (
+            patch.object(OmniClientWrapper, "copy") as copy_mock,
+            patch("lightspeed.trex.packaging.core.packaging._get_file_stat") as stat_mock,
+            patch("lightspeed.trex.packaging.core.packaging._hash_file") as hash_mock,
+            patch.object(OmniUrl, "exists", new_callable=PropertyMock) as exists_mock,
+        ):
+            stat_mock.return_value = (10, 20.0)
+            exists_mock.return_value = True
+
+            # Act
+            errors = await packaging_core._copy_assets(  # noqa PLW0212
+                [item], {}, 4, previous_manifest, manifest
+            )
+
+        # Assert
+        self.assertListEqual([], errors)
+        self.assertEqual(0, copy_mock.call_count)
+        self.assertEqual(0, hash_mock.call_count)
+        self.assertDictEqual({item.relative_path: previous_entry}, manifest.files)
+
+    async def test_copy_assets_incremental_touched_same_content_should_skip_copy_and_update_manifest_entry(self):
+        await self.__run_copy_assets_incremental("hash", 30.0, True, False)
+
+    async def test_copy_assets_incremental_changed_content_should_copy_and_update_manifest_entry(self):
+        await self.__run_copy_assets_incremental("new_hash", 30.0, True, True)
+
+    async def test_copy_assets_incremental_unchanged_missing_output_should_copy_and_update_manifest_entry(self):
+        await self.__run_copy_assets_incremental("hash", 20.0, False, True)
+
+    async def test_copy_assets_incremental_same_content_missing_output_should_copy_and_update_manifest_entry(self):
+        await self.__run_copy_assets_incremental("hash", 30.0, False, True)
+
+    async def test_copy_assets_incremental_unchanged_layer_should_not_export(self):
+        await self.__run_export_layer_incremental(False)
+
+    async def test_copy_assets_incremental_changed_layer_should_export(self):
+        await self.__run_export_layer_incremental(True)
+
+    async def test_delete_stale_files_should_delete_every_file(self):
+        # Arrange
+        packaging_core = PackagingCore()
+        packaging_core._packaging_new_stage("Test", 2)  # noqa PLW0212
+
+        with patch.object(OmniClientWrapper, "delete") as delete_mock:
+            # Act
+            await packaging_core._delete_stale_files(  # noqa PLW0212
+                "S:/mods/ProjectMod", ["assets/cube.usda", "textures/a.dds"]
+            )
+
+        # Assert
+        self.assertListEqual(
+            [call("S:/mods/ProjectMod/assets/cube.usda"), call("S:/mods/ProjectMod/textures/a.dds")],
+            delete_mock.call_args_list,
+        )
+        self.assertEqual(2, packaging_core.current_count)
+
+    async def test_deduplicate_assets_should_only_collect_one_copy_and_redirect_layers(self):
+        # Arrange
+        packaging_core = PackagingCore()
+        # The deduplication adds a packaging stage
+        packaging_core._stage_count = 8  # noqa PLW0212
+
+        layer_path = "C:/projects/Project/mod_temp.usda"
+        sub_layer_path = "C:/projects/Project/assets/sub_temp.usda"
+        packaging_core._collected_dependencies = {  # noqa PLW0212
+            layer_path: "./mod_temp.usda",
+            sub_layer_path: "./assets/sub_temp.usda",
+            "C:/textures/a.dds": "./textures/a.dds",
+            "C:/other/textures/a.dds": "./SubUSDs/textures/a.dds",
+            "C:/textures/b.dds": "./textures/b.dds",
+            "C:/textures/c.dds": "./textures/c.dds",
+        }
+        sizes = {
+            "C:/textures/a.dds": 10,
+            "C:/other/textures/a.dds": 10,
+            "C:/textures/b.dds": 10,
+            "C:/textures/c.dds": 20,
+        }
+        hashes = {"C:/textures/a.dds": "a", "C:/other/textures/a.dds": "a", "C:/textures/b.dds": "b"}
+
+        dependency_graph = DependencyGraph([], list(sizes.keys()), [])
+
+        layer_mock = Mock()
+        sub_layer_mock = Mock()
+
+        with (
+            patch("lightspeed.trex.packaging.core.packaging._hash_file") as hash_mock,
+            patch.object(UsdUtils, "ModifyAssetPaths") as modify_mock,
+            patch.object(DependencyGraph, "stat_async"),
+            patch.object(DependencyGraph, "stat") as stat_mock,
+        ):
+            hash_mock.side_effect = hashes.get
+            stat_mock.side_effect = lambda path: Mock(size=sizes[path])
+
+            # Act
+            await packaging_core._deduplicate_assets(  # noqa PLW0212
+                dependency_graph, {layer_path: layer_mock, sub_layer_path: sub_layer_mock}, 4
+            )
+
+        # Assert
+        self.assertEqual(3, hash_mock.call_count)
+        self.assertDictEqual(
+            {
+                layer_path: "./mod_temp.usda",
+                sub_layer_path: "./assets/sub_temp.usda",
+                "C:/other/textures/a.dds": "./SubUSDs/textures/a.dds",
+                "C:/textures/b.dds": "./textures/b.dds",
+                "C:/textures/c.dds": "./textures/c.dds",
+            },
+            packaging_core._collected_dependencies,  # noqa PLW0212
+        )
+        self.assertEqual(1, packaging_core.deduplicated_count)
+        self.assertEqual(10, packaging_core.deduplicated_size)
+        self.assertEqual(4, packaging_core.current_count)
+        self.assertEqual("(6/8) Deduplicating assets...", packaging_core.status)
+
+        self.assertEqual(2, modify_mock.call_count)
+        self.assertEqual(layer_mock, modify_mock.call_args_list[0].args[0])
+        self.assertEqual(sub_layer_mock, modify_mock.call_args_list[1].args[0])
+
+        redirect_root = modify_mock.call_args_list[0].args[1]
+        redirect_sub = modify_mock.call_args_list[1].args[1]
+        self.assertEqual("./SubUSDs/textures/a.dds", redirect_root("./textures/a.dds"))
+        self.assertEqual("./textures/b.dds", redirect_root("./textures/b.dds"))
+        self.assertEqual("../SubUSDs/textures/a.dds", redirect_sub("../textures/a.dds"))
+        self.assertEqual("C:/textures/a.dds", redirect_sub("C:/textures/a.dds"))
+
+    async def test_deduplicate_assets_no_duplicates_should_not_hash_or_modify_layers(self):
+        # Arrange
+        packaging_core = PackagingCore()
+
+        packaging_core._collected_dependencies = {  # noqa PLW0212
+            "C:/textures/a.dds": "./textures/a.dds",
+            "C:/textures/b.dds": "./textures/b.dds",
+        }
+        sizes = {"C:/textures/a.dds": 10, "C:/textures/b.dds": 20}
+        dependency_graph = DependencyGraph([], list(sizes.keys()), [])
+
+        with (
+            patch("lightspeed.trex.packaging.core.packaging._hash_file") as hash_mock,
+            patch.object(UsdUtils, "ModifyAssetPaths") as modify_mock,
+            patch.object(DependencyGraph, "stat_async"),
+            patch.object(DependencyGraph, "stat") as stat_mock,
+        ):
+            stat_mock.side_effect = lambda path: Mock(size=sizes[path])
+
+            # Act
+            await packaging_core._deduplicate_assets(dependency_graph, {}, 4)  # noqa PLW0212
+
+        # Assert
+        self.assertEqual(0, hash_mock.call_count)
+        self.assertEqual(0, modify_mock.call_count)
+        self.assertEqual(2, len(packaging_core._collected_dependencies))  # noqa PLW0212
+        self.assertEqual(0, packaging_core.deduplicated_count)
+        self.assertEqual(2, packaging_core.current_count)
+
     async def test_update_layer_metadata_update_dependencies_should_update_metadata(self):
         await self.__run_update_layer_metadata(True, False)
 
@@ -691,6 +1026,80 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
         self.assertEqual(total_count, packaging_core._total_count)  # noqa PLW0212
         self.assertEqual(0, packaging_core._current_count)  # noqa PLW0212
 
+    def __collection_item(self, input_path: str, relative_path: str) -> _CollectionItem:
+        return _CollectionItem(input_path, input_path, OmniUrl("S:/mods/ProjectMod") / relative_path, relative_path)
+
+    async def __run_copy_assets_incremental(self, file_hash: str, mtime: float, output_exists: bool, should_copy: bool):
+        # Arrange
+        packaging_core = PackagingCore()
+
+        item = self.__collection_item("C:/textures/a.dds", "textures/a.dds")
+        previous_entry = PackageManifestEntry(source=item.source_path, size=10, mtime=20.0, hash="hash")
+        previous_manifest = PackageManifest(files={item.relative_path: previous_entry})
+        manifest = PackageManifest()
+
+        with (
+            patch.object(OmniClientWrapper, "copy") as copy_mock,
+            patch("lightspeed.trex.packaging.core.packaging._get_file_stat") as stat_mock,
+            patch("lightspeed.trex.packaging.core.packaging._hash_file") as hash_mock,
+            patch.object(OmniUrl, "exists", new_callable=PropertyMock) as exists_mock,
+        ):
+            stat_mock.return_value = (10, mtime)
+            hash_mock.return_value = file_hash
+            exists_mock.return_value = output_exists
+
+            # Act
+            errors = await packaging_core._copy_assets(  # noqa PLW0212
+                [item], {}, 4, previous_manifest, manifest
+            )
+
+        # Assert
+        self.assertListEqual([], errors)
+        self.assertEqual(1, hash_mock.call_count)
+        self.assertEqual(call(item.input_path), hash_mock.call_args)
+        self.assertEqual(1 if should_copy else 0, copy_mock.call_count)
+        if should_copy:
+            self.assertEqual(call(item.input_path, str(item.output_path)), copy_mock.call_args)
+        self.assertDictEqual(
+            {item.relative_path: PackageManifestEntry(source=item.source_path, size=10, mtime=mtime, hash=file_hash)},
+            manifest.files,
+        )
+
+    async def __run_export_layer_incremental(self, is_changed: bool):
+        # Arrange
+        packaging_core = PackagingCore()
+
+        layer_content = "#usda 1.0"
+        layer_hash = hashlib.md5(layer_content.encode("utf-8")).hexdigest()
+
+        layer_mock = Mock()
+        layer_mock.ExportToString.return_value = layer_content
+
+        item = self.__collection_item("C:/projects/Project/mod_temp.usda", "mod.usda")
+        previous_manifest = PackageManifest(
+            files={
+                item.relative_path: PackageManifestEntry(
+                    source=item.source_path, hash="old_hash" if is_changed else layer_hash
+                )
+            }
+        )
+        manifest = PackageManifest()
+
+        with patch.object(OmniUrl, "exists", new_callable=PropertyMock) as exists_mock:
+            exists_mock.return_value = True
+
+            # Act
+            errors = await packaging_core._copy_assets(  # noqa PLW0212
+                [item], {item.input_path: layer_mock}, 4, previous_manifest, manifest
+            )
+
+        # Assert
+        self.assertListEqual([], errors)
+        self.assertEqual(1 if is_changed else 0, layer_mock.Export.call_count)
+        self.assertDictEqual(
+            {item.relative_path: PackageManifestEntry(source=item.source_path, hash=layer_hash)}, manifest.files
+        )
+
     async def __run_initialize_usd(self, existing_context: bool):
         # Arrange
         packaging_core = PackagingCore()
@@ -787,12 +1196,13 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
         relative_path = absolute_path if is_absolute else "./assets/test.usd"
         modified_path = "C:/modified_path"
 
-        with patch.object(OmniUrl, "exists", new_callable=PropertyMock) as exists_mock:
+        with patch.object(DependencyGraph, "exists") as exists_mock:
             exists_mock.return_value = dependency_exists
 
             # Act
             val = packaging_core._modify_asset_paths(  # noqa PLW0212
                 layer_mock,
+                DependencyGraph([], [], []),
                 {absolute_path if dependency_update else "C:/absolute_path": lambda *_: modified_path},
                 relative_path,
             )
@@ -806,10 +1216,6 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
         if should_cancel:
             packaging_core._cancel_token = True  # noqa PLW0212
 
-        root_layer_path_mock = Mock()
-        root_layer_mock = Mock()
-        root_layer_mock.identifier = root_layer_path_mock
-
         external_mod = "C:/game/rtx-remix/mods/ExternalMod_1/mod.usda"
         external_layer = "D:/projects/Project_0/deps/mods/ExternalMod_1/mod.usda"
         external_asset = "C:/game/rtx-remix/mods/ExternalMod_1/assets/mesh_1.usd"
@@ -823,13 +1229,10 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
         asset_mocks = ["D:/projects/Project_0/assets/mesh_0.usd", external_asset]
         external_mod_paths = [Path("C:/game/rtx-remix/mods/ExternalMod_0/mod.usda"), Path(external_mod)]
 
-        with patch.object(UsdUtils, "ComputeAllDependencies") as compute_dependencies_mock:
-            compute_dependencies_mock.return_value = layer_mocks, asset_mocks, []
-
-            # Act
-            mod_dependencies, redirected_dependencies = packaging_core._get_redirected_dependencies(  # noqa PLW0212
-                root_layer_mock, external_mod_paths
-            )
+        # Act
+        mod_dependencies, redirected_dependencies = packaging_core._get_redirected_dependencies(  # noqa PLW0212
+            DependencyGraph(layer_mocks, asset_mocks, []), external_mod_paths
+        )
 
         # Assert
         self.assertSetEqual(set() if should_cancel else {external_mod}, mod_dependencies)
@@ -880,7 +1283,6 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             patch.object(PackagingCore, "_get_original_path") as get_original_mock,
             patch.object(PackagingCore, "_make_temp_layer") as make_temp_mock,
             patch.object(Sdf.Layer, "FindOrOpen") as find_open_mock,
-            patch.object(UsdUtils, "ComputeAllDependencies") as compute_dependencies_mock,
             patch.object(UsdUtils, "ModifyAssetPaths") as modify_assets_mock,
             patch.object(MaterialConverterUtils, "get_material_library_shader_urls") as get_shaders_mock,
             patch.object(OmniClientWrapper, "create_folder") as create_folder_mock,
@@ -888,7 +1290,6 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             patch.object(OmniClientWrapper, "copy") as copy_mock,
             patch.object(OmniUrl, "exists", new_callable=PropertyMock) as exists_mock,
         ):
-            compute_dependencies_mock.return_value = (layers_mock, assets_mock, unresolved_mock)
             get_shaders_mock.return_value = [OmniUrl(asset_2_mock)]
 
             modify_assets_mock.side_effect = lambda *_: packaging_core._collected_dependencies.update(  # noqa PLW0212
@@ -910,7 +1311,7 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             ]
 
             find_open_mock.side_effect = [layer_0_temp_mock, layer_1_temp_mock]
-            exists_mock.side_effect = [True, False, True, True, False]
+            exists_mock.side_effect = [True]
 
             if sys.version_info.minor > 7:
                 make_temp_mock.side_effect = layer_1_temp_path_mock
@@ -930,7 +1331,11 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
 
             # Act
             errors = await packaging_core._collect(  # noqa PLW0212
-                root_layer_mock, existing_temps_mock, output_directory_mock, redirected_dependencies_mock
+                root_layer_mock,
+                DependencyGraph(layers_mock, assets_mock, unresolved_mock),
+                existing_temps_mock,
+                output_directory_mock,
+                redirected_dependencies_mock,
             )
 
         # Assert
@@ -943,10 +1348,6 @@ class TestPackagingCoreUnit(omni.kit.test.AsyncTestCase):
             errors,
         )
 
-        self.assertEqual(0 if should_cancel else 1, compute_dependencies_mock.call_count)
-        if not should_cancel:
-            self.assertEqual(call(root_layer_mock.identifier), compute_dependencies_mock.call_args)
-
         if should_cancel or has_unresolved_assets:
             self.assertEqual(0, get_shaders_mock.call_count)
             self.assertEqual(0, modify_assets_mock.call_count)
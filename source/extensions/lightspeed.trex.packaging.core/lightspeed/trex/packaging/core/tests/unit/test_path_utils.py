@@ -0,0 +1,147 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+import random
+import re
+import time
+
+import carb
+import omni.kit.test
+from lightspeed.trex.packaging.core import path_utils
+
+
+def _legacy_simplify_path(path: str) -> str:
+    """
+    The regex-based implementation `simplify_path` replaced. Used as a reference for the benchmark.
+    """
+    simplified_path = path
+
+    pattern_single = re.compile("(.*)[^.]\\.(/.*)")
+    match_single = re.search(pattern_single, simplified_path)
+    while match_single:
+        simplified_path = f"{match_single.group(1)}{match_single.group(2)}"
+        match_single = re.search(pattern_single, simplified_path)
+
+    pattern_double = re.compile("(.*)/(?!\\.\\.).+?/\\.\\.(/.*)")
+    match_double = re.search(pattern_double, simplified_path)
+    while match_double:
+        simplified_path = f"{match_double.group(1)}{match_double.group(2)}"
+        match_double = re.search(pattern_double, simplified_path)
+
+    return simplified_path
+
+
+def _generate_paths(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    roots = ["C:", "S:", ".", ".."]
+    segments = ["assets", "textures", "meshes", "SubUSDs", "deps", "mods", "captures", "..", "."]
+    paths = []
+    for index in range(count):
+        parts = [rng.choice(roots)]
+        parts.extend(rng.choice(segments) for _ in range(rng.randint(2, 16)))
+        parts.append(f"texture_{index}.a.rtex.dds")
+        paths.append("/".join(parts))
+    return paths
+
+
+class TestPackagingPathUtils(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        path_utils.clear_caches()
+
+    async def tearDown(self):
+        path_utils.clear_caches()
+
+    async def test_simplify_path_should_remove_relative_segments(self):
+        # Arrange
+        inputs = {
+            "../../../../test/path": "../../../../test/path",
+            "C:/parent/parent2/./parent3/../../test/path": "C:/parent/test/path",
+            "C:/parent/parent2/parent3/../../../../../../test/path": "C:/../../../test/path",
+            "./././././single_dir": "./single_dir",
+            "C:/test/path": "C:/test/path",
+            "omniverse://server/project/assets/../textures/a.dds": "omniverse://server/project/textures/a.dds",
+            "C:/project/assets.v2/../mod.usda": "C:/project/mod.usda",
+        }
+
+        for input_val, expected_val in inputs.items():
+            # Act
+            val = path_utils.simplify_path(input_val)
+
+            # Assert
+            self.assertEqual(expected_val, val)
+
+    async def test_simplify_path_should_match_legacy_implementation(self):
+        # Arrange
+        paths = _generate_paths(5000)
+
+        # Act
+        vals = [path_utils.simplify_path(path) for path in paths]
+
+        # Assert
+        self.assertListEqual([_legacy_simplify_path(path) for path in paths], vals)
+
+    async def test_get_package_relative_path_should_redirect_inside_output_directory(self):
+        # Arrange
+        output_directory = "S:/output_directory"
+
+        # Act
+        val_inside = path_utils.get_package_relative_path(output_directory, "", "./assets/cube.usda")
+        val_absolute = path_utils.get_package_relative_path(output_directory, "", "C:/assets/sphere.usda")
+        val_outside = path_utils.get_package_relative_path(output_directory, "", "../../../outside/pyramid.usda")
+        val_parent = path_utils.get_package_relative_path(output_directory, "./assets", "./textures/a.dds")
+
+        # Assert
+        self.assertEqual(("./assets/cube.usda", "assets/cube.usda"), val_inside)
+        self.assertEqual(("./SubUSDs/sphere.usda", "SubUSDs/sphere.usda"), val_absolute)
+        self.assertEqual(("./SubUSDs/outside/pyramid.usda", "SubUSDs/outside/pyramid.usda"), val_outside)
+        self.assertEqual(("./textures/a.dds", "assets/textures/a.dds"), val_parent)
+
+    async def test_resolve_layer_asset_path_should_return_absolute_url_and_simplified_path(self):
+        # Act
+        val_relative = path_utils.resolve_layer_asset_path("C:/project/layers", "../assets/./cube.usda")
+        val_absolute = path_utils.resolve_layer_asset_path("C:/project/layers", "D:/assets/sphere.usda")
+
+        # Assert
+        self.assertEqual(("C:/project/layers/../assets/cube.usda", "C:/project/assets/cube.usda"), val_relative)
+        self.assertEqual(("D:/assets/sphere.usda", "D:/assets/sphere.usda"), val_absolute)
+
+    async def test_simplify_path_benchmark_should_match_legacy_implementation(self):
+        # Arrange
+        paths = _generate_paths(1000, seed=1)
+        # Asset paths are resolved for every layer referencing them, so the same paths are normalized many times
+        repeated_paths = paths * 5
+
+        # Act
+        start = time.perf_counter()
+        legacy_vals = [_legacy_simplify_path(path) for path in repeated_paths]
+        legacy_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        uncached_vals = [path_utils._simplify_path(path) for path in repeated_paths]  # noqa PLW0212
+        uncached_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cached_vals = [path_utils.simplify_path(path) for path in repeated_paths]
+        cached_duration = time.perf_counter() - start
+
+        carb.log_info(
+            f"simplify_path benchmark ({len(repeated_paths)} paths): legacy={legacy_duration:.4f}s, "
+            f"linear={uncached_duration:.4f}s, memoized={cached_duration:.4f}s"
+        )
+
+        # Assert
+        self.assertListEqual(legacy_vals, uncached_vals)
+        self.assertListEqual(legacy_vals, cached_vals)
@@ -0,0 +1,186 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import bisect
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+from lightspeed.common import constants
+from pxr import Sdf, Usd
+
+_PRIM_PREDICATE = Usd.PrimIsActive & Usd.PrimIsDefined & Usd.PrimIsLoaded
+
+
+class MeshInstanceIndex:
+    def __init__(self):
+        """
+        Index of the prims with a hash in their name, by hash.
+
+        The index is built once for a stage, and is then updated from the resynced paths of the stage. Only the
+        sub-hierarchies that were resynced are traversed again, so a query only costs the size of the selection.
+        """
+        self._regex_hash = re.compile(constants.REGEX_HASH)
+        self._regex_light = re.compile(constants.REGEX_LIGHT_PATH)
+        self._stage: Optional[Usd.Stage] = None
+        self._built = False
+        self._pending_resyncs: Set[Sdf.Path] = set()
+        self._paths_by_hash: Dict[str, Set[str]] = {}
+        self._hash_by_path: Dict[str, str] = {}
+        self._sorted_paths: List[str] = []  # used to find the indexed prims of a sub-hierarchy
+        self._references_by_path: Dict[str, List[Sdf.Path]] = {}
+
+    @property
+    def stage(self) -> Optional[Usd.Stage]:
+        """The indexed stage"""
+        return self._stage
+
+    def reset(self):
+        """
+        Clear the index. It will be built again the next time it is queried.
+        """
+        self._stage = None
+        self._built = False
+        self._pending_resyncs.clear()
+        self._paths_by_hash.clear()
+        self._hash_by_path.clear()
+        self._sorted_paths.clear()
+        self._references_by_path.clear()
+
+    def on_resynced_paths(self, paths: Iterable[Sdf.Path]):
+        """
+        Update the index after the given paths were resynced on the indexed stage.
+
+        The update is deferred to the next query, so a burst of stage changes doesn't cost anything.
+
+        Args:
+            paths: the resynced paths of a `Usd.Notice.ObjectsChanged` notice
+        """
+        if not self._built:
+            return
+        for path in paths:
+            if path.IsPropertyPath():
+                continue
+            if path.IsAbsoluteRootPath():
+                self.reset()
+                return
+            self._pending_resyncs.add(path)
+
+    def get_instances_by_mesh(self, stage: Usd.Stage, hashes: Iterable[str]) -> Dict[Sdf.Path, List[Usd.Prim]]:
+        """
+        Get the prims that reference the meshes or lights of the given hashes
+
+        Args:
+            stage: the stage to query. The index is built again if the stage is not the indexed stage.
+            hashes: the hashes of the meshes or lights
+
+        Returns:
+            The prims that reference a mesh or a light, by mesh or light path
+        """
+        self._update(stage)
+
+        result = {}
+        for hash_ in hashes:
+            for path in self._paths_by_hash.get(hash_, ()):
+                prim = stage.GetPrimAtPath(path)
+                if not prim.IsValid():
+                    continue
+                refs = self._get_references(path, prim)
+                if not refs:
+                    continue
+                # only lights are their own instances
+                if refs[0] == prim.GetPath() and not self._regex_light.match(path):
+                    continue
+                instances = result.setdefault(refs[0], [])
+                if prim not in instances:
+                    instances.append(prim)
+        return result
+
+    def _update(self, stage: Usd.Stage):
+        if stage != self._stage:
+            self.reset()
+            self._stage = stage
+        if not self._built:
+            self._add_hierarchy(Usd.PrimRange.Stage(stage, _PRIM_PREDICATE))
+            self._built = True
+            return
+        if not self._pending_resyncs:
+            return
+        resynced_paths = sorted(self._pending_resyncs, key=str)
+        self._pending_resyncs.clear()
+        # only keep the top-most resynced paths: their sub-hierarchies are resynced too
+        root_paths = []
+        for path in resynced_paths:
+            if root_paths and path.HasPrefix(root_paths[-1]):
+                continue
+            root_paths.append(path)
+        for path in root_paths:
+            self._remove_hierarchy(str(path))
+            prim = stage.GetPrimAtPath(path)
+            if self._is_traversable(prim):
+                self._add_hierarchy(Usd.PrimRange(prim, _PRIM_PREDICATE))
+
+    @staticmethod
+    def _is_traversable(prim: Usd.Prim) -> bool:
+        # a stage traversal doesn't go under a prim that is inactive, undefined or unloaded
+        while prim and prim.IsValid() and not prim.IsPseudoRoot():
+            if not prim.IsActive() or not prim.IsDefined() or not prim.IsLoaded():
+                return False
+            prim = prim.GetParent()
+        return bool(prim)
+
+    def _add_hierarchy(self, prims: Iterable[Usd.Prim]):
+        added_paths = []
+        for prim in prims:
+            match = self._regex_hash.match(prim.GetName())
+            if not match:
+                continue
+            path = str(prim.GetPath())
+            hash_ = match.groups()[2]
+            self._hash_by_path[path] = hash_
+            self._paths_by_hash.setdefault(hash_, set()).add(path)
+            added_paths.append(path)
+        if added_paths:
+            # sorting 2 sorted runs is linear
+            self._sorted_paths = sorted(self._sorted_paths + sorted(added_paths))
+
+    def _remove_hierarchy(self, path: str):
+        # "/" sorts before any character allowed in a prim name, so the descendants of a path are sorted right after it
+        start = bisect.bisect_left(self._sorted_paths, path)
+        end = bisect.bisect_left(self._sorted_paths, f"{path}0", lo=start)  # "0" is the character after "/"
+        for indexed_path in self._sorted_paths[start:end]:
+            hash_ = self._hash_by_path.pop(indexed_path)
+            paths = self._paths_by_hash[hash_]
+            paths.discard(indexed_path)
+            if not paths:
+                del self._paths_by_hash[hash_]
+            self._references_by_path.pop(indexed_path, None)
+        del self._sorted_paths[start:end]
+
+    def _get_references(self, path: str, prim: Usd.Prim) -> List[Sdf.Path]:
+        if path in self._references_by_path:
+            return self._references_by_path[path]
+        if self._regex_light.match(path):
+            refs = [prim.GetPath()]
+        else:
+            refs = [
+                item.primPath
+                for prim_spec in prim.GetPrimStack()
+                for item in prim_spec.referenceList.prependedItems
+                if item.primPath
+            ]
+        self._references_by_path[path] = refs
+        return refs
@@ -53,8 +53,11 @@ class USDListener:
             if stage != model.stage:
                 continue
 
+            resynced_paths = notice.GetResyncedPaths()
+            model.on_resynced_paths(resynced_paths)
+
             should_refresh = False
-            for resynced_path in notice.GetResyncedPaths():
+            for resynced_path in resynced_paths:
                 if "." in str(resynced_path):  # an attribute
                     continue
                 match = self.__regex_hash.match(str(resynced_path))
@@ -96,8 +99,10 @@ class USDListener:
         """
         if model in self.__models:
             self.__models.remove(model)
-        if not any(f for f in self.__models if f.stage == model.stage):
-            self._disable_listener(model.stage)
+        # the stage of the model could have changed since it was added
+        for stage in list(self._listeners.keys()):
+            if not any(f for f in self.__models if f.stage == stage):
+                self._disable_listener(stage)
 
     def destroy(self):
         self.__models = None
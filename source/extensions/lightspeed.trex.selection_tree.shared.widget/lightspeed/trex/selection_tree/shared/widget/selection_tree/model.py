@@ -15,9 +15,6 @@
 * limitations under the License.
 """
 
-import concurrent.futures
-import math
-import multiprocessing
 import re
 import typing
 from contextlib import contextmanager
@@ -34,6 +31,7 @@ from omni.flux.utils.common.decorators import ignore_function_decorator as _igno
 from omni.kit.usd.layers import LayerEventType, get_layer_event_payload, get_layers
 from pxr import Usd, UsdGeom, UsdLux
 
+from .instance_index import MeshInstanceIndex as _MeshInstanceIndex
 from .listener import USDListener as _USDListener
 
 if typing.TYPE_CHECKING:
@@ -452,6 +450,7 @@ class ListModel(ui.AbstractItemModel):
             "_stage_event": None,
             "_layer_event": None,
             "_usd_listener": None,
+            "_instance_index": None,
         }
         for attr, value in self.default_attr.items():
             setattr(self, attr, value)
@@ -467,6 +466,8 @@ class ListModel(ui.AbstractItemModel):
         self._stage_event = None
         self._layer_event = None
         self._usd_listener = _USDListener()
+        self._listening = False
+        self._instance_index = _MeshInstanceIndex()
 
     def set_ignore_refresh(self, value):
         self._ignore_refresh = value
@@ -504,6 +505,7 @@ class ListModel(ui.AbstractItemModel):
     def enable_listeners(self, value):
         if value:
             self._usd_listener.add_model(self)
+            self._listening = True
             self._stage_event = self._context.get_stage_event_stream().create_subscription_to_pop(
                 self._on_stage_event, name="StageEvent"
             )
@@ -511,6 +513,7 @@ class ListModel(ui.AbstractItemModel):
             self._layer_event = event_stream.create_subscription_to_pop(self._on_layer_event, name="layer events")
         else:
             self._usd_listener.remove_model(self)
+            self._listening = False
             self._stage_event = None
 
     def _on_layer_event(self, event: carb.events.IEvent):
@@ -524,7 +527,22 @@ class ListModel(ui.AbstractItemModel):
             if self._ignore_refresh:
                 self._ignore_refresh = False
 
+    def on_resynced_paths(self, paths: List["Sdf.Path"]):
+        """
+        Called by the USD listener when paths of the stage were resynced
+
+        Args:
+            paths: the resynced paths
+        """
+        self._instance_index.on_resynced_paths(paths)
+
     def _on_stage_event(self, event):
+        if event.type in [int(omni.usd.StageEventType.OPENED), int(omni.usd.StageEventType.CLOSED)]:
+            self._instance_index.reset()
+            # listen to the new stage
+            if self._listening and self.stage:
+                self._usd_listener.remove_model(self)
+                self._usd_listener.add_model(self)
         if event.type == int(omni.usd.StageEventType.SELECTION_CHANGED):
             self.refresh()
             if self._ignore_refresh:
@@ -544,26 +562,6 @@ class ListModel(ui.AbstractItemModel):
             return None
         return str(children[0].path)
 
-    @staticmethod
-    def __get_reference_prims(prims) -> Dict["Usd.Prim", List["Sdf.Path"]]:
-        prim_paths = {}
-        regex_pattern = re.compile(constants.REGEX_LIGHT_PATH)
-        for prim in prims:
-            if regex_pattern.match(str(prim.GetPath())):
-                prim_paths[prim] = [prim.GetPath()]
-            else:
-                for prim_spec in prim.GetPrimStack():
-                    items = prim_spec.referenceList.prependedItems
-                    for item in items:
-                        if not item.primPath:
-                            continue
-                        if prim in prim_paths:
-                            prim_paths[prim].append(item.primPath)
-                        else:
-                            prim_paths[prim] = [item.primPath]
-
-        return prim_paths
-
     def __get_model_from_prototype_path(self, path):
         if not path.startswith(constants.MESH_PATH) and not path.startswith(constants.LIGHT_PATH):
             return None
@@ -586,8 +584,6 @@ class ListModel(ui.AbstractItemModel):
         if not self.stage:
             return {}
 
-        iterator = list(iter(Usd.PrimRange.Stage(self.stage, Usd.PrimIsActive & Usd.PrimIsDefined & Usd.PrimIsLoaded)))
-
         # extract hashes from paths
         hashes = set()
         regex_inst_pattern = re.compile(constants.REGEX_HASH)
@@ -597,41 +593,10 @@ class ListModel(ui.AbstractItemModel):
                 continue
             hashes.add(match.groups()[2])
 
-        result = {}
-        futures = []
-        cpu_count = multiprocessing.cpu_count()
-        # we can use threadpool here because we are just reading the stage
-        # Use exact number of cpu count as max worker: this is faster that letting Python doing it
-        # Divide the iter by group that fit the  max worker
-        with concurrent.futures.ThreadPoolExecutor(max_workers=cpu_count) as executor:
-            to_send = []
-            size_iter = len(iterator)
-            group_size = math.ceil(size_iter / cpu_count)
-            for i, prim in enumerate(iterator):
-                match = regex_inst_pattern.match(prim.GetName())
-                if not match or match.groups()[2] not in hashes:
-                    if i == size_iter - 1 and to_send:
-                        futures.append(executor.submit(self.__get_reference_prims, to_send))
-                    continue
-                if i == size_iter - 1 and to_send:
-                    futures.append(executor.submit(self.__get_reference_prims, to_send))
-                    continue
-                to_send.append(prim)
-                if len(to_send) == group_size:
-                    futures.append(executor.submit(self.__get_reference_prims, to_send))
-                    to_send = []
-
-            regex_pattern = re.compile(constants.REGEX_LIGHT_PATH)
-            for future in concurrent.futures.as_completed(futures):
-                refs = future.result()
-                for prim, ref in refs.items():
-                    if ref and ref[0] == prim.GetPath() and not regex_pattern.match(str(prim.GetPath())):
-                        continue
-                    if ref and ref[0] in result and prim not in result[ref[0]]:
-                        result[ref[0]].append(prim)
-                    elif ref and ref[0] not in result:
-                        result[ref[0]] = [prim]
-        return result
+        # without the USD listener, the index can't be kept up to date
+        if not self._listening:
+            self._instance_index.reset()
+        return self._instance_index.get_instances_by_mesh(self.stage, hashes)
 
     def select_prim_paths(self, paths: List[Union[str]]):
         current_selection = self._context.get_selection().get_selected_prim_paths()
@@ -0,0 +1,114 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import omni.kit.test
+from lightspeed.trex.selection_tree.shared.widget.selection_tree.instance_index import (
+    MeshInstanceIndex as _MeshInstanceIndex,
+)
+from pxr import Sdf, Usd
+
+_MESH_HASH = "0123456789ABCDEF"
+_OTHER_MESH_HASH = "FEDCBA9876543210"
+_MESH_PATH = f"/RootNode/meshes/mesh_{_MESH_HASH}"
+_OTHER_MESH_PATH = f"/RootNode/meshes/mesh_{_OTHER_MESH_HASH}"
+
+
+class TestMeshInstanceIndex(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.stage = Usd.Stage.CreateInMemory()
+        self.stage.DefinePrim(_MESH_PATH, "Mesh")
+        self.stage.DefinePrim(_OTHER_MESH_PATH, "Mesh")
+        for i in range(2):
+            self._define_instance(f"/RootNode/instances/inst_{_MESH_HASH}_{i}", _MESH_PATH)
+
+    def _define_instance(self, path: str, mesh_path: str) -> Usd.Prim:
+        prim = self.stage.DefinePrim(path, "Xform")
+        prim.GetReferences().AddInternalReference(mesh_path)
+        return prim
+
+    def _get_instance_paths(self, index: _MeshInstanceIndex, hashes) -> dict:
+        return {
+            str(mesh_path): sorted(str(prim.GetPath()) for prim in prims)
+            for mesh_path, prims in index.get_instances_by_mesh(self.stage, hashes).items()
+        }
+
+    async def test_get_instances_by_mesh_should_return_instances(self):
+        # Arrange
+        index = _MeshInstanceIndex()
+
+        # Act
+        result = self._get_instance_paths(index, {_MESH_HASH})
+
+        # Assert
+        self.assertDictEqual(
+            {
+                _MESH_PATH: [
+                    f"/RootNode/instances/inst_{_MESH_HASH}_0",
+                    f"/RootNode/instances/inst_{_MESH_HASH}_1",
+                ]
+            },
+            result,
+        )
+        self.assertDictEqual({}, self._get_instance_paths(index, {_OTHER_MESH_HASH}))
+
+    async def test_resynced_paths_should_update_index(self):
+        # Arrange
+        index = _MeshInstanceIndex()
+        self._get_instance_paths(index, {_MESH_HASH})
+
+        # Act
+        self._define_instance(f"/RootNode/instances/inst_{_OTHER_MESH_HASH}_0", _OTHER_MESH_PATH)
+        self.stage.RemovePrim(f"/RootNode/instances/inst_{_MESH_HASH}_1")
+        index.on_resynced_paths(
+            [
+                Sdf.Path(f"/RootNode/instances/inst_{_OTHER_MESH_HASH}_0"),
+                Sdf.Path(f"/RootNode/instances/inst_{_MESH_HASH}_1"),
+            ]
+        )
+
+        # Assert
+        self.assertDictEqual(
+            {_MESH_PATH: [f"/RootNode/instances/inst_{_MESH_HASH}_0"]},
+            self._get_instance_paths(index, {_MESH_HASH}),
+        )
+        self.assertDictEqual(
+            {_OTHER_MESH_PATH: [f"/RootNode/instances/inst_{_OTHER_MESH_HASH}_0"]},
+            self._get_instance_paths(index, {_OTHER_MESH_HASH}),
+        )
+
+    async def test_resynced_parent_path_should_update_index(self):
+        # Arrange
+        index = _MeshInstanceIndex()
+        self._get_instance_paths(index, {_MESH_HASH})
+
+        # Act
+        self.stage.GetPrimAtPath("/RootNode/instances").SetActive(False)
+        index.on_resynced_paths([Sdf.Path("/RootNode/instances")])
+
+        # Assert
+        self.assertDictEqual({}, self._get_instance_paths(index, {_MESH_HASH}))
+
+    async def test_changes_before_the_first_query_should_be_indexed(self):
+        # Arrange
+        index = _MeshInstanceIndex()
+
+        # Act
+        index.on_resynced_paths([Sdf.Path(f"/RootNode/instances/inst_{_MESH_HASH}_0")])
+        self._define_instance(f"/RootNode/instances/inst_{_MESH_HASH}_2", _MESH_PATH)
+
+        # Assert
+        self.assertEqual(3, len(self._get_instance_paths(index, {_MESH_HASH})[_MESH_PATH]))
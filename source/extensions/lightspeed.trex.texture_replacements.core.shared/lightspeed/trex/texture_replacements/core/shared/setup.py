@@ -25,6 +25,7 @@ from lightspeed.trex.utils.common.prim_utils import PrimTypes as _PrimTypes
 from lightspeed.trex.utils.common.prim_utils import filter_prims_paths as _filter_prims_paths
 from lightspeed.trex.utils.common.prim_utils import get_extended_selection as _get_extended_selection
 from lightspeed.trex.utils.common.prim_utils import get_prim_paths as _get_prim_paths
+from lightspeed.trex.utils.common.prim_utils import get_prim_query_engine as _get_prim_query_engine
 from lightspeed.trex.utils.common.prim_utils import includes_hash as _includes_hash
 from lightspeed.trex.utils.common.prim_utils import is_shader as _is_shader
 from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS as _SUPPORTED_TEXTURE_EXTENSIONS
@@ -101,6 +102,21 @@ class TextureReplacementsCore:
             raise ValueError("Unable to find a material associated to the given texture")
         return PrimsResponseModel(asset_paths=material_inputs)
 
+    def get_stage_revision(self, include_properties: bool = False, include_selection: bool = False) -> str:
+        """
+        Get an identifier of the state of the stage. The result of a query can only change when the identifier changes.
+
+        Args:
+            include_properties: Whether the property changes, such as attribute values, also change the identifier
+            include_selection: Whether the selection changes also change the identifier
+
+        Returns:
+            The revision of the stage
+        """
+        return _get_prim_query_engine(self._context_name).get_revision(
+            include_properties=include_properties, include_selection=include_selection
+        )
+
     # TRADITIONAL FUNCTIONS
 
     def get_texture_prims_assets(
@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
+from fastapi import Request, Response
 from lightspeed.trex.texture_replacements.core.shared import TextureReplacementsCore
 from lightspeed.trex.texture_replacements.core.shared.data_models import (
     GetTexturesQueryModel,
@@ -56,6 +57,8 @@ class TextureReplacementsService(ServiceBase):
             response_model=TexturesResponseModel,
         )
         async def get_textures(
+            request: Request,
+            response: Response,
             asset_hashes: set[str] | None = ServiceBase.describe_query_param(  # noqa B008
                 None, "Filter textures to keep textures from specific material hashes"
             ),
@@ -79,19 +82,34 @@ class TextureReplacementsService(ServiceBase):
                 "Filter an texture if it exists or not on a given layer. Use in conjunction with `layer_identifier` "
                 "to filter on a given layer, otherwise this parameter will be ignored.",
             ),
+            offset: int = ServiceBase.describe_query_param(0, "The number of textures to skip"),  # noqa B008
+            limit: int | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The maximum number of textures to return. All the textures are returned if not set."
+            ),
         ) -> TexturesResponseModel:
             try:
-                return self.__texture_core.get_texture_prims_assets_with_data_models(
-                    GetTexturesQueryModel(
-                        asset_hashes=asset_hashes,
-                        texture_types=texture_types,
-                        return_selection=selection,
-                        filter_session_prims=filter_session_prims,
-                        layer_identifier=layer_identifier,
-                        exists=exists,
-                        context_name=context_name,
-                    )
+                query = GetTexturesQueryModel(
+                    asset_hashes=asset_hashes,
+                    texture_types=texture_types,
+                    return_selection=selection,
+                    filter_session_prims=filter_session_prims,
+                    layer_identifier=layer_identifier,
+                    exists=exists,
+                    context_name=context_name,
+                )
+                # Only query the stage if the client doesn't have the current response. The textures are attribute
+                # values, so any property change can change the response.
+                etag = ServiceBase.get_etag(
+                    self.__texture_core.get_stage_revision(include_properties=True, include_selection=selection),
+                    query,
+                    offset,
+                    limit,
                 )
+                if ServiceBase.is_not_modified(request, etag):
+                    return ServiceBase.not_modified(etag)
+                textures = self.__texture_core.get_texture_prims_assets_with_data_models(query).textures
+                response.headers["ETag"] = etag
+                return TexturesResponseModel(textures=ServiceBase.paginate(textures, offset, limit, response))
             except ValueError as e:
                 ServiceBase.raise_error(422, e)
 
@@ -16,6 +16,7 @@
 """
 
 __all__ = [
+    "PrimQueryEngine",
     "PrimTypes",
     "get_prim_paths",
     "filter_prims_paths",
@@ -26,15 +27,23 @@ __all__ = [
     "is_instance",
     "get_extended_selection",
     "get_children_prims",
+    "get_prim_query_engine",
 ]
 
 import re
+import threading
+import uuid
 from enum import Enum
-from typing import Callable
+from typing import Callable, Iterable
 
 import omni.usd
 from lightspeed.common import constants
-from pxr import Sdf, Usd, UsdGeom, UsdLux, UsdShade
+from pxr import Sdf, Tf, Usd, UsdGeom, UsdLux, UsdShade
+
+_MAX_CACHED_QUERIES = 32
+
+_ENGINES: dict[str, "PrimQueryEngine"] = {}
+_ENGINES_LOCK = threading.Lock()
 
 
 class PrimTypes(Enum):
@@ -51,6 +60,7 @@ def get_prim_paths(
     layer_id: str = None,
     exists: bool = True,
     context_name: str = "",
+    path_prefix: str | None = None,
 ) -> list[str]:
     """
     Get the list of prim paths of a given type in the stage or current selection
@@ -65,48 +75,19 @@ def get_prim_paths(
         exists: Filter an asset if it exists or not on a given layer. Use in conjunction with `layer_identifier` to
                 filter on a given layer, otherwise this parameter will be ignored.
         context_name: Context name for the stage to get prim paths from
+        path_prefix: Only return the prims at or under this path
 
     Returns:
         A list of prims paths
     """
-    if prim_type is not None:
-        match prim_type:
-            case PrimTypes.LIGHTS:
-                return filter_prims_paths(
-                    lambda prim: is_light(prim) and includes_hash(prim, asset_hashes),
-                    prim_paths=selection,
-                    filter_session_prims=filter_session_prims,
-                    layer_id=layer_id,
-                    exists=exists,
-                    context_name=context_name,
-                )
-            case PrimTypes.MATERIALS:
-                return filter_prims_paths(
-                    lambda prim: is_material(prim) and includes_hash(prim, asset_hashes),
-                    prim_paths=selection,
-                    filter_session_prims=filter_session_prims,
-                    layer_id=layer_id,
-                    exists=exists,
-                    context_name=context_name,
-                )
-            case PrimTypes.MODELS:
-                return filter_prims_paths(
-                    lambda prim: is_model(prim) and includes_hash(prim, asset_hashes),
-                    prim_paths=selection,
-                    filter_session_prims=filter_session_prims,
-                    layer_id=layer_id,
-                    exists=exists,
-                    context_name=context_name,
-                )
-
-    # All types
-    return filter_prims_paths(
-        lambda prim: (is_light(prim) or is_material(prim) or is_model(prim)) and includes_hash(prim, asset_hashes),
-        prim_paths=selection,
+    return get_prim_query_engine(context_name).get_prim_paths(
+        prim_types=[prim_type],
+        asset_hashes=asset_hashes,
+        selection=selection,
         filter_session_prims=filter_session_prims,
         layer_id=layer_id,
         exists=exists,
-        context_name=context_name,
+        path_prefix=path_prefix,
     )
 
 
@@ -137,36 +118,278 @@ def filter_prims_paths(
 
     context = omni.usd.get_context(context_name)
     stage = context.get_stage()
-    session_layer = stage.GetSessionLayer()
 
     if prim_paths is not None:
         prims = [stage.GetPrimAtPath(path) for path in prim_paths]
     else:
         prims = stage.TraverseAll()
 
-    def layer_predicate(prim: Usd.Prim) -> bool:
-        is_valid = True
-        # If we're filtering session prims and the prim exists on the session layer, it's not valid
-        if filter_session_prims and session_layer.GetPrimAtPath(prim.GetPath()):
-            is_valid = False
-        # If we're filtering for a given layer, make sure the prim spec exists/doesn't exist on the layer
-        if layer_id is not None:
-            layer = Sdf.Layer.FindOrOpen(layer_id)
-            # If the layer doesn't exist, just ignore the filter
-            if not layer:
-                return is_valid
-            introducing_layer, _ = omni.usd.get_introducing_layer(prim)
-            if exists:
-                is_valid = bool(layer.GetPrimAtPath(prim.GetPath())) or (layer == introducing_layer)
-            else:
-                is_valid = not bool(layer.GetPrimAtPath(prim.GetPath())) and (layer != introducing_layer)
-        return is_valid
+    layer_predicate = _get_layer_predicate(stage, filter_session_prims, layer_id, exists)
 
-    filtered_paths = [str(prim.GetPath()) for prim in prims if layer_predicate(prim) and predicate(prim)]
+    # The layer predicate can need the introducing layer of the prim, so only check it for the matching prims
+    filtered_paths = [str(prim.GetPath()) for prim in prims if predicate(prim) and layer_predicate(prim)]
 
     return filtered_paths
 
 
+def _get_layer_predicate(
+    stage: Usd.Stage, filter_session_prims: bool, layer_id: str | None, exists: bool
+) -> Callable[["Usd.Prim"], bool]:
+    """
+    Get the predicate filtering the prims on the session layer & the given layer. The layers are resolved once for all
+    the prims.
+    """
+    session_layer = stage.GetSessionLayer()
+    layer = Sdf.Layer.FindOrOpen(str(layer_id)) if layer_id is not None else None
+
+    def layer_predicate(prim: "Usd.Prim") -> bool:
+        path = prim.GetPath()
+        # If we're filtering for a given layer, make sure the prim spec exists/doesn't exist on the layer.
+        # If the layer doesn't exist, just ignore the filter
+        if layer:
+            has_prim_spec = bool(layer.GetPrimAtPath(path))
+            # Getting the introducing layer composes the prim stack, so only do it when the prim spec is not enough
+            if exists:
+                return has_prim_spec or layer == omni.usd.get_introducing_layer(prim)[0]
+            return not has_prim_spec and layer != omni.usd.get_introducing_layer(prim)[0]
+        # If we're filtering session prims and the prim exists on the session layer, it's not valid
+        return not (filter_session_prims and session_layer.GetPrimAtPath(path))
+
+    return layer_predicate
+
+
+def _get_hash_predicate(asset_hashes: set[str] | None) -> Callable[[str], bool]:
+    """
+    Get the predicate checking whether a prim path contains one of the hashes. The substrings of the path are looked up
+    in the set of hashes instead of searching every hash in the path.
+    """
+    if asset_hashes is None:
+        return lambda _: True
+
+    hashes_by_length = {}
+    for asset_hash in asset_hashes:
+        hashes_by_length.setdefault(len(asset_hash), set()).add(asset_hash)
+    # An empty hash is found in every path
+    if 0 in hashes_by_length:
+        return lambda _: True
+
+    def hash_predicate(path: str) -> bool:
+        return any(
+            path[index : index + length] in hashes
+            for length, hashes in hashes_by_length.items()
+            for index in range(len(path) - length + 1)
+        )
+
+    return hash_predicate
+
+
+def get_prim_query_engine(context_name: str = "") -> "PrimQueryEngine":
+    """
+    Get the prim query engine of a context, so the cached prim queries are reused by every caller.
+
+    Args:
+        context_name: The context name to use
+
+    Returns:
+        The prim query engine of the context
+    """
+    with _ENGINES_LOCK:
+        if context_name not in _ENGINES:
+            _ENGINES[context_name] = PrimQueryEngine(context_name=context_name)
+        return _ENGINES[context_name]
+
+
+class PrimQueryEngine:
+    def __init__(self, context_name: str = ""):
+        """
+        Find the prim paths of a context's stage matching a prim type, a set of hashes, a layer and a path prefix in a
+        single traversal of the stage.
+
+        The results of the queries on the whole stage are cached until the prims of the stage change. Property changes
+        don't invalidate the results.
+
+        Args:
+            context_name: The context name to use
+        """
+        self._context_name = context_name
+        self._lock = threading.RLock()
+        # Identifies the engine, so the revisions of another process or engine never match
+        self._token = uuid.uuid4().hex
+        self._stage_id = None
+        self._generation = 0
+        self._change_count = 0
+        self._results: dict[tuple, list[str]] = {}
+        self._objects_listener = None
+
+    @property
+    def generation(self) -> int:
+        """The number of times the prims of the stage changed. The cached results are only valid for a generation."""
+        return self._generation
+
+    def get_prim_paths(
+        self,
+        prim_types: Iterable[PrimTypes | None] | None = None,
+        asset_hashes: set[str] | None = None,
+        selection: list[str] | None = None,
+        filter_session_prims: bool = True,
+        layer_id: str | None = None,
+        exists: bool = True,
+        path_prefix: str | None = None,
+    ) -> list[str]:
+        """
+        Get the list of prim paths of the given types in the stage or current selection
+
+        Args:
+            prim_types: The types of prim to fetch. The paths are grouped by type, in the given order. A None type
+                        fetches the lights, materials and models together. If not set, all the types are fetched.
+            asset_hashes: A set of hashes to filter for
+            selection: Current stage selection. If not set, all the prim paths in the stage will be used.
+            filter_session_prims: Whether to filter out prims defined on the session prim or not
+            layer_id: Look for assets that exists or not on a given layer. Use the `exists` query parameter to set
+                      whether existing or non-existing prims should be returned.
+            exists: Filter an asset if it exists or not on a given layer. Use in conjunction with `layer_identifier`
+                    to filter on a given layer, otherwise this parameter will be ignored.
+            path_prefix: Only return the prims at or under this path
+
+        Returns:
+            A list of prims paths
+        """
+        context = omni.usd.get_context(self._context_name)
+        stage = context.get_stage()
+        if stage is None:
+            return []
+
+        prim_types = tuple(prim_types) if prim_types is not None else (None,)
+        if not prim_types:
+            return []
+
+        # The selection changes all the time, so only the queries on the whole stage are cached
+        key = None
+        if selection is None:
+            key = (
+                prim_types,
+                frozenset(asset_hashes) if asset_hashes is not None else None,
+                filter_session_prims,
+                str(layer_id) if layer_id is not None else None,
+                exists,
+                str(path_prefix) if path_prefix is not None else None,
+            )
+
+        with self._lock:
+            self._update(context.get_stage_id(), stage)
+            if key in self._results:
+                return list(self._results[key])
+            generation = self._generation
+
+        prim_paths = self._query(
+            stage, prim_types, asset_hashes, selection, filter_session_prims, layer_id, exists, path_prefix
+        )
+
+        with self._lock:
+            # Don't cache results computed while the stage changed
+            if key is not None and generation == self._generation:
+                if len(self._results) >= _MAX_CACHED_QUERIES:
+                    self._results.pop(next(iter(self._results)))
+                self._results[key] = prim_paths
+
+        return list(prim_paths)
+
+    def get_revision(self, include_properties: bool = False, include_selection: bool = False) -> str:
+        """
+        Get an identifier of the state of the stage. It changes when another stage is opened or when the prims of the
+        stage change, so it can be compared to know whether the result of a query changed without running it.
+
+        Args:
+            include_properties: Whether the property changes, such as attribute values, also change the identifier
+            include_selection: Whether the selection changes also change the identifier
+
+        Returns:
+            The revision of the stage
+        """
+        context = omni.usd.get_context(self._context_name)
+        stage = context.get_stage()
+        if stage is None:
+            return f"{self._token}-None"
+
+        with self._lock:
+            self._update(context.get_stage_id(), stage)
+            revision = f"{self._token}-{self._stage_id}-{self._generation}"
+            if include_properties:
+                revision += f"-{self._change_count}"
+
+        if include_selection:
+            revision += f"-{sorted(context.get_selection().get_selected_prim_paths())}"
+        return revision
+
+    def invalidate(self):
+        """
+        Clear the cached results
+        """
+        with self._lock:
+            self._generation += 1
+            self._results.clear()
+
+    @staticmethod
+    def _query(
+        stage: Usd.Stage,
+        prim_types: tuple[PrimTypes | None, ...],
+        asset_hashes: set[str] | None,
+        selection: list[str] | None,
+        filter_session_prims: bool,
+        layer_id: str | None,
+        exists: bool,
+        path_prefix: str | None,
+    ) -> list[str]:
+        type_predicates = [_PRIM_TYPE_PREDICATES[prim_type] for prim_type in prim_types]
+        hash_predicate = _get_hash_predicate(asset_hashes)
+        layer_predicate = _get_layer_predicate(stage, filter_session_prims, layer_id, exists)
+        prefix = Sdf.Path(str(path_prefix)) if path_prefix is not None else None
+
+        if selection is not None:
+            prims = [stage.GetPrimAtPath(path) for path in selection]
+        elif prefix is not None:
+            # Only traverse the prims under the prefix
+            prefix_prim = stage.GetPrimAtPath(prefix)
+            prims = Usd.PrimRange(prefix_prim, Usd.PrimAllPrimsPredicate) if prefix_prim else []
+        else:
+            prims = stage.TraverseAll()
+
+        # Check the cheapest predicates first: the path, the type and then the layers
+        prim_paths_by_type = [[] for _ in prim_types]
+        for prim in prims:
+            if not prim:
+                continue
+            path = prim.GetPath()
+            if prefix is not None and not path.HasPrefix(prefix):
+                continue
+            path_str = str(path)
+            if not hash_predicate(path_str):
+                continue
+            matching_types = [index for index, predicate in enumerate(type_predicates) if predicate(prim)]
+            if not matching_types or not layer_predicate(prim):
+                continue
+            for index in matching_types:
+                prim_paths_by_type[index].append(path_str)
+
+        return [prim_path for prim_paths in prim_paths_by_type for prim_path in prim_paths]
+
+    def _update(self, stage_id: int, stage: Usd.Stage):
+        if stage_id == self._stage_id:
+            return
+        self._stage_id = stage_id
+        self._objects_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+        self.invalidate()
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, _):
+        with self._lock:
+            self._change_count += 1
+        # Property changes can't change the type, hash or layers of a prim
+        changed_paths = [*notice.GetResyncedPaths(), *notice.GetChangedInfoOnlyPaths()]
+        if all(path.IsPropertyPath() for path in changed_paths):
+            return
+        self.invalidate()
+
+
 def includes_hash(prim: "Usd.Prim", asset_hashes: set[str]) -> bool:
     """
     Returns:
@@ -338,3 +561,11 @@ def get_children_prims(
             yield from traverse_instanced_children(child, _current_level, _skip_remix_ref)
 
     return list(traverse_instanced_children(prim, current_level, skip_remix_ref))
+
+
+_PRIM_TYPE_PREDICATES: dict[PrimTypes | None, Callable[["Usd.Prim"], bool]] = {
+    PrimTypes.LIGHTS: is_light,
+    PrimTypes.MATERIALS: is_material,
+    PrimTypes.MODELS: is_model,
+    None: lambda prim: is_light(prim) or is_material(prim) or is_model(prim),
+}
@@ -26,6 +26,7 @@ from typing import TYPE_CHECKING, Callable, Union
 import carb
 import omni.usd
 from lightspeed.common import constants
+from omni.flux.utils.common.texture_process_scheduler import run_texture_process as _run_texture_process
 from PIL import Image
 
 if TYPE_CHECKING:
@@ -62,7 +63,7 @@ class UpscalerCore:
             return input_texture
 
         output_path = (temp_path / input_texture.stem).with_suffix(".png")
-        with subprocess.Popen(
+        _run_texture_process(
             [
                 carb.tokens.get_tokens_interface().resolve(constants.NVTT_PATH),
                 str(input_texture),
@@ -71,8 +72,7 @@ class UpscalerCore:
             ],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.STDOUT,
-        ) as convert_png_process:
-            convert_png_process.wait()
+        )
 
         # use PILLOW as a fallback if NVTT fails
         if not output_path.exists():
@@ -116,7 +116,7 @@ class UpscalerCore:
         if output_texture.suffix.lower() != ".dds":
             return
 
-        with subprocess.Popen(
+        _run_texture_process(
             [
                 carb.tokens.get_tokens_interface().resolve(constants.NVTT_PATH),
                 str(converted_output_texture),
@@ -126,8 +126,7 @@ class UpscalerCore:
             ],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.STDOUT,
-        ) as convert_process:
-            convert_process.wait()
+        )
 
     @staticmethod
     def __cleanup_temporary_pngs(converted_output_texture: Path, output_texture: Path, keep_png: bool):
@@ -1,3 +1,8 @@
+import random
+import re
+import time
+
+import carb
 import omni.kit.test
 from omni.flux.asset_importer.core import (
     determine_ideal_types,
@@ -5,7 +10,86 @@ from omni.flux.asset_importer.core import (
     get_texture_type_from_filename,
     parse_texture_paths,
 )
+from omni.flux.asset_importer.core.data_models import PREFIX_TEXTURE_NO_PREFIX as _PREFIX_TEXTURE_NO_PREFIX
+from omni.flux.asset_importer.core.data_models import TEXTURE_TYPE_REGEX_MAP as _TEXTURE_TYPE_REGEX_MAP
 from omni.flux.asset_importer.core.data_models import TextureTypes as _TextureTypes
+from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+
+
+def _determine_ideal_types_reference(paths, pref_normal_conv=None):
+    """The original implementation, comparing every path with every texture set"""
+    texture_types = {}
+    texture_sets = get_texture_sets(paths)
+    for set_prefix in sorted(texture_sets.keys(), key=len):
+        set_types = texture_sets[set_prefix]
+        for path in paths:
+            file_path = _OmniUrl(path).path
+            if not file_path.startswith(set_prefix) and not set_prefix.startswith(_PREFIX_TEXTURE_NO_PREFIX):
+                continue
+            texture_type = None
+            set_texture_type = None
+            for set_type, _ in set_types:
+                if file_path.startswith(set_prefix + set_type) or (
+                    set_prefix.startswith(_PREFIX_TEXTURE_NO_PREFIX) and file_path.startswith(set_type)
+                ):
+                    set_texture_type = set_type
+                    break
+            if set_texture_type and len([t for t, _ in set_types if t.lower() == set_texture_type.lower()]) == 1:
+                for ttype in _TextureTypes:
+                    pattern = _TEXTURE_TYPE_REGEX_MAP.get(ttype)
+                    if pattern is None:
+                        continue
+                    if re.search(pattern, set_texture_type, re.IGNORECASE):
+                        texture_type = ttype
+                        break
+            if texture_type:
+                if pref_normal_conv is not None and texture_type in [
+                    _TextureTypes.NORMAL_OGL,
+                    _TextureTypes.NORMAL_DX,
+                    _TextureTypes.NORMAL_OTH,
+                ]:
+                    texture_types[path] = pref_normal_conv
+                else:
+                    texture_types[path] = texture_type
+    return texture_types
+
+
+def _generate_texture_library(directory_count: int, seed: int = 0):
+    """Generate texture paths using the naming conventions found in texture libraries"""
+    rng = random.Random(seed)
+    keywords = [
+        "Albedo",
+        "diffuse",
+        "Color",
+        "Roughness",
+        "rough",
+        "Metallic",
+        "Metal",
+        "Emissive",
+        "Normal",
+        "nrm",
+        "Normal_OGL",
+        "Normal_DX",
+        "OTH_Normal",
+        "Height",
+        "bump",
+        "Other",
+        "Mask",
+        "AO",
+    ]
+    paths = []
+    for directory_index in range(directory_count):
+        directory = f"C:/library/category_{directory_index % 7}/asset_{directory_index}"
+        for set_index in range(rng.randint(1, 4)):
+            prefix = rng.choice([f"T_Asset{directory_index}_{set_index}_", f"asset{set_index}-", "", "T_Metal_"])
+            for keyword in rng.sample(keywords, rng.randint(1, 6)):
+                extension = rng.choice(["png", "dds", "tga"])
+                paths.append(f"{directory}/{prefix}{keyword}.{extension}")
+                if rng.random() < 0.05:
+                    paths.append(f"{directory}/{prefix}{keyword}_{rng.randint(1, 3):02}.{extension}")
+    # Relative paths without any prefix
+    paths.extend(["Albedo.png", "Normal_DX.png", "AlbedoMask.png", "Metal.png", "Metal.png"])
+    return paths
 
 
 class TestAssetUtils(omni.kit.test.AsyncTestCase):
@@ -94,3 +178,38 @@ class TestAssetUtils(omni.kit.test.AsyncTestCase):
         ideal_types = determine_ideal_types(list(test_paths.keys()))
         for path, texture_type in ideal_types.items():
             self.assertEqual(test_paths[path], texture_type)
+
+    def test_determine_ideal_types_should_match_reference_implementation(self):
+        for seed in range(5):
+            # Arrange
+            paths = _generate_texture_library(40, seed=seed)
+
+            for pref_normal_conv in [None, _TextureTypes.NORMAL_DX]:
+                # Act
+                ideal_types = determine_ideal_types(paths, pref_normal_conv=pref_normal_conv)
+
+                # Assert
+                expected_types = _determine_ideal_types_reference(paths, pref_normal_conv=pref_normal_conv)
+                self.assertListEqual(list(expected_types.items()), list(ideal_types.items()))
+
+    def test_determine_ideal_types_benchmark_should_match_reference_implementation(self):
+        # Arrange
+        paths = _generate_texture_library(150)
+
+        # Act
+        start = time.perf_counter()
+        ideal_types = determine_ideal_types(paths)
+        duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected_types = _determine_ideal_types_reference(paths)
+        reference_duration = time.perf_counter() - start
+
+        carb.log_info(
+            f"Determined the types of {len(paths)} textures in {duration:.3f}s "
+            f"({reference_duration:.3f}s comparing every texture with every set)"
+        )
+
+        # Assert
+        self.assertGreater(len(ideal_types), 0)
+        self.assertListEqual(list(expected_types.items()), list(ideal_types.items()))
@@ -15,9 +15,10 @@
 * limitations under the License.
 """
 
+import functools
 import hashlib
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Dict, List, Tuple
 
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
@@ -75,6 +76,10 @@ def get_texture_sets(paths: List[str]) -> Dict[str, List[Tuple[str, str]]]:
     Returns:
         Set of textures
     """
+    return _get_texture_sets(paths, [_OmniUrl(path).path for path in paths])
+
+
+def _get_texture_sets(paths: List[str], file_paths: List[str]) -> Dict[str, List[Tuple[str, str]]]:
     texture_sets = defaultdict(list)
 
     # Combine all the TextureTypes in 1 regex expression to make building texture sets faster
@@ -82,9 +87,12 @@ def get_texture_sets(paths: List[str]) -> Dict[str, List[Tuple[str, str]]]:
     regex_search = re.compile(rf".*({'|'.join(patterns)})", re.IGNORECASE)
 
     # Build Texture Sets
-    for path in paths:
-        file_path = _OmniUrl(path).path
-        regex_match = re.search(regex_search, file_path)
+    for path, file_path in zip(paths, file_paths):
+        # The leading `.*` already tries every position of the path, so searching from every other start position only
+        # makes a difference when the path spans multiple lines
+        regex_match = regex_search.match(file_path)
+        if not regex_match and "\n" in file_path:
+            regex_match = regex_search.search(file_path)
         # At least 1 keyword was found
         if regex_match:
             # If the individual item expressions have matching group, use those
@@ -108,70 +116,89 @@ def get_texture_sets(paths: List[str]) -> Dict[str, List[Tuple[str, str]]]:
     return texture_sets
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_set_texture_type(set_type: str) -> _TextureTypes | None:
+    for ttype in _TextureTypes:
+        pattern = _TEXTURE_TYPE_REGEX_MAP.get(ttype)
+        if pattern is None:
+            continue
+        # If the enum REGEX matches with the set texture type, we found the right type
+        if re.search(pattern, set_type, re.IGNORECASE):
+            return ttype
+    return None
+
+
 def determine_ideal_types(paths: List[str], pref_normal_conv: _TextureTypes = None) -> Dict[str, _TextureTypes]:
     """
     Will try to determine the TextureType based on the filename. If no TextureType can be found, no entry will be
     added to the returned dictionary.
     """
-
-    texture_types = {}
-
-    texture_sets = get_texture_sets(paths)
+    file_paths = [_OmniUrl(path).path for path in paths]
+    texture_sets = _get_texture_sets(paths, file_paths)
 
     # Sort the sets by length so the more precise prefixes overwrite the less precise prefixes
     ordered_sets = sorted(texture_sets.keys(), key=len)
 
-    # Find the Texture Types
-    for set_prefix in ordered_sets:
+    # A file belongs to a set if its path starts with the set prefix followed by one of the set types. Files in a set
+    # without prefix can also start with the set type directly. Index the sets by these keys so every file only looks
+    # up the keys that prefix its path, instead of being compared with every set.
+    set_texture_types = []
+    prefix_index = defaultdict(list)
+    for set_order, set_prefix in enumerate(ordered_sets):
         set_types = texture_sets[set_prefix]
+        type_counts = Counter(t.lower() for t, _ in set_types)
+        no_prefix = set_prefix.startswith(_PREFIX_TEXTURE_NO_PREFIX)
 
-        for path in paths:
-            file_path = _OmniUrl(path).path
-
-            # Make sure the file is part of the texture set
-            if not file_path.startswith(set_prefix) and not set_prefix.startswith(_PREFIX_TEXTURE_NO_PREFIX):
-                continue
-
-            texture_type = None
-
-            # Get the texture type of the file in the set
-            set_texture_type = None
-            for set_type, _ in set_types:
-                if file_path.startswith(set_prefix + set_type) or (
-                    set_prefix.startswith(_PREFIX_TEXTURE_NO_PREFIX) and file_path.startswith(set_type)
-                ):
-                    set_texture_type = set_type
-                    break
-
-            # Get the enum value matching the texture type
+        resolved_types = []
+        for type_order, set_type in enumerate(dict.fromkeys(t for t, _ in set_types)):
             # If the texture type is in the set multiple times, we keep the type as OTHER since it's probably
             # not the texture type (Example: T_Metal_01.png and T_Metal_02.png)
-            if set_texture_type and len([t for t, _ in set_types if t.lower() == set_texture_type.lower()]) == 1:
-                for ttype in _TextureTypes:
-                    pattern = _TEXTURE_TYPE_REGEX_MAP.get(ttype)
-                    if pattern is None:
-                        continue
-                    # If the enum REGEX matches with the set texture type, we found the right type
-                    if re.search(pattern, set_texture_type, re.IGNORECASE):
-                        texture_type = ttype
-                        break
-
-            # Only update the texture type if a type was found.
-            # Since the prefixes are ordered by length, a more precise prefix will override a broader one
-            # (Example: T_Metal_Normal_OTH.png -> [T_Metal_, T_Metal_Normal_] will end up with value: OTH)
-            if texture_type:
-                # Special check for normals, which can be in one of three encodings
-                if pref_normal_conv is not None and texture_type in [
-                    _TextureTypes.NORMAL_OGL,
-                    _TextureTypes.NORMAL_DX,
-                    _TextureTypes.NORMAL_OTH,
-                ]:
-                    texture_types[path] = pref_normal_conv
-                else:
-                    texture_types[path] = texture_type
-
-    # Return the list of explicitly known texture types only
-    return texture_types
+            resolved_types.append(_get_set_texture_type(set_type) if type_counts[set_type.lower()] == 1 else None)
+            prefix_index[set_prefix + set_type].append((set_order, type_order))
+            if no_prefix:
+                prefix_index[set_type].append((set_order, type_order))
+        set_texture_types.append(resolved_types)
+
+    key_lengths = sorted({len(key) for key in prefix_index})
+
+    normal_types = [_TextureTypes.NORMAL_OGL, _TextureTypes.NORMAL_DX, _TextureTypes.NORMAL_OTH]
+    assignments = {}
+    for path_index, (path, file_path) in enumerate(zip(paths, file_paths)):
+        if path in assignments:
+            continue
+
+        # Get the texture type of the file in every set it is part of: the first set type matching the file
+        matched_sets = {}
+        for length in key_lengths:
+            if length > len(file_path):
+                break
+            for set_order, type_order in prefix_index.get(file_path[:length], ()):
+                if type_order < matched_sets.get(set_order, type_order + 1):
+                    matched_sets[set_order] = type_order
+
+        # Since the prefixes are ordered by length, a more precise prefix will override a broader one
+        # (Example: T_Metal_Normal_OTH.png -> [T_Metal_, T_Metal_Normal_] will end up with value: OTH)
+        first_set_order = None
+        texture_type = None
+        for set_order in sorted(matched_sets):
+            set_texture_type = set_texture_types[set_order][matched_sets[set_order]]
+            if set_texture_type:
+                texture_type = set_texture_type
+                if first_set_order is None:
+                    first_set_order = set_order
+
+        # Only update the texture type if a type was found.
+        if texture_type:
+            # Special check for normals, which can be in one of three encodings
+            if pref_normal_conv is not None and texture_type in normal_types:
+                texture_type = pref_normal_conv
+            assignments[path] = (first_set_order, path_index, texture_type)
+
+    # Return the list of explicitly known texture types only, in the order the sets resolved them
+    return {
+        path: texture_type
+        for path, (_, _, texture_type) in sorted(assignments.items(), key=lambda item: item[1][:2])
+    }
 
 
 def get_texture_type_from_filename(filename: str) -> _TextureTypes | None:
@@ -16,10 +16,13 @@
 """
 
 import abc
+import hashlib
+import json
+from enum import Enum
 from typing import Any, Optional, Type, Union
 
 from fast_version import VersionedAPIRouter
-from fastapi import Depends, Path, Query
+from fastapi import Depends, Path, Query, Request, Response
 from omni.flux.factory.base import PluginBase
 from omni.flux.service.shared import BaseServiceModel
 from omni.services.core import exceptions
@@ -142,6 +145,88 @@ class ServiceBase(PluginBase, abc.ABC):
         """
         return Query(default_value, description=description)
 
+    @staticmethod
+    def get_etag(*values: Any) -> str:
+        """
+        Get an entity tag identifying a response from the values it depends on
+
+        Args:
+            values: The values the response depends on. Sets, enums, paths & models are supported.
+
+        Returns:
+            The quoted entity tag, to use in the `ETag` header
+        """
+
+        def serialize(value: Any) -> Any:
+            if isinstance(value, (set, frozenset)):
+                return sorted(serialize(item) for item in value)
+            if isinstance(value, Enum):
+                return value.value
+            if hasattr(value, "dict"):
+                return value.dict()
+            return str(value)
+
+        value_hash = hashlib.md5(json.dumps(values, default=serialize, sort_keys=True).encode("utf-8")).hexdigest()
+        return f'"{value_hash}"'
+
+    @staticmethod
+    def is_not_modified(request: Request, etag: str) -> bool:
+        """
+        Check whether the client already has the response with the given entity tag, using the `If-None-Match` header
+
+        Args:
+            request: The request to check
+            etag: The entity tag of the current response
+
+        Returns:
+            True if the client response is up-to-date, False otherwise
+        """
+        if_none_match = request.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+        etags = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+        return "*" in etags or etag in etags
+
+    @staticmethod
+    def not_modified(etag: str) -> Response:
+        """
+        Get a `304 Not Modified` response for the given entity tag
+
+        Args:
+            etag: The entity tag of the current response
+
+        Returns:
+            The empty response
+        """
+        return Response(status_code=304, headers={"ETag": etag})
+
+    @staticmethod
+    def paginate(
+        items: list, offset: int = 0, limit: Optional[int] = None, response: Optional[Response] = None
+    ) -> list:
+        """
+        Get a page of items. The total number of items is set in the `X-Total-Count` header of the response.
+
+        Args:
+            items: All the items
+            offset: The number of items to skip
+            limit: The maximum number of items to return. All the remaining items are returned if None.
+            response: The response to set the total number of items in
+
+        Raises:
+            ValueError: If the offset or the limit is negative
+
+        Returns:
+            The items of the page
+        """
+        if offset < 0:
+            raise ValueError(f"The offset must be positive: {offset}")
+        if limit is not None and limit < 0:
+            raise ValueError(f"The limit must be positive: {limit}")
+        if response is not None:
+            response.headers["X-Total-Count"] = str(len(items))
+        return items[offset : offset + limit if limit is not None else None]
+
     @staticmethod
     def raise_error(status_code: int, details: Union[Exception, str]):
         """
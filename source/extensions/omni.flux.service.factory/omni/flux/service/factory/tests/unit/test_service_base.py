@@ -15,9 +15,9 @@
 * limitations under the License.
 """
 
-from unittest.mock import call, patch
+from unittest.mock import Mock, call, patch
 
-from fastapi import Depends, Query
+from fastapi import Depends, Query, Response
 from omni.flux.service.factory import ServiceBase
 from omni.flux.service.shared import BaseServiceModel
 from omni.kit.test.async_unittest import AsyncTestCase
@@ -152,3 +152,79 @@ class TestServiceBase(AsyncTestCase):
         # Assert
         self.assertEqual(cm.exception.status_code, error_code)
         self.assertEqual(cm.exception.detail, str(error_message))
+
+    async def test_get_etag_same_values_returns_same_etag(self):
+        # Arrange
+        model = TestModel(value=False)
+
+        # Act
+        etag = TestService.get_etag("revision", {"b", "a", "c"}, model, 10)
+        same_etag = TestService.get_etag("revision", {"c", "a", "b"}, TestModel(value=False), 10)
+        other_etag = TestService.get_etag("other_revision", {"b", "a", "c"}, model, 10)
+
+        # Assert
+        self.assertEqual(etag, same_etag)
+        self.assertNotEqual(etag, other_etag)
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
+
+    async def test_is_not_modified_returns_whether_etag_matches(self):
+        # Arrange
+        etag = TestService.get_etag("revision")
+
+        for header, expected_value in [
+            (None, False),
+            ('"other"', False),
+            (etag, True),
+            (f'"other", W/{etag}', True),
+            ("*", True),
+        ]:
+            with self.subTest(name=f"If-None-Match: {header}"):
+                request = Mock(headers={"If-None-Match": header} if header is not None else {})
+
+                # Act
+                value = TestService.is_not_modified(request, etag)
+
+                # Assert
+                self.assertEqual(expected_value, value)
+
+    async def test_not_modified_returns_304_with_etag(self):
+        # Arrange
+        etag = TestService.get_etag("revision")
+
+        # Act
+        response = TestService.not_modified(etag)
+
+        # Assert
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(etag, response.headers["ETag"])
+
+    async def test_paginate_returns_page_and_total_count(self):
+        # Arrange
+        items = list(range(10))
+
+        for offset, limit, expected_items in [
+            (0, None, items),
+            (0, 3, [0, 1, 2]),
+            (8, 5, [8, 9]),
+            (12, 5, []),
+            (4, 0, []),
+        ]:
+            with self.subTest(name=f"Offset: {offset}     Limit: {limit}"):
+                response = Response()
+
+                # Act
+                value = TestService.paginate(items, offset, limit, response)
+
+                # Assert
+                self.assertListEqual(expected_items, value)
+                self.assertEqual("10", response.headers["X-Total-Count"])
+
+    async def test_paginate_negative_values_raise_value_error(self):
+        # Arrange
+        items = list(range(10))
+
+        for offset, limit in [(-1, None), (0, -1)]:
+            with self.subTest(name=f"Offset: {offset}     Limit: {limit}"):
+                # Act
+                with self.assertRaises(ValueError):
+                    TestService.paginate(items, offset, limit)
@@ -516,6 +516,10 @@ class StageManagerInteractionPlugin(_StageManagerUIPluginBase, abc.ABC):
             self._draw_row_background_task.cancel()
         if self._update_expansion_task:
             self._update_expansion_task.cancel()
+        # Some filters listen to the context, so they should be torn down with the interaction
+        for filter_plugin in self.filters + self.required_filters:
+            if hasattr(filter_plugin, "destroy"):
+                filter_plugin.destroy()
 
     class Config(_StageManagerUIPluginBase.Config):
         fields = {
@@ -16,7 +16,7 @@
 """
 
 import abc
-from typing import TYPE_CHECKING, Any, Callable, Generic, Iterable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Generic, Hashable, Iterable, TypeVar
 
 from omni import ui
 from omni.flux.utils.widget.tree_widget import TreeDelegateBase as _TreeDelegateBase
@@ -65,6 +65,7 @@ class StageManagerTreeItem(_TreeItemBase):
                 "_tooltip": None,
                 "_parent": None,
                 "_data": None,
+                "_key": None,
             }
         )
         return default_attr
@@ -115,13 +116,33 @@ class StageManagerTreeItem(_TreeItemBase):
     def can_have_children(self) -> bool:
         return bool(self._children)
 
+    @property
+    def key(self) -> Hashable:
+        """
+        A stable key identifying the item. Items are hashed and compared using their key.
+
+        The key is computed the first time it is requested, and is then cached.
+        """
+        if self._key is None:
+            self._key = self._get_key()
+        return self._key
+
+    def _get_key(self) -> Hashable:
+        """
+        Compute the key identifying the item. Should be cheap to hash & compare and include the kind of item.
+
+        Returns:
+            The item key
+        """
+        return type(self).__name__, self._display_name, self._tooltip
+
     def __eq__(self, other):
         if isinstance(other, StageManagerTreeItem):
-            return self.display_name == other.display_name and self.tooltip == other.tooltip and self.data == other.data
+            return self.key == other.key
         return False
 
     def __hash__(self):
-        return hash(self.display_name + self.tooltip + str(self.data))
+        return hash(self.key)
 
 
 class StageManagerTreeModel(_TreeModelBase[StageManagerTreeItem], Generic[DataType]):
@@ -135,6 +156,7 @@ class StageManagerTreeModel(_TreeModelBase[StageManagerTreeItem], Generic[DataTy
         self._context_items: list[Any] = []
         self._filter_functions: list[Callable[[Iterable[Any]], list[Any]]] = []
         self._column_count = 0
+        self._items_dict: dict[int, StageManagerTreeItem] | None = None
 
     @property
     @abc.abstractmethod
@@ -146,6 +168,7 @@ class StageManagerTreeModel(_TreeModelBase[StageManagerTreeItem], Generic[DataTy
                 "_context_items": None,
                 "_filter_functions": None,
                 "_column_count": None,
+                "_items_dict": None,
             }
         )
         return default_attr
@@ -153,9 +176,11 @@ class StageManagerTreeModel(_TreeModelBase[StageManagerTreeItem], Generic[DataTy
     @property
     def items_dict(self) -> dict[int, StageManagerTreeItem]:
         """
-        Get a dictionary of item hashes and items
+        Get a dictionary of item hashes and items. Cached until the items change.
         """
-        return {hash(item): item for item in self.iter_items_children()}
+        if self._items_dict is None:
+            self._items_dict = {hash(item): item for item in self.iter_items_children()}
+        return self._items_dict
 
     @property
     def context_items(self) -> list[Any]:
@@ -191,6 +216,21 @@ class StageManagerTreeModel(_TreeModelBase[StageManagerTreeItem], Generic[DataTy
         """
         self._item_changed(None)
 
+    def refresh_changes(self, resynced_items: Iterable[Any], changed_items: Iterable[Any]) -> bool:
+        """
+        Update only the items affected by a set of context changes instead of refreshing the whole model.
+
+        The context items should be up-to-date when this method is called.
+
+        Args:
+            resynced_items: Identifiers of the context data that was added, removed or restructured
+            changed_items: Identifiers of the context data that only had its values changed
+
+        Returns:
+            True if the changes were applied, False if the model doesn't support the changes and should be refreshed
+        """
+        return False
+
     def find_items(self, predicate: Callable[[StageManagerTreeItem], bool]) -> list[StageManagerTreeItem]:
         """
         Get a tree item from its data
@@ -201,6 +241,10 @@ class StageManagerTreeModel(_TreeModelBase[StageManagerTreeItem], Generic[DataTy
                 results.append(item)
         return results
 
+    def _item_changed(self, item: StageManagerTreeItem | None):
+        self._items_dict = None
+        super()._item_changed(item)
+
     def get_item_children(self, item: StageManagerTreeItem | None):
         """
         Returns all the children of any given item.
@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING, Iterable
 
 from omni import ui
 from omni.flux.utils.common import EventSubscription as _EventSubscription
+from omni.flux.utils.common.prim_paths import PrimPathTrie as _PrimPathTrie
 from pydantic import Field, PrivateAttr
 
 from .base import StageManagerUSDFilterPlugin as _StageManagerUSDFilterPlugin
@@ -40,19 +41,16 @@ class IgnorePrimsFilterPlugin(_StageManagerUSDFilterPlugin):
 
     _string_field: ui.StringField = PrivateAttr()
     _value_changed_sub: _EventSubscription | None = PrivateAttr()
+    _ignore_prim_paths_trie: _PrimPathTrie | None = PrivateAttr(None)
+    _ignore_prim_paths_key: frozenset[str] | None = PrivateAttr(None)
 
     def filter_items(self, prims: Iterable["Usd.Prim"]) -> list["Usd.Prim"]:
-        filtered_prims = []
-        for prim in prims:
-            is_valid = True
-            for ignore_prim_path in self.ignore_prim_paths:
-                if str(prim.GetPath()).startswith(ignore_prim_path):
-                    is_valid = False
-                    break
-            if not is_valid:
-                continue
-            filtered_prims.append(prim)
-        return filtered_prims
+        # Only rebuild the trie when the ignored paths change
+        ignore_prim_paths_key = frozenset(self.ignore_prim_paths)
+        if ignore_prim_paths_key != self._ignore_prim_paths_key:
+            self._ignore_prim_paths_trie = _PrimPathTrie(ignore_prim_paths_key)
+            self._ignore_prim_paths_key = ignore_prim_paths_key
+        return self._ignore_prim_paths_trie.filter_uncovered(prims, get_path=lambda prim: prim.GetPath())
 
     def build_ui(self):  # noqa PLW0221
         with ui.HStack(spacing=ui.Pixel(8)):
@@ -18,16 +18,20 @@
 from typing import TYPE_CHECKING
 
 from omni.flux.utils.common import get_omni_prims as _get_omni_prims
+from omni.flux.utils.common.prim_paths import PrimPathTrie as _PrimPathTrie
 
 from .base import ToggleableUSDFilterPlugin as _ToggleableUSDFilterPlugin
 
 if TYPE_CHECKING:
     from pxr import Usd
 
+_OMNI_PRIM_PATHS = _PrimPathTrie(_get_omni_prims())
+
 
 class OmniPrimsFilterPlugin(_ToggleableUSDFilterPlugin):
     display_name: str = "Omniverse Prims"
     tooltip: str = "Filter out Omniverse prims"
 
     def _filter_predicate(self, prim: "Usd.Prim") -> bool:
-        return prim.GetPath() in _get_omni_prims()
+        # Only the Omniverse prims themselves are filtered, not their descendants
+        return prim.GetPath() in _OMNI_PRIM_PATHS
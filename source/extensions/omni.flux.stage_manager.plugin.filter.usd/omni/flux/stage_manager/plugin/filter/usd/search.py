@@ -15,26 +15,213 @@
 * limitations under the License.
 """
 
-from typing import TYPE_CHECKING, Iterable
+from asyncio import Future, ensure_future
+from typing import Iterable
 
+import omni.kit.app
+import omni.usd
 from omni import ui
+from omni.flux.utils.common import EventSubscription as _EventSubscription
+from pxr import Sdf, Tf, Usd
+from pydantic import Field, PrivateAttr
 
 from .base import StageManagerUSDFilterPlugin as _StageManagerUSDFilterPlugin
-
-if TYPE_CHECKING:
-    from pxr import Usd
+from .search_index import PrimSearchIndex as _PrimSearchIndex
+from .search_index import SearchMode
 
 
 class SearchFilterPlugin(_StageManagerUSDFilterPlugin):
-    # TODO StageManager: Build proper plugin
-
     display_name: str = "Search"
     tooltip: str = "Search through the list of prims"
 
+    search_mode: SearchMode = Field(
+        SearchMode.SUBSTRING,
+        description="How the query should match the prim terms: anywhere, at the start or using `*` and `?` wildcards",
+    )
+    include_references: bool = Field(False, description="Whether the referenced asset paths should be searchable")
+    include_texture_paths: bool = Field(
+        False, description="Whether the asset paths of the prim attributes, such as texture paths, should be searchable"
+    )
+    page_size: int = Field(500, description="The number of results displayed before having to show more results", gt=0)
+
+    _SEARCH_MODE_LABELS: dict = PrivateAttr(
+        {
+            SearchMode.SUBSTRING: "Contains",
+            SearchMode.PREFIX: "Starts With",
+            SearchMode.GLOB: "Wildcards",
+        }
+    )
+    _COMBO_BOX_WIDTH: int = PrivateAttr(100)
+
+    _query: str = PrivateAttr("")
+    _page_count: int = PrivateAttr(1)
+    _index: _PrimSearchIndex | None = PrivateAttr(None)
+    _usd_listener = PrivateAttr(None)
+    _listened_stage: Usd.Stage | None = PrivateAttr(None)
+    _visible_paths_key: tuple | None = PrivateAttr(None)
+    _visible_paths: set[Sdf.Path] = PrivateAttr(set())
+    _has_more_results: bool = PrivateAttr(False)
+    _refresh_task: Future | None = PrivateAttr(None)
+
+    _string_field: ui.StringField | None = PrivateAttr(None)
+    _mode_combobox: ui.ComboBox | None = PrivateAttr(None)
+    _show_more_button: ui.Button | None = PrivateAttr(None)
+    _value_changed_sub: _EventSubscription | None = PrivateAttr(None)
+
     def filter_items(self, items: Iterable["Usd.Prim"]) -> list["Usd.Prim"]:
-        return list(items)
+        if not self._query:
+            return list(items)
+
+        stage = omni.usd.get_context(self.context_name).get_stage()
+        if not stage:
+            return list(items)
+
+        visible_paths = self._get_visible_paths(stage)
+        return [item for item in items if item.GetPath() in visible_paths]
 
     def build_ui(self):  # noqa PLW0221
         with ui.HStack(spacing=ui.Pixel(8)):
             ui.Label(self.display_name, width=0)
-            ui.StringField(width=ui.Pixel(300), height=ui.Pixel(24))
+            self._string_field = ui.StringField(width=ui.Pixel(300), height=ui.Pixel(24))
+            self._mode_combobox = ui.ComboBox(
+                list(self._SEARCH_MODE_LABELS.keys()).index(self.search_mode),
+                *self._SEARCH_MODE_LABELS.values(),
+                width=ui.Pixel(self._COMBO_BOX_WIDTH),
+            )
+            self._show_more_button = ui.Button(
+                "Show More Results",
+                width=0,
+                height=ui.Pixel(24),
+                clicked_fn=self._on_show_more_clicked,
+                visible=self._has_more_results,
+            )
+
+        self._string_field.model.set_value(self._query)
+        self._value_changed_sub = self._string_field.model.subscribe_value_changed_fn(self._on_query_changed)
+        self._mode_combobox.model.add_item_changed_fn(self._on_search_mode_changed)
+
+    def destroy(self):
+        self._stop_listening()
+
+    def _stop_listening(self):
+        """
+        Stop updating the search index from the stage changes. The index is reset and will be rebuilt on the next
+        search.
+        """
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._usd_listener:
+            self._usd_listener.Revoke()
+            self._usd_listener = None
+        self._listened_stage = None
+        if self._index:
+            self._index.reset()
+
+    def _get_index(self, stage: Usd.Stage) -> _PrimSearchIndex:
+        """
+        Get the search index and make sure it listens to the given stage. The stage is only listened to while a query
+        is active.
+
+        Args:
+            stage: The stage to search
+
+        Returns:
+            The search index
+        """
+        if self._index is None:
+            self._index = _PrimSearchIndex(
+                include_references=self.include_references, include_texture_paths=self.include_texture_paths
+            )
+        else:
+            self._index.set_options(self.include_references, self.include_texture_paths)
+
+        if stage != self._listened_stage:
+            if self._usd_listener:
+                self._usd_listener.Revoke()
+            self._index.reset()
+            self._listened_stage = stage
+            self._usd_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_usd_event, stage)
+
+        return self._index
+
+    def _get_visible_paths(self, stage: Usd.Stage) -> set[Sdf.Path]:
+        """
+        Get the paths of the displayed results and of their ancestors, so the results can be displayed in a tree.
+
+        The paths are cached until the query, the displayed page count or the indexed terms change.
+
+        Args:
+            stage: The stage to search
+
+        Returns:
+            The paths of the prims to keep
+        """
+        index = self._get_index(stage)
+        results = index.search(stage, self._query, self.search_mode)
+
+        visible_paths_key = (self._query, self.search_mode, self._page_count, index.version)
+        if visible_paths_key == self._visible_paths_key:
+            return self._visible_paths
+
+        max_results = self.page_size * self._page_count
+        visible_paths = set()
+        for path in results[:max_results]:
+            # Stop at the first ancestor already added: all its own ancestors were added with it
+            while path not in visible_paths and not path.IsAbsoluteRootPath():
+                visible_paths.add(path)
+                path = path.GetParentPath()
+
+        self._visible_paths = visible_paths
+        self._visible_paths_key = visible_paths_key
+        self._set_has_more_results(len(results) > max_results)
+
+        return self._visible_paths
+
+    def _set_has_more_results(self, value: bool):
+        self._has_more_results = value
+        if self._show_more_button:
+            self._show_more_button.visible = value
+
+    def _on_usd_event(self, notice: Usd.Notice.ObjectsChanged, _: Usd.Stage):
+        if not self._index:
+            return
+        self._index.on_objects_changed(notice)
+        if self._query and self._index.has_pending_changes:
+            # Use a deferred method to combine all the changes caught within 1 frame into a single search
+            if self._refresh_task:
+                self._refresh_task.cancel()
+            self._refresh_task = ensure_future(self._refresh_results_deferred())
+
+    @omni.usd.handle_exception
+    async def _refresh_results_deferred(self):
+        await omni.kit.app.get_app().next_update_async()
+
+        stage = omni.usd.get_context(self.context_name).get_stage()
+        if not stage or not self._query:
+            return
+
+        # The tree only needs to be filtered again if the changes affected the displayed results
+        previous_paths = self._visible_paths
+        if self._get_visible_paths(stage) != previous_paths:
+            self._filter_items_changed()
+
+    def _on_query_changed(self, model: ui.AbstractValueModel):
+        self._query = model.get_value_as_string().strip()
+        self._page_count = 1
+        # Without a query, nothing is filtered, so the index doesn't need to be updated
+        if not self._query:
+            self._stop_listening()
+        self._filter_items_changed()
+
+    def _on_search_mode_changed(self, model: ui.AbstractItemModel, _):
+        selected_index = model.get_item_value_model().get_value_as_int()
+        self.search_mode = list(self._SEARCH_MODE_LABELS.keys())[selected_index]
+        self._page_count = 1
+
+        if self._query:
+            self._filter_items_changed()
+
+    def _on_show_more_clicked(self):
+        self._page_count += 1
+        self._filter_items_changed()
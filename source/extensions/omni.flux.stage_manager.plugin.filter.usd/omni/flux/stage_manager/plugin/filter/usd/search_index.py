@@ -0,0 +1,224 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import re
+from enum import Enum
+from typing import Callable, Iterable
+
+from pxr import Sdf, Usd
+
+
+class SearchMode(Enum):
+    SUBSTRING = "substring"
+    PREFIX = "prefix"
+    GLOB = "glob"
+
+
+class PrimSearchIndex:
+    def __init__(self, include_references: bool = False, include_texture_paths: bool = False):
+        """
+        Index of the searchable terms of every prim of a stage.
+
+        The terms of a prim are its name, path & type, and optionally the asset paths it references and the asset paths
+        of its attributes. The index is built on the first search and is then updated from the USD notices, so only the
+        changed prims are indexed again.
+
+        Args:
+            include_references: Whether the referenced asset paths should be searchable
+            include_texture_paths: Whether the asset paths of the attributes, such as texture paths, should be
+                                   searchable
+        """
+        self._include_references = include_references
+        self._include_texture_paths = include_texture_paths
+
+        self._stage: Usd.Stage | None = None
+        self._built = False
+        self._version = 0
+        self._pending_paths: set[Sdf.Path] = set()
+
+        # The terms of a prim are lower case lines, so a single string operation can search all of them
+        self._terms: dict[Sdf.Path, str] = {}
+        self._children: dict[Sdf.Path, set[Sdf.Path]] = {}
+
+        self._last_search_key: tuple | None = None
+        self._last_search_results: list[Sdf.Path] = []
+
+    @property
+    def version(self) -> int:
+        """
+        A number incremented every time the indexed terms change
+        """
+        return self._version
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """
+        Whether changes were received since the last search
+        """
+        return not self._built or bool(self._pending_paths)
+
+    def set_options(self, include_references: bool, include_texture_paths: bool):
+        """
+        Set the indexed terms. The index will be rebuilt if the options changed.
+
+        Args:
+            include_references: Whether the referenced asset paths should be searchable
+            include_texture_paths: Whether the asset paths of the attributes, such as texture paths, should be
+                                   searchable
+        """
+        if (include_references, include_texture_paths) == (self._include_references, self._include_texture_paths):
+            return
+        self._include_references = include_references
+        self._include_texture_paths = include_texture_paths
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the index. It will be rebuilt on the next search.
+        """
+        self._stage = None
+        self._built = False
+        self._version += 1
+        self._pending_paths.clear()
+        self._terms.clear()
+        self._children.clear()
+        self._last_search_key = None
+        self._last_search_results = []
+
+    def on_objects_changed(self, notice: Usd.Notice.ObjectsChanged):
+        """
+        Queue the prims changed by a USD notice to be indexed again on the next search.
+
+        Args:
+            notice: The notice sent by the indexed stage
+        """
+        if not self._built:
+            return
+        for path in notice.GetResyncedPaths():
+            if path.IsAbsoluteRootPath():
+                self.reset()
+                return
+            # Only the prim terms are affected by the resynced properties
+            if path.IsPropertyPath() and not self._include_texture_paths:
+                continue
+            self._pending_paths.add(path.GetPrimPath() if path.IsPropertyPath() else path)
+        # Only the attribute values can be searched for the changed info
+        if self._include_texture_paths:
+            for path in notice.GetChangedInfoOnlyPaths():
+                if path.IsPropertyPath():
+                    self._pending_paths.add(path.GetPrimPath())
+
+    def search(self, stage: Usd.Stage, query: str, mode: SearchMode) -> list[Sdf.Path]:
+        """
+        Find the prims with a term matching the query. The search is case-insensitive.
+
+        Args:
+            stage: The stage to search. The index is rebuilt if the stage is not the indexed stage.
+            query: The text to search for
+            mode: How the query should match the terms: anywhere in a term, at the start of a term, or the whole term
+                  using `*` and `?` wildcards
+
+        Returns:
+            The paths of the matching prims
+        """
+        self._update(stage)
+
+        search_key = (query, mode, self._version)
+        if search_key == self._last_search_key:
+            return self._last_search_results
+
+        matcher = self._get_matcher(query.lower(), mode)
+        self._last_search_results = [path for path, terms in self._terms.items() if matcher(terms)]
+        self._last_search_key = search_key
+        return self._last_search_results
+
+    @staticmethod
+    def _get_matcher(query: str, mode: SearchMode) -> Callable[[str], bool]:
+        match mode:
+            case SearchMode.PREFIX:
+                line_query = f"\n{query}"
+                return lambda terms: terms.startswith(query) or line_query in terms
+            case SearchMode.GLOB:
+                pattern = "".join(".*" if char == "*" else "." if char == "?" else re.escape(char) for char in query)
+                fullmatch = re.compile(pattern, re.DOTALL).fullmatch
+                # Most prims don't contain the literal parts of the pattern, so only the remaining ones are split
+                literals = [literal for literal in re.split(r"[*?]", query) if literal]
+                return lambda terms: all(literal in terms for literal in literals) and any(
+                    map(fullmatch, terms.split("\n"))
+                )
+        return lambda terms: query in terms
+
+    def _update(self, stage: Usd.Stage):
+        if stage != self._stage:
+            self.reset()
+            self._stage = stage
+        if not self._built:
+            self._add_prims(Usd.PrimRange(stage.GetPseudoRoot(), Usd.PrimAllPrimsPredicate))
+            self._built = True
+            self._version += 1
+            return
+        if not self._pending_paths:
+            return
+        pending_paths = sorted(self._pending_paths, key=str)
+        self._pending_paths.clear()
+        # Descendants are sorted right after their ancestor
+        root_paths = []
+        for path in pending_paths:
+            if root_paths and path.HasPrefix(root_paths[-1]):
+                continue
+            root_paths.append(path)
+        for path in root_paths:
+            self._remove_prims(path)
+            prim = stage.GetPrimAtPath(path)
+            if prim.IsValid():
+                self._add_prims(Usd.PrimRange(prim, Usd.PrimAllPrimsPredicate))
+        self._version += 1
+
+    def _add_prims(self, prims: Iterable[Usd.Prim]):
+        for prim in prims:
+            if prim.IsPseudoRoot():
+                continue
+            path = prim.GetPath()
+            self._terms[path] = self._get_terms(prim)
+            self._children.setdefault(path.GetParentPath(), set()).add(path)
+
+    def _remove_prims(self, path: Sdf.Path):
+        parent_children = self._children.get(path.GetParentPath())
+        if parent_children is not None:
+            parent_children.discard(path)
+        paths = [path]
+        while paths:
+            current_path = paths.pop()
+            self._terms.pop(current_path, None)
+            paths.extend(self._children.pop(current_path, ()))
+
+    def _get_terms(self, prim: Usd.Prim) -> str:
+        path = prim.GetPath()
+        terms = [path.name, str(path), str(prim.GetTypeName())]
+        if self._include_references:
+            for prim_spec in prim.GetPrimStack():
+                for reference in prim_spec.referenceList.GetAddedOrExplicitItems():
+                    if reference.assetPath:
+                        terms.append(reference.assetPath)
+        if self._include_texture_paths:
+            for attribute in prim.GetAttributes():
+                if attribute.GetTypeName() != Sdf.ValueTypeNames.Asset:
+                    continue
+                value = attribute.Get()
+                if value and value.path:
+                    terms.append(value.path)
+        return "\n".join(terms).lower()
@@ -0,0 +1,51 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import omni.kit.test
+from omni.flux.stage_manager.plugin.filter.usd.omni_prims import OmniPrimsFilterPlugin
+from pxr import Usd
+
+
+class TestOmniPrimsFilterPlugin(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.stage = Usd.Stage.CreateInMemory()
+        self.stage.DefinePrim("/OmniKit_Viewport_LightRig", "Xform")
+        self.stage.DefinePrim("/OmniKit_Viewport_LightRig/Lights", "Scope")
+        self.stage.DefinePrim("/World", "Xform")
+
+    async def tearDown(self):
+        self.stage = None
+
+    async def test_filter_items_include_results_should_only_keep_omni_prims(self):
+        # Arrange
+        plugin = OmniPrimsFilterPlugin(include_results=True)
+
+        # Act
+        value = plugin.filter_items(self.stage.Traverse())
+
+        # Assert
+        self.assertListEqual(["/OmniKit_Viewport_LightRig"], [str(prim.GetPath()) for prim in value])
+
+    async def test_filter_items_exclude_results_should_keep_omni_prim_descendants(self):
+        # Arrange
+        plugin = OmniPrimsFilterPlugin(include_results=False)
+
+        # Act
+        value = plugin.filter_items(self.stage.Traverse())
+
+        # Assert
+        self.assertListEqual(["/OmniKit_Viewport_LightRig/Lights", "/World"], [str(prim.GetPath()) for prim in value])
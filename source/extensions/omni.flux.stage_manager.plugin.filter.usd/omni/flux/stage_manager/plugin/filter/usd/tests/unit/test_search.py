@@ -0,0 +1,91 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from unittest.mock import Mock, patch
+
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+from omni.flux.stage_manager.plugin.filter.usd.search import SearchFilterPlugin
+
+
+class TestSearchFilterPlugin(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        await omni.usd.get_context().new_stage_async()
+        self.stage = omni.usd.get_context().get_stage()
+        self.stage.DefinePrim("/World", "Xform")
+        self.stage.DefinePrim("/World/Cube", "Mesh")
+        self.stage.DefinePrim("/World/Sphere", "Sphere")
+
+    async def tearDown(self):
+        await omni.usd.get_context().close_stage_async()
+        self.stage = None
+
+    def _set_query(self, plugin: SearchFilterPlugin, query: str):
+        model = Mock()
+        model.get_value_as_string.return_value = query
+        plugin._on_query_changed(model)  # noqa PLW0212
+
+    async def test_filter_items_should_keep_matching_prims_and_ancestors(self):
+        # Arrange
+        plugin = SearchFilterPlugin()
+        self._set_query(plugin, "cube")
+
+        # Act
+        value = plugin.filter_items(self.stage.Traverse())
+
+        # Assert
+        self.assertListEqual(["/World", "/World/Cube"], [str(prim.GetPath()) for prim in value])
+
+        plugin.destroy()
+
+    async def test_clear_query_should_stop_listening_to_stage_changes(self):
+        # Arrange
+        plugin = SearchFilterPlugin()
+        self._set_query(plugin, "cube")
+        plugin.filter_items(self.stage.Traverse())
+
+        # Act
+        self._set_query(plugin, "")
+
+        with patch.object(SearchFilterPlugin, "_filter_items_changed") as changed_mock:
+            self.stage.DefinePrim("/World/Cube_01", "Mesh")
+            for _ in range(2):
+                await omni.kit.app.get_app().next_update_async()
+
+        # Assert
+        self.assertIsNone(plugin._usd_listener)  # noqa PLW0212
+        self.assertIsNone(plugin._refresh_task)  # noqa PLW0212
+        self.assertEqual(0, changed_mock.call_count)
+
+    async def test_destroy_should_cancel_pending_refresh(self):
+        # Arrange
+        plugin = SearchFilterPlugin()
+        self._set_query(plugin, "cube")
+        plugin.filter_items(self.stage.Traverse())
+        self.stage.DefinePrim("/World/Cube_01", "Mesh")
+
+        # Act
+        plugin.destroy()
+
+        with patch.object(SearchFilterPlugin, "_filter_items_changed") as changed_mock:
+            for _ in range(2):
+                await omni.kit.app.get_app().next_update_async()
+
+        # Assert
+        self.assertIsNone(plugin._usd_listener)  # noqa PLW0212
+        self.assertEqual(0, changed_mock.call_count)
@@ -0,0 +1,128 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import omni.kit.test
+from omni.flux.stage_manager.plugin.filter.usd.search_index import PrimSearchIndex, SearchMode
+from pxr import Sdf, Tf, Usd
+
+
+class TestPrimSearchIndex(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.stage = Usd.Stage.CreateInMemory()
+        self.stage.DefinePrim("/World", "Xform")
+        self.stage.DefinePrim("/World/Cube", "Mesh")
+        self.stage.DefinePrim("/World/Cube/Child", "Scope")
+        self.stage.DefinePrim("/World/MyCube", "Xform")
+
+        self.index = PrimSearchIndex()
+        self.listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, self.stage)
+
+    async def tearDown(self):
+        self.listener.Revoke()
+        self.listener = None
+        self.index = None
+        self.stage = None
+
+    def _on_objects_changed(self, notice, _sender):
+        self.index.on_objects_changed(notice)
+
+    async def test_search_prefix_should_match_start_of_terms(self):
+        # Arrange
+        pass
+
+        # Act
+        name_results = self.index.search(self.stage, "CUBE", SearchMode.PREFIX)
+        type_results = self.index.search(self.stage, "mes", SearchMode.PREFIX)
+        path_results = self.index.search(self.stage, "/world/my", SearchMode.PREFIX)
+
+        # Assert
+        self.assertListEqual([Sdf.Path("/World/Cube")], name_results)
+        self.assertListEqual([Sdf.Path("/World/Cube")], type_results)
+        self.assertListEqual([Sdf.Path("/World/MyCube")], path_results)
+
+    async def test_search_substring_should_match_anywhere_in_terms(self):
+        # Arrange
+        pass
+
+        # Act
+        results = self.index.search(self.stage, "Cube", SearchMode.SUBSTRING)
+
+        # Assert
+        self.assertListEqual(
+            [Sdf.Path("/World/Cube"), Sdf.Path("/World/Cube/Child"), Sdf.Path("/World/MyCube")], results
+        )
+
+    async def test_search_glob_should_match_whole_terms(self):
+        # Arrange
+        pass
+
+        # Act
+        suffix_results = self.index.search(self.stage, "*cube", SearchMode.GLOB)
+        prefix_results = self.index.search(self.stage, "my*", SearchMode.GLOB)
+        single_char_results = self.index.search(self.stage, "?ube", SearchMode.GLOB)
+        literal_results = self.index.search(self.stage, "cub", SearchMode.GLOB)
+
+        # Assert
+        self.assertListEqual([Sdf.Path("/World/Cube"), Sdf.Path("/World/MyCube")], suffix_results)
+        self.assertListEqual([Sdf.Path("/World/MyCube")], prefix_results)
+        self.assertListEqual([Sdf.Path("/World/Cube")], single_char_results)
+        self.assertListEqual([], literal_results)
+
+    async def test_search_resynced_prim_should_index_added_prims(self):
+        # Arrange
+        self.index.search(self.stage, "sphere", SearchMode.SUBSTRING)
+        version = self.index.version
+
+        # Act
+        self.stage.DefinePrim("/World/Cube/Sphere", "Sphere")
+        has_pending_changes = self.index.has_pending_changes
+        results = self.index.search(self.stage, "sphere", SearchMode.SUBSTRING)
+
+        # Assert
+        self.assertTrue(has_pending_changes)
+        self.assertFalse(self.index.has_pending_changes)
+        self.assertGreater(self.index.version, version)
+        self.assertListEqual([Sdf.Path("/World/Cube/Sphere")], results)
+
+    async def test_search_removed_prim_should_remove_prim_and_descendants(self):
+        # Arrange
+        self.index.search(self.stage, "cube", SearchMode.SUBSTRING)
+
+        # Act
+        self.stage.RemovePrim("/World/Cube")
+        results = self.index.search(self.stage, "cube", SearchMode.SUBSTRING)
+        child_results = self.index.search(self.stage, "child", SearchMode.SUBSTRING)
+
+        # Assert
+        self.assertListEqual([Sdf.Path("/World/MyCube")], results)
+        self.assertListEqual([], child_results)
+
+    async def test_search_renamed_prim_should_index_new_paths(self):
+        # Arrange
+        self.index.search(self.stage, "cube", SearchMode.SUBSTRING)
+
+        edit = Sdf.BatchNamespaceEdit()
+        edit.Add(Sdf.NamespaceEdit.Rename("/World/Cube", "Box"))
+
+        # Act
+        self.assertTrue(self.stage.GetRootLayer().Apply(edit))
+        cube_results = self.index.search(self.stage, "cube", SearchMode.SUBSTRING)
+        box_results = self.index.search(self.stage, "box", SearchMode.SUBSTRING)
+
+        # Assert
+        self.assertListEqual([Sdf.Path("/World/MyCube")], cube_results)
+        self.assertListEqual([Sdf.Path("/World/Box"), Sdf.Path("/World/Box/Child")], box_results)
@@ -15,11 +15,15 @@
 * limitations under the License.
 """
 
-import omni.kit.app
+from typing import TYPE_CHECKING
+
 from omni.flux.stage_manager.factory.plugins import StageManagerFilterPlugin as _StageManagerFilterPlugin
 
 from .base import StageManagerUSDInteractionPlugin as _StageManagerUSDInteractionPlugin
 
+if TYPE_CHECKING:
+    from pxr import Usd
+
 
 class AllLightsInteractionPlugin(_StageManagerUSDInteractionPlugin):
     display_name: str = "Lights"
@@ -43,22 +47,12 @@ class AllLightsInteractionPlugin(_StageManagerUSDInteractionPlugin):
         "IsCaptureStateWidgetPlugin",
     ]
 
-    async def _update_context_items_deferred(self):
-        await omni.kit.app.get_app().next_update_async()
-
-        if not self._is_active:
-            return
-
-        self._set_context_name()
-
+    def _get_context_items(self) -> list["Usd.Prim"]:
         # Only filter the items after getting all the children
-        context_items = self._filter_context_items(
+        return self._filter_context_items(
             self._traverse_children_recursive(self._context.get_items(), filter_prims=False)
         )
 
-        self.tree.model.context_items = context_items
-        self.tree.model.refresh()
-
     class Config(_StageManagerUSDInteractionPlugin.Config):
         fields = {
             **_StageManagerUSDInteractionPlugin.Config.fields,
@@ -24,12 +24,16 @@ import omni.kit.usd.layers as _layers
 import omni.usd
 from omni.flux.stage_manager.factory import StageManagerDataTypes as _StageManagerDataTypes
 from omni.flux.stage_manager.factory.plugins import StageManagerInteractionPlugin as _StageManagerInteractionPlugin
+from omni.flux.stage_manager.plugin.tree.usd.base import StageManagerUSDTreeModel as _StageManagerUSDTreeModel
 from omni.flux.utils.common import EventSubscription as _EventSubscription
 from omni.flux.utils.common.decorators import ignore_function_decorator as _ignore_function_decorator
+from omni.flux.utils.common.prim_paths import PrimPathTrie as _PrimPathTrie
 from omni.flux.utils.common.utils import get_omni_prims as _get_omni_prims
-from pxr import Usd
+from pxr import Sdf, Usd
 from pydantic import Field, PrivateAttr
 
+_OMNI_PRIM_PATHS = _PrimPathTrie(_get_omni_prims())
+
 
 class StageManagerUSDInteractionPlugin(_StageManagerInteractionPlugin, abc.ABC):
     synchronize_selection: bool = Field(True, description="Synchronize the USD selection between the stage and the UI")
@@ -40,6 +44,9 @@ class StageManagerUSDInteractionPlugin(_StageManagerInteractionPlugin, abc.ABC):
     _set_active_task: Future | None = PrivateAttr(None)
     _update_context_task: Future | None = PrivateAttr(None)
     _items_changed_task: Future | None = PrivateAttr(None)
+    _full_refresh_required: bool = PrivateAttr(False)
+    _pending_resynced_paths: set[Sdf.Path] = PrivateAttr(set())
+    _pending_changed_info_paths: set[Sdf.Path] = PrivateAttr(set())
 
     @classmethod
     @property
@@ -106,22 +113,34 @@ class StageManagerUSDInteractionPlugin(_StageManagerInteractionPlugin, abc.ABC):
             self._update_context_items()
 
     def _on_usd_event_occurred(self, notice: Usd.Notice.ObjectsChanged):
-        refresh = False
-        for path in notice.GetChangedInfoOnlyPaths() + notice.GetResyncedPaths():
-            # Don't refresh the stage manager when Omni Prims are updated
-            if any(path.HasPrefix(omni_path) for omni_path in _get_omni_prims()):
-                continue
-            # Don't refresh the stage manager when Custom Layer Data is updated
-            if any(field == "customLayerData" for field in notice.GetChangedFields(path)):
-                continue
-            refresh = True
-
-        if not refresh:
+        def filter_paths(paths: list[Sdf.Path]) -> list[Sdf.Path]:
+            filtered_paths = []
+            for path in paths:
+                # Don't refresh the stage manager when Omni Prims are updated
+                if _OMNI_PRIM_PATHS.covers(path):
+                    continue
+                # Don't refresh the stage manager when Custom Layer Data is updated
+                if any(field == "customLayerData" for field in notice.GetChangedFields(path)):
+                    continue
+                filtered_paths.append(path)
+            return filtered_paths
+
+        resynced_paths = filter_paths(notice.GetResyncedPaths())
+        changed_info_paths = filter_paths(notice.GetChangedInfoOnlyPaths())
+
+        if not resynced_paths and not changed_info_paths:
             return
 
-        self._update_context_items()
+        # Only the tree items affected by the changes will be updated
+        self._pending_resynced_paths.update(resynced_paths)
+        self._pending_changed_info_paths.update(changed_info_paths)
+        self._schedule_update_context_items()
 
     def _update_context_items(self):
+        self._full_refresh_required = True
+        self._schedule_update_context_items()
+
+    def _schedule_update_context_items(self):
         # Use a deferred method to combine all the updates caught within 1 frame into a single call
         if self._update_context_task:
             self._update_context_task.cancel()
@@ -136,14 +155,56 @@ class StageManagerUSDInteractionPlugin(_StageManagerInteractionPlugin, abc.ABC):
 
         self._set_context_name()
 
+        full_refresh_required = self._full_refresh_required
+        resynced_paths = list(self._pending_resynced_paths)
+        changed_info_paths = list(self._pending_changed_info_paths)
+        self._full_refresh_required = False
+        self._pending_resynced_paths.clear()
+        self._pending_changed_info_paths.clear()
+
+        context_items_updated = False
+        if not full_refresh_required:
+            # Resynced prims can add or remove context items. A recursive traversal would have to traverse the whole
+            # stage to get the updated context items, so it always uses a full refresh.
+            if resynced_paths and not self.recursive_traversal:
+                self.tree.model.context_items = self._get_context_items()
+                context_items_updated = True
+            if self._refresh_changes(resynced_paths, changed_info_paths):
+                return
+
+        # Don't gather the context items twice if the model couldn't apply the changes
+        if not context_items_updated:
+            self.tree.model.context_items = self._get_context_items()
+        self.tree.model.refresh()
+
+    def _get_context_items(self) -> list[Usd.Prim]:
+        """
+        Get the filtered context items to set in the tree model.
+
+        Returns:
+            The filtered context items
+        """
         context_items = self._context.get_items()
         if self.recursive_traversal:
-            context_items = self._traverse_children_recursive(context_items)
-        else:
-            context_items = self._filter_context_items(context_items)
+            return self._traverse_children_recursive(context_items)
+        return self._filter_context_items(context_items)
 
-        self.tree.model.context_items = context_items
-        self.tree.model.refresh()
+    def _refresh_changes(self, resynced_paths: list[Sdf.Path], changed_info_paths: list[Sdf.Path]) -> bool:
+        """
+        Update only the tree items affected by USD changes.
+
+        The tree model context items should already be up-to-date with the resynced paths.
+
+        Args:
+            resynced_paths: The resynced paths
+            changed_info_paths: The paths that only had their info changed
+
+        Returns:
+            True if the changes were applied, False if the whole tree should be refreshed
+        """
+        if resynced_paths and self.recursive_traversal:
+            return False
+        return self.tree.model.refresh_changes(resynced_paths, changed_info_paths)
 
     def _on_item_changed(self, model, item):
         # Convert `_on_item_changed` to an async method since `_update_context_items` is also async
@@ -221,21 +282,25 @@ class StageManagerUSDInteractionPlugin(_StageManagerInteractionPlugin, abc.ABC):
         if selection:
             self._item_expansion_states.clear()
 
-        def is_selected_item(selected_prim_paths, item) -> bool:
-            prim = item.data.get("prim")
-            should_select = prim and prim.GetPath() in selected_prim_paths
-
-            # Expand the selected items and their parents
-            if should_select:
-                self._item_expansion_states[hash(item)] = should_select
-                parent = item.parent
-                while parent:
-                    self._item_expansion_states[hash(parent)] = should_select
-                    parent = parent.parent
+        model = self.tree.model
+        if isinstance(model, _StageManagerUSDTreeModel):
+            # Use the model lookup table instead of going through every item
+            selected_items = model.find_items_by_paths(selection)
+        else:
+            selected_paths = set(selection)
+            selected_items = model.find_items(
+                lambda item: bool(item.data.get("prim")) and str(item.data["prim"].GetPath()) in selected_paths
+            )
 
-            return should_select
+        # Expand the selected items and their parents
+        for item in selected_items:
+            self._item_expansion_states[hash(item)] = True
+            parent = item.parent
+            while parent:
+                self._item_expansion_states[hash(parent)] = True
+                parent = parent.parent
 
-        self._tree_widget.selection = self.tree.model.find_items(lambda item: is_selected_item(selection, item))
+        self._tree_widget.selection = selected_items
         self._update_expansion_states()
 
     def _on_selection_changed(self, items):
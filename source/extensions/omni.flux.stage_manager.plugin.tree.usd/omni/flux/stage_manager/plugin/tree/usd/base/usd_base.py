@@ -16,12 +16,13 @@
 """
 
 import abc
+from typing import Hashable, Iterable
 
 from omni.flux.stage_manager.factory.plugins import StageManagerTreePlugin as _StageManagerTreePlugin
 from omni.flux.stage_manager.factory.plugins.tree_plugin import StageManagerTreeDelegate as _StageManagerTreeDelegate
 from omni.flux.stage_manager.factory.plugins.tree_plugin import StageManagerTreeItem as _StageManagerTreeItem
 from omni.flux.stage_manager.factory.plugins.tree_plugin import StageManagerTreeModel as _StageManagerTreeModel
-from pxr import Usd
+from pxr import Sdf, Usd
 from pydantic import Field
 
 
@@ -35,17 +36,184 @@ class StageManagerUSDTreeItem(_StageManagerTreeItem):
     ):
         super().__init__(display_name, tooltip=tooltip, children=children, data={"prim": prim})
 
+        # Keep the path since the prim will be expired if it's removed from the stage
+        self._path = prim.GetPath() if prim else None
+
     @property
     @abc.abstractmethod
     def default_attr(self) -> dict[str, None]:
-        return super().default_attr
+        default_attr = super().default_attr
+        default_attr.update(
+            {
+                "_path": None,
+            }
+        )
+        return default_attr
+
+    @property
+    def path(self) -> Sdf.Path | None:
+        """
+        The path of the prim associated with the item. None for items without a prim
+        """
+        return self._path
+
+    def _get_key(self) -> Hashable:
+        # Avoid comparing the display names & tooltips when the item represents a prim
+        if self._path is None:
+            return super()._get_key()
+        return type(self).__name__, self._path
 
 
 class StageManagerUSDTreeModel(_StageManagerTreeModel[Usd.Prim]):
+    def __init__(self):
+        super().__init__()
+
+        self._items_by_path: dict[Sdf.Path, list[StageManagerUSDTreeItem]] | None = None
+
     @property
     @abc.abstractmethod
     def default_attr(self) -> dict[str, None]:
-        return super().default_attr
+        default_attr = super().default_attr
+        default_attr.update(
+            {
+                "_items_by_path": None,
+            }
+        )
+        return default_attr
+
+    @property
+    def items_by_path(self) -> dict[Sdf.Path, list[StageManagerUSDTreeItem]]:
+        """
+        Get a dictionary of prim paths and the items associated with each prim. Built when first requested after a
+        refresh.
+        """
+        if self._items_by_path is None:
+            self._items_by_path = {}
+            self._add_items_by_path(self._items)
+        return self._items_by_path
+
+    def find_items_by_paths(self, paths: Iterable[Sdf.Path | str]) -> list[StageManagerUSDTreeItem]:
+        """
+        Get the tree items associated with the given prim paths using the lookup table
+
+        Args:
+            paths: The prim paths to find the items for
+
+        Returns:
+            The items associated with the prim paths, in the order of the given paths
+        """
+        items_by_path = self.items_by_path
+        items = []
+        for path in paths:
+            items.extend(items_by_path.get(path if isinstance(path, Sdf.Path) else Sdf.Path(path), []))
+        return items
+
+    def refresh_changes(self, resynced_items: Iterable[Sdf.Path], changed_items: Iterable[Sdf.Path]) -> bool:
+        """
+        Update only the items affected by a USD notice instead of refreshing the whole model.
+
+        Resynced paths are only supported by models that override `_refresh_resynced_paths`. Items of prims with
+        changed info, and of their descendants, only get an item changed event since their structure didn't change.
+
+        Args:
+            resynced_items: The resynced paths
+            changed_items: The paths that only had their info changed
+
+        Returns:
+            True if the changes were applied, False if the model should be refreshed
+        """
+        resynced_items = list(resynced_items)
+        changed_prim_paths = {path.GetPrimPath() for path in changed_items}
+        # Resynced properties don't change the structure of the tree
+        changed_prim_paths.update(path.GetPrimPath() for path in resynced_items if path.IsPropertyPath())
+
+        resynced_paths = self._get_top_most_paths(path for path in resynced_items if not path.IsPropertyPath())
+        if resynced_paths and not self._refresh_resynced_paths(resynced_paths):
+            return False
+
+        if not changed_prim_paths:
+            return True
+
+        items_by_path = self.items_by_path
+        changed_items_ids = set()
+        for prim_path in self._get_top_most_paths(changed_prim_paths):
+            path_items = items_by_path.get(prim_path, [])
+            prim = path_items[0].data.get("prim") if path_items else None
+            if prim and prim.IsValid() and not prim.GetAllChildren():
+                affected_paths = [prim_path]
+            else:
+                # Inherited values such as the visibility can change for all the descendants
+                affected_paths = [path for path in items_by_path if path.HasPrefix(prim_path)]
+            for path in affected_paths:
+                for item in items_by_path[path]:
+                    if id(item) in changed_items_ids:
+                        continue
+                    changed_items_ids.add(id(item))
+                    self._item_changed(item)
+        return True
+
+    def _refresh_resynced_paths(self, paths: list[Sdf.Path]) -> bool:
+        """
+        Rebuild the items affected by the given resynced paths. Not supported by default.
+
+        Args:
+            paths: The top-most resynced paths. Paths are never descendants of each other.
+
+        Returns:
+            True if the items were rebuilt, False if the model should be refreshed
+        """
+        return False
+
+    def _item_changed(self, item: StageManagerUSDTreeItem | None):
+        # The whole model changed, so the lookup table should be rebuilt
+        if item is None:
+            self._items_by_path = None
+        super()._item_changed(item)
+
+    def _add_items_by_path(self, items: Iterable[StageManagerUSDTreeItem]):
+        """
+        Add the given items and their children to the lookup table, if it was built
+        """
+        if self._items_by_path is None:
+            return
+        for item in self._iter_items_recursive(items):
+            if item.path is None:
+                continue
+            self._items_by_path.setdefault(item.path, []).append(item)
+
+    def _remove_items_by_path(self, items: Iterable[StageManagerUSDTreeItem]):
+        """
+        Remove the given items and their children from the lookup table, if it was built
+        """
+        if self._items_by_path is None:
+            return
+        for item in self._iter_items_recursive(items):
+            if item.path is None:
+                continue
+            # Items are compared by value, so compare the identity to only remove this item
+            path_items = [i for i in self._items_by_path.get(item.path, []) if i is not item]
+            if path_items:
+                self._items_by_path[item.path] = path_items
+            else:
+                self._items_by_path.pop(item.path, None)
+
+    def _iter_items_recursive(self, items: Iterable[StageManagerUSDTreeItem]) -> Iterable[StageManagerUSDTreeItem]:
+        for item in items:
+            yield item
+            yield from self._iter_items_recursive(item.children)
+
+    @staticmethod
+    def _get_top_most_paths(paths: Iterable[Sdf.Path]) -> list[Sdf.Path]:
+        """
+        Remove the paths that are descendants of other paths
+        """
+        top_most_paths = []
+        # Descendants are always sorted right after their ancestor
+        for path in sorted(set(paths), key=str):
+            if top_most_paths and path.HasPrefix(top_most_paths[-1]):
+                continue
+            top_most_paths.append(path)
+        return top_most_paths
 
 
 class StageManagerUSDTreeDelegate(_StageManagerTreeDelegate):
@@ -17,7 +17,7 @@
 
 from typing import Iterable
 
-from pxr import Usd
+from pxr import Sdf, Usd
 
 from .base import StageManagerUSDTreeDelegate as _StageManagerUSDTreeDelegate
 from .base import StageManagerUSDTreeItem as _StageManagerUSDTreeItem
@@ -51,6 +51,59 @@ class PrimGroupsModel(_StageManagerUSDTreeModel):
             items.append(PrimGroupsItem(str(prim.GetPath().name), str(prim.GetPath()), children=children, prim=prim))
         return items
 
+    def _refresh_resynced_paths(self, paths: list[Sdf.Path]) -> bool:
+        items_by_path = self.items_by_path
+        for path in paths:
+            if path.IsAbsoluteRootPath():
+                return False
+            parent_path = path.GetParentPath()
+            if parent_path.IsAbsoluteRootPath():
+                # The top-level items are built from the context items
+                parent_items = [None]
+            else:
+                # Items without a parent are built from context items that are not top-level prims
+                if any(item.parent is None for item in items_by_path.get(path, [])):
+                    return False
+                # If the parent prim has no item, it was filtered out, and so were its children
+                parent_items = items_by_path.get(parent_path, [])
+            for parent_item in parent_items:
+                self._rebuild_children(parent_item, path)
+        return True
+
+    def _rebuild_children(self, parent_item: PrimGroupsItem | None, path: Sdf.Path):
+        """
+        Update the children of an item after a prim was resynced. Only the items of the resynced prim are rebuilt, the
+        other children are kept as-is.
+
+        Args:
+            parent_item: The parent item of the resynced prim item. None for top-level items.
+            path: The resynced prim path
+        """
+        if parent_item is None:
+            siblings = self._items
+            prims = self.context_items
+        else:
+            siblings = parent_item.children
+            prims = self.filter_items(parent_item.data["prim"].GetFilteredChildren(Usd.PrimAllPrimsPredicate))
+
+        existing_items = {item.path: item for item in siblings}
+        added_items = []
+        children = []
+        for prim in prims:
+            item = existing_items.get(prim.GetPath())
+            if item is None or prim.GetPath() == path:
+                item = self._build_items_recursive([prim])[0]
+                item.parent = parent_item
+                added_items.append(item)
+            children.append(item)
+
+        kept_items = {id(item) for item in children}
+        self._remove_items_by_path([item for item in siblings if id(item) not in kept_items])
+        self._add_items_by_path(added_items)
+
+        siblings[:] = children
+        self._item_changed(parent_item)
+
 
 class PrimGroupsDelegate(_StageManagerUSDTreeDelegate):
     @property
@@ -0,0 +1,156 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["JsonIndex", "get_file_signature", "is_signature_unchanged"]
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import carb
+import carb.tokens
+
+
+def get_file_signature(path: str) -> Optional[Dict[str, int]]:
+    """
+    Get the size & modification time of a file, used to know whether the file changed without reading it
+
+    Args:
+        path: the path of the file
+
+    Returns:
+        The size & modification time of the file, or None if the path is not a local file
+    """
+    try:
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def is_signature_unchanged(entry: Optional[dict], signature: Optional[Dict[str, int]]) -> bool:
+    """
+    Check whether an index entry was stored for a file that still has the given signature
+
+    Args:
+        entry: the index entry, containing the file signature values
+        signature: the current signature of the file, as returned by `get_file_signature`
+
+    Returns:
+        True if the file didn't change since the entry was stored, False otherwise
+    """
+    if not entry or signature is None:
+        return False
+    return entry.get("size") == signature["size"] and entry.get("mtime_ns") == signature["mtime_ns"]
+
+
+class JsonIndex:
+    _SHARED_INDEXES: Dict[Tuple[type, str], "JsonIndex"] = {}
+    _SHARED_INDEXES_LOCK = threading.Lock()
+
+    def __init__(self, index_path: str, sections: Iterable[str], display_name: str = "index"):
+        """
+        A dictionary of entries stored in a JSON file, that can be shared by several processes.
+
+        The entries are grouped in sections. Saving only writes the entries changed by this instance, so the entries
+        written by other processes since the index was loaded are kept.
+
+        Args:
+            index_path: the path of the index file
+            sections: the names of the sections of the index
+            display_name: the name of the index used in the warnings
+        """
+        self._index_path = Path(index_path)
+        self._sections = list(sections)
+        self._display_name = display_name
+        self._lock = threading.Lock()
+        self._changed_entries: Dict[str, Dict[str, Optional[dict]]] = {section: {} for section in self._sections}
+        with self._lock:
+            self._entries = self._read_index()
+
+    @classmethod
+    def get_shared(cls, index_path: str) -> "JsonIndex":
+        """
+        Get the index of the given file, created once per class & file for the whole process
+
+        Args:
+            index_path: the path of the index file. Can contain tokens.
+
+        Returns:
+            The shared index
+        """
+        index_path = carb.tokens.get_tokens_interface().resolve(index_path)
+        with cls._SHARED_INDEXES_LOCK:
+            key = (cls, index_path)
+            if key not in cls._SHARED_INDEXES:
+                cls._SHARED_INDEXES[key] = cls(index_path)
+            return cls._SHARED_INDEXES[key]
+
+    def save(self):
+        """
+        Write the changes to the index file. Changes written by other processes since the index was loaded are kept.
+        """
+        with self._lock:
+            if not any(self._changed_entries.values()):
+                return
+            data = self._read_index()
+            for section, changed_entries in self._changed_entries.items():
+                for key, entry in changed_entries.items():
+                    if entry is None:
+                        data[section].pop(key, None)
+                    else:
+                        data[section][key] = entry
+                changed_entries.clear()
+            self._entries = data
+            try:
+                self._index_path.parent.mkdir(parents=True, exist_ok=True)
+                # Write a temporary file and replace the index so other processes never read a partial index
+                with tempfile.NamedTemporaryFile(
+                    "w", dir=self._index_path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+                ) as file:
+                    json.dump(data, file)
+                os.replace(file.name, self._index_path)
+            except OSError as e:
+                carb.log_warn(f"Unable to write the {self._display_name} {self._index_path}: {e}")
+
+    def _get_entry(self, section: str, key: str) -> Optional[dict]:
+        with self._lock:
+            return self._entries[section].get(key)
+
+    def _set_entry(self, section: str, key: str, entry: dict):
+        with self._lock:
+            self._entries[section][key] = entry
+            self._changed_entries[section][key] = entry
+
+    def _remove_entry(self, section: str, key: str):
+        with self._lock:
+            if self._entries[section].pop(key, None) is not None:
+                self._changed_entries[section][key] = None
+
+    def _read_index(self) -> Dict[str, Dict[str, dict]]:
+        try:
+            with open(self._index_path, encoding="utf-8") as file:
+                data = json.load(file)
+            return {section: dict(data.get(section, {})) for section in self._sections}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            carb.log_warn(f"Unable to read the {self._display_name} {self._index_path}: {e}")
+        return {section: {} for section in self._sections}
@@ -0,0 +1,160 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["PrimPathTrie"]
+
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TypeVar
+
+if TYPE_CHECKING:
+    from pxr import Sdf
+
+T = TypeVar("T")
+
+_END = ""  # A prim name can't be empty, so the key can't collide with a child node
+
+
+class PrimPathTrie:
+    def __init__(self, paths: Iterable["Sdf.Path | str"] = ()):
+        """
+        A set of absolute prim paths stored as a prefix tree of prim names.
+
+        Checking whether a path is inside the hierarchy of any path of the set only walks the names of the path, and
+        stops at the first name that isn't in the tree, so the cost doesn't depend on the number of paths in the set.
+
+        Args:
+            paths: The initial paths of the set
+        """
+        self._root: dict = {}
+        self._len = 0
+        for path in paths:
+            self.add(path)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __bool__(self) -> bool:
+        return self._len > 0
+
+    def __contains__(self, path: "Sdf.Path | str") -> bool:
+        node = self._root
+        for name in self._get_names(path):
+            node = node.get(name)
+            if node is None:
+                return False
+        return _END in node
+
+    def __iter__(self) -> Iterator[str]:
+        nodes = [("", self._root)]
+        while nodes:
+            path, node = nodes.pop()
+            for name, child in node.items():
+                if name == _END:
+                    yield path or "/"
+                else:
+                    nodes.append((f"{path}/{name}", child))
+
+    def add(self, path: "Sdf.Path | str"):
+        """
+        Add a path to the set. Empty paths are ignored.
+
+        Args:
+            path: An absolute prim path
+        """
+        if not str(path).strip():
+            return
+        node = self._root
+        for name in self._get_names(path):
+            node = node.setdefault(name, {})
+        if _END not in node:
+            node[_END] = True
+            self._len += 1
+
+    def discard(self, path: "Sdf.Path | str"):
+        """
+        Remove a path from the set if it is in the set. The descendant paths of the set are kept.
+
+        Args:
+            path: An absolute prim path
+        """
+        nodes = [self._root]
+        names = self._get_names(path)
+        for name in names:
+            node = nodes[-1].get(name)
+            if node is None:
+                return
+            nodes.append(node)
+        if nodes[-1].pop(_END, None) is None:
+            return
+        self._len -= 1
+        # Prune the branches that don't lead to any path anymore
+        for name, node in zip(reversed(names), reversed(nodes[:-1])):
+            if node[name]:
+                break
+            del node[name]
+
+    def clear(self):
+        """
+        Remove all the paths from the set
+        """
+        self._root.clear()
+        self._len = 0
+
+    def covers(self, path: "Sdf.Path | str") -> bool:
+        """
+        Check whether a path is in the set or is a descendant of a path in the set.
+
+        Args:
+            path: An absolute prim or property path
+
+        Returns:
+            True if the path or one of its ancestors is in the set, False otherwise
+        """
+        node = self._root
+        if _END in node:
+            return True
+        for name in self._get_names(path):
+            node = node.get(name)
+            if node is None:
+                return False
+            if _END in node:
+                return True
+        return False
+
+    def filter_uncovered(self, items: Iterable[T], get_path: Callable[[T], "Sdf.Path | str"] = None) -> list[T]:
+        """
+        Get the items that are not covered by the set.
+
+        Args:
+            items: The items to filter
+            get_path: A function returning the path of an item. The items are used as paths if not set.
+
+        Returns:
+            The items whose path is neither in the set nor a descendant of a path in the set
+        """
+        if not self._root:
+            return list(items)
+        if get_path is None:
+            return [item for item in items if not self.covers(item)]
+        return [item for item in items if not self.covers(get_path(item))]
+
+    @staticmethod
+    def _get_names(path: "Sdf.Path | str") -> list[str]:
+        # Prim names can't contain a ".", so property paths are reduced to the path of their prim
+        path = str(path).strip().split(".", 1)[0].strip("/")
+        if not path:
+            return []
+        return path.split("/")
@@ -16,8 +16,11 @@
 """
 
 from .unit.test_decorators import TestLimitRecursion
+from .unit.test_json_index import TestJsonIndex
 from .unit.test_layer_utils import TestLayerUtils
 from .unit.test_omni_url import TestOmniUrl
 from .unit.test_path_utils import TestPathUtils
+from .unit.test_prim_paths import TestPrimPathTrie
 from .unit.test_serialize import TestSerializer
 from .unit.test_symlink import TestSymlink
+from .unit.test_texture_process_scheduler import TestTextureProcessScheduler
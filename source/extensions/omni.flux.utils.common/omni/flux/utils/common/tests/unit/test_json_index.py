@@ -0,0 +1,120 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import omni.kit.test
+from omni.flux.utils.common.json_index import JsonIndex, get_file_signature, is_signature_unchanged
+
+
+class _TestIndex(JsonIndex):
+    def __init__(self, index_path: str):
+        super().__init__(index_path, ["first", "second"], display_name="test index")
+
+    def get(self, section: str, key: str):
+        return self._get_entry(section, key)
+
+    def set(self, section: str, key: str, entry: dict):
+        self._set_entry(section, key, entry)
+
+    def remove(self, section: str, key: str):
+        self._remove_entry(section, key)
+
+
+class TestJsonIndex(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index_path = str(Path(self.temp_dir.name) / "index" / "index.json")
+
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+
+    async def test_save_should_keep_entries_saved_by_other_indexes(self):
+        # Arrange
+        index = _TestIndex(self.index_path)
+        other_index = _TestIndex(self.index_path)
+        other_index.set("first", "other", {"value": 1})
+        other_index.save()
+
+        # Act
+        index.set("second", "key", {"value": 2})
+        index.save()
+
+        # Assert
+        with open(self.index_path, encoding="utf-8") as file:
+            data = json.load(file)
+        self.assertDictEqual({"first": {"other": {"value": 1}}, "second": {"key": {"value": 2}}}, data)
+        self.assertDictEqual({"value": 1}, index.get("first", "other"))
+
+    async def test_save_should_write_removed_entries(self):
+        # Arrange
+        index = _TestIndex(self.index_path)
+        index.set("first", "key", {"value": 1})
+        index.set("first", "other", {"value": 2})
+        index.save()
+
+        # Act
+        index.remove("first", "key")
+        index.save()
+
+        # Assert
+        new_index = _TestIndex(self.index_path)
+        self.assertIsNone(new_index.get("first", "key"))
+        self.assertDictEqual({"value": 2}, new_index.get("first", "other"))
+
+    async def test_init_should_ignore_invalid_index(self):
+        # Arrange
+        Path(self.index_path).parent.mkdir(parents=True)
+        Path(self.index_path).write_text("[0, 1]", encoding="utf-8")
+
+        # Act
+        index = _TestIndex(self.index_path)
+
+        # Assert
+        self.assertIsNone(index.get("first", "key"))
+
+    async def test_get_shared_should_return_one_index_per_file(self):
+        # Arrange
+        other_index_path = str(Path(self.temp_dir.name) / "other.json")
+
+        # Act
+        index = _TestIndex.get_shared(self.index_path)
+
+        # Assert
+        self.assertIs(index, _TestIndex.get_shared(self.index_path))
+        self.assertIsNot(index, _TestIndex.get_shared(other_index_path))
+        self.assertIsInstance(index, _TestIndex)
+
+    async def test_is_signature_unchanged_should_compare_size_and_modification_time(self):
+        # Arrange
+        path = Path(self.temp_dir.name) / "file.txt"
+        path.write_text("content", encoding="utf-8")
+        entry = {**get_file_signature(str(path)), "value": 1}
+
+        # Act
+        unchanged = is_signature_unchanged(entry, get_file_signature(str(path)))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        changed = is_signature_unchanged(entry, get_file_signature(str(path)))
+
+        # Assert
+        self.assertTrue(unchanged)
+        self.assertFalse(changed)
+        self.assertIsNone(get_file_signature(str(Path(self.temp_dir.name) / "missing.txt")))
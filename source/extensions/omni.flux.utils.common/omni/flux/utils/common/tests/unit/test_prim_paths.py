@@ -0,0 +1,82 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import omni.kit.test
+from omni.flux.utils.common.prim_paths import PrimPathTrie
+from pxr import Sdf
+
+
+class TestPrimPathTrie(omni.kit.test.AsyncTestCase):
+    async def test_contains_should_only_match_exact_paths(self):
+        # Arrange
+        trie = PrimPathTrie([Sdf.Path("/World/Mesh"), "/Render", "", " "])
+
+        # Act
+        values = [
+            "/World/Mesh" in trie,
+            Sdf.Path("/Render") in trie,
+            "/World" in trie,
+            "/World/Mesh/Child" in trie,
+        ]
+
+        # Assert
+        self.assertListEqual([True, True, False, False], values)
+        self.assertEqual(2, len(trie))
+        self.assertListEqual(["/Render", "/World/Mesh"], sorted(trie))
+
+    async def test_covers_should_match_paths_and_descendants(self):
+        # Arrange
+        trie = PrimPathTrie(["/World/Mesh", "/Render"])
+
+        # Act
+        values = [
+            trie.covers("/World/Mesh"),
+            trie.covers(Sdf.Path("/World/Mesh/Child")),
+            trie.covers(Sdf.Path("/World/Mesh.points")),
+            trie.covers("/World"),
+            trie.covers("/World/MeshB"),
+            trie.covers("/RenderProduct"),
+        ]
+
+        # Assert
+        self.assertListEqual([True, True, True, False, False, False], values)
+
+    async def test_discard_should_keep_other_paths(self):
+        # Arrange
+        trie = PrimPathTrie(["/World", "/World/Mesh/Child", "/Render"])
+
+        # Act
+        trie.discard("/World")
+        trie.discard("/Render")
+        trie.discard("/Unknown")
+
+        # Assert
+        self.assertEqual(1, len(trie))
+        self.assertFalse(trie.covers("/World/Other"))
+        self.assertFalse(trie.covers("/Render"))
+        self.assertTrue(trie.covers("/World/Mesh/Child/Grandchild"))
+
+    async def test_filter_uncovered_should_use_get_path(self):
+        # Arrange
+        trie = PrimPathTrie(["/World/Ignored"])
+        items = [{"path": "/World"}, {"path": "/World/Ignored/Mesh"}, {"path": "/World/Kept"}]
+
+        # Act
+        value = trie.filter_uncovered(items, get_path=lambda item: item["path"])
+
+        # Assert
+        self.assertListEqual([{"path": "/World"}, {"path": "/World/Kept"}], value)
@@ -0,0 +1,154 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import re
+import subprocess
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import omni.kit.test
+from omni.flux.utils.common.texture_process_scheduler import TextureProcessScheduler
+
+_RUN_PROCESS_PATH = "omni.flux.utils.common.texture_process_scheduler.run_texture_process"
+_BATCH_LINE_PATTERN = r'^("[^"]*"|\S+) --output ("[^"]*"|\S+)'
+
+
+class TestTextureProcessScheduler(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _create_texture(self, name: str, size: int) -> str:
+        path = Path(self.temp_dir.name) / name
+        path.write_bytes(b"0" * size)
+        return str(path)
+
+    def _fake_tool(self, calls, supports_batch: bool = True, failing_input: str = None):
+        def run(cmd, **_):
+            calls.append(cmd)
+            if cmd[1] == "--batch":
+                if not supports_batch:
+                    return subprocess.CompletedProcess(cmd, 1, "", "Unknown argument --batch")
+                for line in Path(cmd[2]).read_text(encoding="utf-8").splitlines():
+                    input_path, output_path = (
+                        value.strip('"') for value in re.match(_BATCH_LINE_PATTERN, line).groups()
+                    )
+                    if input_path != failing_input:
+                        Path(output_path).write_bytes(b"dds")
+                return subprocess.CompletedProcess(cmd, 0, "", "")
+            if cmd[1] == failing_input:
+                return subprocess.CompletedProcess(cmd, 1, "", "Invalid texture")
+            Path(cmd[3]).write_bytes(b"dds")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        return run
+
+    async def test_run_should_process_largest_textures_first(self):
+        # Arrange
+        calls = []
+        scheduler = TextureProcessScheduler("nvtt_export", max_workers=1, batch_size=1)
+        for name, size in [("small.png", 1), ("large.png", 100), ("medium.png", 10)]:
+            texture = self._create_texture(name, size)
+            scheduler.submit(texture, texture + ".dds", ["--format", "bc7"])
+
+        # Act
+        with patch(_RUN_PROCESS_PATH, side_effect=self._fake_tool(calls)):
+            results = list(scheduler.run())
+
+        # Assert
+        self.assertListEqual(["large.png", "medium.png", "small.png"], [Path(cmd[1]).name for cmd in calls])
+        self.assertListEqual(["--format", "bc7"], calls[0][-2:])
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(3, scheduler.metrics.completed)
+        self.assertEqual(0, scheduler.metrics.queued + scheduler.metrics.running)
+
+    async def test_run_should_batch_textures(self):
+        # Arrange
+        calls = []
+        scheduler = TextureProcessScheduler("nvtt_export", max_workers=2, batch_size=8)
+        for index in range(6):
+            texture = self._create_texture(f"texture_{index}.png", 1)
+            scheduler.submit(texture, texture + ".dds", [], data=index)
+
+        # Act
+        with patch(_RUN_PROCESS_PATH, side_effect=self._fake_tool(calls)):
+            results = list(scheduler.run())
+
+        # Assert
+        self.assertEqual(2, len(calls))
+        self.assertTrue(all(cmd[1] == "--batch" for cmd in calls))
+        self.assertListEqual(list(range(6)), sorted(result.job.data for result in results))
+        self.assertTrue(all(Path(result.job.output_path).exists() for result in results))
+
+    async def test_run_should_process_large_textures_alone(self):
+        # Arrange
+        calls = []
+        scheduler = TextureProcessScheduler("nvtt_export", max_workers=1, batch_size=8, batch_max_texture_size=10)
+        for name, size in [("large_0.png", 100), ("small_0.png", 1), ("large_1.png", 10), ("small_1.png", 1)]:
+            texture = self._create_texture(name, size)
+            scheduler.submit(texture, texture + ".dds", [])
+
+        # Act
+        with patch(_RUN_PROCESS_PATH, side_effect=self._fake_tool(calls)):
+            results = list(scheduler.run())
+
+        # Assert
+        self.assertListEqual(["large_0.png", "large_1.png"], [Path(cmd[1]).name for cmd in calls[:2]])
+        self.assertEqual(3, len(calls))
+        self.assertEqual("--batch", calls[2][1])
+        self.assertEqual(4, len(results))
+        self.assertTrue(all(result.success for result in results))
+
+    async def test_run_should_process_textures_one_by_one_without_batch_support(self):
+        # Arrange
+        calls = []
+        scheduler = TextureProcessScheduler("nvtt_export", max_workers=1, batch_size=4)
+        for index in range(4):
+            texture = self._create_texture(f"texture_{index}.png", 1)
+            scheduler.submit(texture, texture + ".dds", [])
+
+        # Act
+        with patch(_RUN_PROCESS_PATH, side_effect=self._fake_tool(calls, supports_batch=False)):
+            results = list(scheduler.run())
+
+        # Assert
+        self.assertEqual(1, len([cmd for cmd in calls if cmd[1] == "--batch"]))
+        self.assertEqual(5, len(calls))
+        self.assertTrue(all(result.success for result in results))
+
+    async def test_run_should_report_failed_textures(self):
+        # Arrange
+        calls = []
+        scheduler = TextureProcessScheduler("nvtt_export", max_workers=1, batch_size=4)
+        textures = [self._create_texture(f"texture_{index}.png", 1) for index in range(3)]
+        for texture in textures:
+            scheduler.submit(texture, texture + ".dds", [])
+
+        # Act
+        with patch(_RUN_PROCESS_PATH, side_effect=self._fake_tool(calls, failing_input=textures[1])):
+            results = {result.job.input_path: result for result in scheduler.run()}
+
+        # Assert
+        self.assertTrue(results[textures[0]].success)
+        self.assertFalse(results[textures[1]].success)
+        self.assertIn("Invalid texture", results[textures[1]].message)
+        self.assertTrue(results[textures[2]].success)
+        self.assertEqual(1, scheduler.metrics.failed)
+        self.assertEqual(2, scheduler.metrics.completed)
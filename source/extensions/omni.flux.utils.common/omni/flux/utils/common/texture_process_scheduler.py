@@ -0,0 +1,284 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "SchedulerMetrics",
+    "TextureJob",
+    "TextureJobResult",
+    "TextureProcessScheduler",
+    "get_default_worker_count",
+    "run_texture_process",
+]
+
+import math
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional
+
+import carb
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+DEFAULT_MEMORY_PER_WORKER = 2 * 1024**3  # a large texture conversion can use a couple of GB
+DEFAULT_BATCH_MAX_TEXTURE_SIZE = 4 * 1024**2  # the process startup is only significant for small textures
+
+_PROCESS_SLOTS: Optional[threading.BoundedSemaphore] = None
+_PROCESS_SLOTS_LOCK = threading.Lock()
+
+
+def get_default_worker_count(memory_per_worker: int = DEFAULT_MEMORY_PER_WORKER) -> int:
+    """
+    Get the number of texture processes that can run at the same time on this machine.
+
+    Args:
+        memory_per_worker: the memory a single process is expected to use
+
+    Returns:
+        The number of CPU cores, limited by the available memory when it can be queried
+    """
+    worker_count = os.cpu_count() or 1
+    if psutil is not None:
+        worker_count = min(worker_count, psutil.virtual_memory().available // max(memory_per_worker, 1))
+    return max(1, worker_count)
+
+
+def _get_process_slots() -> threading.BoundedSemaphore:
+    # Shared by all the schedulers so concurrent conversions don't oversubscribe the machine
+    global _PROCESS_SLOTS
+    with _PROCESS_SLOTS_LOCK:
+        if _PROCESS_SLOTS is None:
+            _PROCESS_SLOTS = threading.BoundedSemaphore(get_default_worker_count())
+        return _PROCESS_SLOTS
+
+
+def run_texture_process(cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+    """
+    Run a texture processing command once a process slot is available.
+
+    The number of texture processes running at the same time in the application is limited to the default worker
+    count, whichever extension starts them.
+
+    Args:
+        cmd: the command to run
+        kwargs: the `subprocess.run` arguments
+
+    Returns:
+        The completed process
+    """
+    with _get_process_slots():
+        return subprocess.run(cmd, **kwargs)  # noqa PLW1510
+
+
+@dataclass
+class TextureJob:
+    """A texture to process"""
+
+    input_path: str
+    output_path: str
+    args: List[str]
+    data: Any = None  # custom data for the caller
+    size: int = 0
+
+
+@dataclass
+class TextureJobResult:
+    """The result of a texture job"""
+
+    job: TextureJob
+    success: bool
+    message: str = ""
+
+
+@dataclass
+class SchedulerMetrics:
+    """The state of a scheduler run"""
+
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    failed: int = 0
+    start_time: float = field(default_factory=time.monotonic)
+
+    @property
+    def throughput(self) -> float:
+        """The number of textures processed per second"""
+        elapsed = time.monotonic() - self.start_time
+        return (self.completed + self.failed) / elapsed if elapsed > 0 else 0.0
+
+
+class TextureProcessScheduler:
+    def __init__(
+        self,
+        tool_path: str,
+        max_workers: Optional[int] = None,
+        batch_size: int = 8,
+        memory_per_worker: int = DEFAULT_MEMORY_PER_WORKER,
+        batch_max_texture_size: int = DEFAULT_BATCH_MAX_TEXTURE_SIZE,
+    ):
+        """
+        Run texture processing jobs with a command line tool such as `nvtt_export`.
+
+        The largest textures are processed first, so they don't end up running alone at the end of the queue. They are
+        processed one by one, so they are spread across the workers. Textures smaller than `batch_max_texture_size` are
+        grouped in batches processed by a single tool invocation with the tool `--batch` argument, to avoid paying the
+        process startup for every texture. If the tool doesn't support batches, the textures are processed one by one.
+
+        Args:
+            tool_path: the path of the tool executable
+            max_workers: the maximum number of processes to run at the same time. Sized to the cores & memory if None.
+            batch_size: the maximum number of textures processed by a single tool invocation
+            memory_per_worker: the memory a single process is expected to use, used to size the workers
+            batch_max_texture_size: the file size, in bytes, from which a texture is always processed on its own
+        """
+        self._tool_path = tool_path
+        self._max_workers = max_workers or get_default_worker_count(memory_per_worker)
+        self._batch_size = max(1, batch_size)
+        self._batch_max_texture_size = batch_max_texture_size
+        self._batching_supported = self._batch_size > 1
+        self._queue: List[TextureJob] = []
+        self._lock = threading.Lock()
+        self._metrics = SchedulerMetrics()
+
+    @property
+    def metrics(self) -> SchedulerMetrics:
+        """The state of the current or last run"""
+        return self._metrics
+
+    def submit(self, input_path: str, output_path: str, args: List[str], data: Any = None) -> TextureJob:
+        """
+        Queue a texture to process on the next run
+
+        Args:
+            input_path: the texture to process
+            output_path: the path of the processed texture
+            args: the tool arguments, without the input & output paths
+            data: custom data returned with the job result
+
+        Returns:
+            The queued job
+        """
+        try:
+            size = os.path.getsize(input_path)
+        except OSError:
+            size = 0
+        job = TextureJob(input_path=input_path, output_path=output_path, args=list(args), data=data, size=size)
+        with self._lock:
+            self._queue.append(job)
+            self._metrics.queued += 1
+        return job
+
+    def run(self) -> Iterator[TextureJobResult]:
+        """
+        Process the queued textures
+
+        Returns:
+            The job results, as they are completed
+        """
+        with self._lock:
+            jobs = sorted(self._queue, key=lambda job: job.size, reverse=True)
+            self._queue.clear()
+            self._metrics = SchedulerMetrics(queued=len(jobs))
+        if not jobs:
+            return
+
+        worker_count = min(self._max_workers, len(jobs))
+        # The jobs are sorted by size, so the large textures are all queued first as single jobs
+        large_jobs = [job for job in jobs if job.size >= self._batch_max_texture_size]
+        small_jobs = jobs[len(large_jobs) :]
+        batches = [[job] for job in large_jobs]
+        if small_jobs:
+            # Keep every worker busy before making batches bigger
+            batch_size = max(1, min(self._batch_size, math.ceil(len(small_jobs) / worker_count)))
+            batches.extend(small_jobs[i : i + batch_size] for i in range(0, len(small_jobs), batch_size))
+
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = [executor.submit(self._run_batch, batch) for batch in batches]
+            for future in as_completed(futures):
+                for result in future.result():
+                    with self._lock:
+                        self._metrics.running -= 1
+                        if result.success:
+                            self._metrics.completed += 1
+                        else:
+                            self._metrics.failed += 1
+                    yield result
+
+    def _run_batch(self, jobs: List[TextureJob]) -> List[TextureJobResult]:
+        with self._lock:
+            self._metrics.queued -= len(jobs)
+            self._metrics.running += len(jobs)
+
+        if len(jobs) > 1 and self._batching_supported:
+            # File times can be coarser than the clock, so compare the outputs with their previous state
+            previous_mtimes = [self._get_output_mtime(job) for job in jobs]
+            self._run_batch_file(jobs, previous_mtimes)
+            results = []
+            for job, previous_mtime in zip(jobs, previous_mtimes):
+                if self._is_output_updated(job, previous_mtime):
+                    results.append(TextureJobResult(job=job, success=True))
+                else:
+                    # Run the failed textures alone to get their error
+                    results.append(self._run_job(job))
+            return results
+
+        return [self._run_job(job) for job in jobs]
+
+    def _run_batch_file(self, jobs: List[TextureJob], previous_mtimes: List[Optional[int]]):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            batch_path = os.path.join(temp_dir, "batch.txt")
+            with open(batch_path, "w", encoding="utf-8") as file:
+                for job in jobs:
+                    file.write(subprocess.list2cmdline([job.input_path, "--output", job.output_path, *job.args]) + "\n")
+            result = run_texture_process(
+                [self._tool_path, "--batch", batch_path],
+                capture_output=True,
+                text=True,
+                stdin=subprocess.DEVNULL,
+            )
+        if result.returncode != 0 and not any(map(self._is_output_updated, jobs, previous_mtimes)):
+            carb.log_info(f"Texture batches are not supported by {self._tool_path}, processing textures one by one")
+            self._batching_supported = False
+
+    def _run_job(self, job: TextureJob) -> TextureJobResult:
+        cmd = [self._tool_path, job.input_path, "--output", job.output_path, *job.args]
+        result = run_texture_process(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+        if result.returncode != 0:
+            return TextureJobResult(
+                job=job,
+                success=False,
+                message=f"cmd: {cmd}\nstdout: {result.stdout}\nstderr: {result.stderr}",
+            )
+        return TextureJobResult(job=job, success=True, message=result.stdout)
+
+    @staticmethod
+    def _get_output_mtime(job: TextureJob) -> Optional[int]:
+        try:
+            return os.stat(job.output_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _is_output_updated(self, job: TextureJob, previous_mtime: Optional[int]) -> bool:
+        mtime = self._get_output_mtime(job)
+        return mtime is not None and mtime != previous_mtime
@@ -199,6 +199,9 @@ class Schema(_BaseSchema):
     resultor_plugins: Optional[List[_ResultorSchema]]
     stop_if_fix_failed: bool = False  # stop the whole process if the fix/auto fix failed
     pause_if_fix_failed: bool = True  # pause the whole process if the fix/auto fix failed
+    # Consecutive check plugins with the same parallel group run concurrently. Only use it for checks that don't modify
+    # anything read or modified by the other checks of the group.
+    parallel_group: Optional[str] = None
 
     @validator("selector_plugins", allow_reuse=True)
     def at_least_one(cls, v):  # noqa
@@ -19,8 +19,11 @@ __all__ = [
     "EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST",
     "EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT",
     "EXTS_MASS_VALIDATOR_SERVICE_PREFIX",
+    "PROGRESS_UPDATE_INTERVAL",
+    "SCHEMA_UPDATE_PREFIX",
     "ManagerCore",
     "ValidationSchema",
+    "send_schema_update_request",
     "validation_schema_json_encoder",
 ]
 
@@ -28,7 +31,10 @@ from .manager import (
     EXTS_MASS_VALIDATOR_SERVICE_PREFIX,
     EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST,
     EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT,
+    PROGRESS_UPDATE_INTERVAL,
+    SCHEMA_UPDATE_PREFIX,
     ManagerCore,
     ValidationSchema,
+    send_schema_update_request,
     validation_schema_json_encoder,
 )
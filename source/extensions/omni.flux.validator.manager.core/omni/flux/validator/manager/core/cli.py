@@ -21,6 +21,7 @@ import asyncio
 import omni.client
 import omni.kit.app
 from omni.flux.utils.common import path_utils as _path_utils
+from omni.flux.validator.manager.core import SCHEMA_UPDATE_PREFIX as _SCHEMA_UPDATE_PREFIX
 from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
 
 
@@ -39,20 +40,33 @@ def main():
     parser.add_argument(
         "-p", "--print-result", help="Print the result in the stdout", default=False, action="store_true"
     )
+    parser.add_argument(
+        "-u",
+        "--stream-updates",
+        help="Print the schema updates in the stdout instead of sending them to the service",
+        default=False,
+        action="store_true",
+    )
     args = parser.parse_args()
 
     result, entry = omni.client.stat(args.schema)
     if result != omni.client.Result.OK or not entry.flags & omni.client.ItemFlags.READABLE_FILE:
         raise ValueError(f"Can't read the schema file {args.schema}")
 
-    asyncio.ensure_future(run(args.schema, args.print_result, args.queue_id))
+    asyncio.ensure_future(run(args.schema, args.print_result, args.queue_id, stream_updates=args.stream_updates))
+
+
+def _print_update(data: str):
+    print(f"{_SCHEMA_UPDATE_PREFIX}{data}", flush=True)
 
 
-async def run(json_path: str, print_result: bool, queue_id: str | None):
+async def run(json_path: str, print_result: bool, queue_id: str | None, stream_updates: bool = False):
     exit_code = 1
     try:
         data = _path_utils.read_json_file(json_path)
         core = _ManagerCore(data)
+        if stream_updates:
+            core.set_update_callback(_print_update)
         await core.deferred_run(print_result=print_result, queue_id=queue_id)
         exit_code = 0
     finally:
@@ -21,11 +21,12 @@ import io
 import pathlib
 import pprint
 import sys
+import time
 from collections.abc import Iterable
 from contextlib import asynccontextmanager, contextmanager, redirect_stderr, redirect_stdout
 from enum import Enum as _Enum
 from json import JSONEncoder, dumps
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import carb
 import carb.settings
@@ -49,6 +50,10 @@ from pydantic import BaseModel, Field, validator
 EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST = "/exts/omni.services.transport.server.http/host"
 EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT = "/exts/omni.services.transport.server.http/port"
 EXTS_MASS_VALIDATOR_SERVICE_PREFIX = "/exts/omni.flux.validator.mass.service/service/prefix"
+SCHEMA_UPDATE_PREFIX = "[omni.flux.validator.manager.schema_update]"  # prefix of schema updates streamed on stdout
+PROGRESS_UPDATE_INTERVAL = "/exts/omni.flux.validator.manager.core/progress_update_interval"  # in seconds
+
+_DEFAULT_PROGRESS_UPDATE_INTERVAL = 0.1
 
 
 @contextmanager
@@ -150,6 +155,50 @@ class ValidationSchema(BaseModel):
         return self
 
 
+def send_schema_update_request(data: str, queue_id: Optional[str] = None):
+    """
+    Send a schema update to the mass validation service. The service will update the matching queue item.
+
+    Args:
+        data: the JSON serialized schema
+        queue_id: the queue ID to update
+
+    Raises:
+        ValueError: if the request failed
+    """
+    settings = carb.settings.get_settings()
+    host = settings.get(EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST)
+    port = settings.get(EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT)
+    prefix = settings.get(EXTS_MASS_VALIDATOR_SERVICE_PREFIX)
+
+    url = f"http://{host}:{port}{prefix}/mass-validator/schema"  # use IP. localhost is very slow
+    if queue_id:
+        url += f"?queue_id={queue_id}"  # Set the query param if we have a queue ID
+
+    r = None
+    try:
+        # Sending a schema update request should be quick. Set a short timeout.
+        r = requests.put(url, data=data, timeout=5)
+        r.raise_for_status()
+    except (requests.exceptions.ConnectionError, requests.exceptions.HTTPError) as e:
+        raise ValueError(r.text if r is not None else str(e)) from e
+
+
+def _iter_plugins(model: BaseModel) -> Iterator[_BaseSchema]:
+    """Yield every plugin schema nested in a model, parents first"""
+    for attr in model.__fields__:
+        next_plugin = getattr(model, attr)
+        next_plugins = []
+        if isinstance(next_plugin, _BaseSchema):
+            next_plugins = [next_plugin]
+        elif isinstance(next_plugin, Iterable):
+            next_plugins = [nexp for nexp in next_plugin if isinstance(nexp, _BaseSchema)]
+
+        for plugin in next_plugins:
+            yield plugin
+            yield from _iter_plugins(plugin)
+
+
 def validation_schema_json_encoder(obj):
     if isinstance(obj, (_OmniUrl, pathlib.PurePath)):
         return str(obj)
@@ -191,8 +240,6 @@ class ManagerCore:
         self.__run_started = False
         self.__run_finished = None
 
-        self.__settings = carb.settings.get_settings()
-
         self.__on_run_started = _Event()
         self.__on_run_finished = _Event()
         self.__on_run_paused = _Event()
@@ -201,11 +248,20 @@ class ManagerCore:
         self.__print_result = False
         self.__silent = False
         self.__current_queue_id = None
+        self.__update_callback = None
         self.__enable = True
         self.__is_ready_to_run = {}
         self.__pause_validation = False
         self.__stop_validation = False
         self.__progress = 0.0
+        self.__plugins = None
+        self.__pending_progress = None
+        self.__last_progress_dispatch = 0.0
+        self.__progress_dispatch_handle = None
+        progress_update_interval = carb.settings.get_settings().get(PROGRESS_UPDATE_INTERVAL)
+        self.__progress_update_interval = (
+            _DEFAULT_PROGRESS_UPDATE_INTERVAL if progress_update_interval is None else progress_update_interval
+        )
         self.__model = ValidationSchema(**schema)
         self.__model.on_progress_callback = self._on_run_progress
         self.__model.on_finished_callback = self._on_run_finished
@@ -227,47 +283,21 @@ class ManagerCore:
         Default exposed action for Mass validation. The UI will be built into the delegate of the mass queue.
         """
 
-        def nester_mass_build_queue_action_ui_for_plugins(model):
-            to_dict = model.dict()
-            for attr in to_dict.keys():
-                next_plugin = getattr(model, attr)
-                next_plugins = []
-                if isinstance(next_plugin, _BaseSchema):
-                    next_plugins = [next_plugin]
-                elif isinstance(next_plugin, Iterable):
-                    next_plugins = [nexp for nexp in next_plugin if isinstance(nexp, _BaseSchema)]
-
-                for plugin in next_plugins:
-                    if plugin.data.expose_mass_queue_action_ui:
-                        plugin.instance.mass_build_queue_action_ui(plugin.data, default_actions, callback)
-                    nester_mass_build_queue_action_ui_for_plugins(plugin)
-
-        nester_mass_build_queue_action_ui_for_plugins(self.__model)
+        for plugin in self._get_plugins():
+            if plugin.data.expose_mass_queue_action_ui:
+                plugin.instance.mass_build_queue_action_ui(plugin.data, default_actions, callback)
 
     def __init_sub_validator_run_by_plugin(self):
-        def nester_init_sub_validator_run_by_plugin(model):
-            to_dict = model.dict()
-            for attr in to_dict.keys():
-                next_plugin = getattr(model, attr)
-                next_plugins = []
-                if isinstance(next_plugin, _BaseSchema):
-                    next_plugins = [next_plugin]
-                elif isinstance(next_plugin, Iterable):
-                    next_plugins = [nexp for nexp in next_plugin if isinstance(nexp, _BaseSchema)]
-
-                for plugin in next_plugins:
-                    self.__subs_validator_run_by_plugin[id(plugin.instance)] = plugin.instance.subscribe_validator_run(
-                        self.__on_validator_run_by_plugin
-                    )
-                    self.__subs_validator_enable_by_plugin[id(plugin.instance)] = (
-                        plugin.instance.subscribe_enable_validation(self.enable)
-                    )
-                    self.__subs_validator_is_ready_to_run_by_plugin[id(plugin.instance)] = (
-                        plugin.instance.subscribe_on_validation_is_ready_to_run(self.set_ready_to_run)
-                    )
-                    nester_init_sub_validator_run_by_plugin(plugin)
-
-        nester_init_sub_validator_run_by_plugin(self.__model)
+        for plugin in self._get_plugins():
+            self.__subs_validator_run_by_plugin[id(plugin.instance)] = plugin.instance.subscribe_validator_run(
+                self.__on_validator_run_by_plugin
+            )
+            self.__subs_validator_enable_by_plugin[id(plugin.instance)] = plugin.instance.subscribe_enable_validation(
+                self.enable
+            )
+            self.__subs_validator_is_ready_to_run_by_plugin[id(plugin.instance)] = (
+                plugin.instance.subscribe_on_validation_is_ready_to_run(self.set_ready_to_run)
+            )
 
     def enable(self, enable: bool):
         """
@@ -309,55 +339,86 @@ class ManagerCore:
     def update_model(self, model: ValidationSchema):
         """Return the current model of the schema"""
         self.__model.update(model.dict())
+        self.__plugins = None
+
+    def _get_plugins(self) -> List[_BaseSchema]:
+        """
+        Get every plugin of the schema, parents first. The list is cached until the model is updated.
+        """
+        if self.__plugins is None:
+            self.__plugins = list(_iter_plugins(self.__model))
+        return self.__plugins
 
     @_ignore_function_decorator(attrs=["_ignore_on_run_progress"])
     def _on_run_progress(self, progress, set_schema_value=True, force_not_send_request: bool = False):
         carb.log_info(f"Progress: {progress}%")
 
-        def nester_on_run_progress(model):
-            to_dict = model.dict()
-            for attr in to_dict.keys():
-                next_plugin = getattr(model, attr)
-                next_plugins = []
-                if isinstance(next_plugin, _BaseSchema):
-                    next_plugins = [next_plugin]
-                elif isinstance(next_plugin, Iterable):
-                    next_plugins = [nexp for nexp in next_plugin if isinstance(nexp, _BaseSchema)]
+        self.__progress = progress
+        self.__on_run_progress(progress)
 
-                for plugin in next_plugins:
-                    plugin.instance.set_global_progress(progress)
-                    nester_on_run_progress(plugin)
+        # Updating the plugins and the schema re-validates the models and sending the schema serializes it.
+        # Only keep the latest progress and dispatch it at most every `progress_update_interval` seconds.
+        send_request = not force_not_send_request
+        if self.__pending_progress is not None:
+            _, pending_set_schema_value, pending_send_request = self.__pending_progress
+            set_schema_value = set_schema_value or pending_set_schema_value
+            send_request = send_request or pending_send_request
+        self.__pending_progress = (progress, set_schema_value, send_request)
 
-        nester_on_run_progress(self.__model)
+        if self.__progress_dispatch_handle is not None:
+            return
+        delay = self.__last_progress_dispatch + self.__progress_update_interval - time.monotonic()
+        if delay <= 0:
+            self._dispatch_progress()
+            return
+        self.__progress_dispatch_handle = asyncio.get_event_loop().call_later(delay, self._flush_progress)
 
-        self.__progress = progress
-        self.__on_run_progress(progress)
+    @_ignore_function_decorator(attrs=["_ignore_on_run_progress"])
+    def _flush_progress(self):
+        """
+        Dispatch the pending progress update now
+        """
+        self._dispatch_progress()
+
+    def _dispatch_progress(self):
+        if self.__progress_dispatch_handle is not None:
+            self.__progress_dispatch_handle.cancel()
+            self.__progress_dispatch_handle = None
+
+        if self.__pending_progress is None or self.__model is None:
+            return
+        progress, set_schema_value, send_request = self.__pending_progress
+        self.__pending_progress = None
+        self.__last_progress_dispatch = time.monotonic()
+
+        for plugin in self._get_plugins():
+            plugin.instance.set_global_progress(progress)
 
         if set_schema_value:
             self.__model.progress = progress
 
-        if not force_not_send_request and self.__model.send_request:
+        if send_request and self.__model.send_request:
             self._send_update_request()
 
+    def set_update_callback(self, callback: Optional[Callable[[str], Any]]):
+        """
+        Set a callback that will receive the schema updates instead of sending them to the mass validation service.
+        Used to stream the updates of a validation running in another process.
+
+        Args:
+            callback: the callback that will receive the JSON serialized schema. None to send the updates to the
+                      service.
+        """
+        self.__update_callback = callback
+
     def _send_update_request(self):
         """This method handles the POST request to update a schema. It sends an HTTP post request with JSON data of
         current model instance, and expects status code 200 if everything is okay."""
-        host = self.__settings.get(EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST)
-        port = self.__settings.get(EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT)
-        prefix = self.__settings.get(EXTS_MASS_VALIDATOR_SERVICE_PREFIX)
-
         data = dumps(self.__model.dict(), default=validation_schema_json_encoder)
-        url = f"http://{host}:{port}{prefix}/mass-validator/schema"  # use IP. localhost is very slow
-        if self.__current_queue_id:
-            url += f"?queue_id={self.__current_queue_id}"  # Set the query param if we have a queue ID
-
-        r = None
-        try:
-            # Sending a schema update request should be quick. Set a short timeout.
-            r = requests.put(url, data=data, timeout=5)
-            r.raise_for_status()
-        except (requests.exceptions.ConnectionError, requests.exceptions.HTTPError) as e:
-            raise ValueError(r.text) from e
+        if self.__update_callback:
+            self.__update_callback(data)
+            return
+        send_schema_update_request(data, queue_id=self.__current_queue_id)
 
     def get_progress(self):
         return self.__progress
@@ -366,6 +427,8 @@ class ManagerCore:
     def _on_run_finished(
         self, result, message: Optional[str] = None, set_schema_value: bool = True, force_not_send_request: bool = False
     ):
+        # Make sure the last progress is dispatched before the result
+        self._flush_progress()
         if self.__print_result:
             pprint.pprint("=" * 50)
             pprint.pprint(self.__model.dict())
@@ -549,6 +612,48 @@ class ManagerCore:
             with disable_exception_traceback():
                 raise ValueError(error_message)
 
+    def __get_check_batches(self) -> List[List[_CheckSchema]]:
+        """
+        Split the check plugins into batches that run one after the other. Consecutive check plugins with the same
+        parallel group are in the same batch.
+        """
+        batches = []
+        for check_plugin_model in self.__model.check_plugins:
+            previous_check = batches[-1][-1] if batches else None
+            if (
+                previous_check is not None
+                and check_plugin_model.parallel_group is not None
+                and check_plugin_model.parallel_group == previous_check.parallel_group
+            ):
+                batches[-1].append(check_plugin_model)
+            else:
+                batches.append([check_plugin_model])
+        return batches
+
+    async def __run_checks_concurrently(self, check_plugin_models: List[_CheckSchema], context_data: _SetupDataTypeVar):
+        # Several checks of the group can fail, so the checks don't report the end of the run. The first failure is
+        # reported once the whole group is done.
+        self._ignore_on_run_finished = True
+        try:
+            # Wait for every check to be done before raising, so no check keeps running after the validation failed
+            results = await asyncio.gather(
+                *[
+                    self.__run_context(
+                        check_plugin_model.context_plugin,
+                        functools.partial(self.__run_check, check_plugin_model),
+                        context_data,
+                    )
+                    for check_plugin_model in check_plugin_models
+                ],
+                return_exceptions=True,
+            )
+        finally:
+            self._ignore_on_run_finished = False
+        for result in results:
+            if isinstance(result, BaseException):
+                self._on_run_finished(False, message=str(result))
+                raise result
+
     async def __run_check_groups(self, context_data: _SetupDataTypeVar):
         """
         Run all check(s) + resultor(s) inside the global context
@@ -564,16 +669,25 @@ class ManagerCore:
 
         progress_check_add = (100 / size_plugins) / 2  # divide by 2 because we start at 50
         checked_ran = 0
-        for check_plugin_model in self.__model.check_plugins:
-            progress_check += progress_check_add
-            self._on_run_progress(progress_check)
-            if not check_plugin_model.enabled:
-                continue
-            checked_ran += 1
-            await self.__run_context(
-                check_plugin_model.context_plugin, functools.partial(self.__run_check, check_plugin_model), context_data
-            )
-            await self.__run_resultor(check_plugin_model, progress_check, progress_check_add)
+        for batch in self.__get_check_batches():
+            enabled_checks = [check_plugin_model for check_plugin_model in batch if check_plugin_model.enabled]
+            run_concurrently = len(enabled_checks) > 1
+            if run_concurrently:
+                await self.__run_checks_concurrently(enabled_checks, context_data)
+            # The progress and the resultors are processed in the schema order, even for concurrent checks
+            for check_plugin_model in batch:
+                progress_check += progress_check_add
+                self._on_run_progress(progress_check)
+                if not check_plugin_model.enabled:
+                    continue
+                checked_ran += 1
+                if not run_concurrently:
+                    await self.__run_context(
+                        check_plugin_model.context_plugin,
+                        functools.partial(self.__run_check, check_plugin_model),
+                        context_data,
+                    )
+                await self.__run_resultor(check_plugin_model, progress_check, progress_check_add)
 
         self.__model.validation_passed = True
 
@@ -964,22 +1078,10 @@ class ManagerCore:
         self.__silent = silent
 
         # reset progress for all plugins
-        def nester_reset_progress(model):
-            to_dict = model.dict()
-            for attr in to_dict.keys():
-                next_plugin = getattr(model, attr)
-                next_plugins = []
-                if isinstance(next_plugin, _BaseSchema):
-                    next_plugins = [next_plugin]
-                elif isinstance(next_plugin, Iterable):
-                    next_plugins = [nexp for nexp in next_plugin if isinstance(nexp, _BaseSchema)]
-
-                for plugin in next_plugins:
-                    plugin.instance.on_progress(0.0, "", True)
-                    plugin.instance.set_global_progress(0)
-                    nester_reset_progress(plugin)
-
-        nester_reset_progress(self.__model)
+        self.__plugins = None
+        for plugin in self._get_plugins():
+            plugin.instance.on_progress(0.0, "", True)
+            plugin.instance.set_global_progress(0)
 
         self.__model.validation_passed = False
         self._on_run_progress(0.0)
@@ -999,21 +1101,12 @@ class ManagerCore:
     def destroy(self):
         self.__subs_validator_run_by_plugin = None
 
-        def nester_destroy(model):
-            to_dict = model.dict()
-            for attr in to_dict.keys():
-                next_plugin = getattr(model, attr)
-                next_plugins = []
-                if isinstance(next_plugin, _BaseSchema):
-                    next_plugins = [next_plugin]
-                elif isinstance(next_plugin, Iterable):
-                    next_plugins = [nexp for nexp in next_plugin if isinstance(nexp, _BaseSchema)]
-
-                for plugin in next_plugins:
-                    plugin.instance.destroy()
-                    nester_destroy(plugin)
+        if self.__progress_dispatch_handle is not None:
+            self.__progress_dispatch_handle.cancel()
+            self.__progress_dispatch_handle = None
 
-        nester_destroy(self.__model)
+        for plugin in self._get_plugins():
+            plugin.instance.destroy()
 
         if self._last_run_task:
             self._last_run_task.cancel()
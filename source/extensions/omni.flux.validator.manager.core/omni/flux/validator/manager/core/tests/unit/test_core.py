@@ -19,12 +19,15 @@ import asyncio
 import sys
 from pathlib import Path
 from typing import Any, Optional
+from json import loads
 from unittest.mock import call, patch
 
+import carb.settings
 import omni.kit.app
 from omni.flux.validator.factory import BaseValidatorRunMode as _BaseValidatorRunMode
 from omni.flux.validator.factory import ResultorBase as _ResultorBase
 from omni.flux.validator.factory import get_instance as _get_factory_instance
+from omni.flux.validator.manager.core import PROGRESS_UPDATE_INTERVAL as _PROGRESS_UPDATE_INTERVAL
 from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
 from omni.flux.validator.plugin.check.usd.example.print_prims import PrintPrims as _PrintPrims
 from omni.flux.validator.plugin.context.usd_stage.current_stage import CurrentStage as _CurrentStage
@@ -384,6 +387,116 @@ class TestCore(AsyncTestCase):
             await core.deferred_run()
             self.assertTrue(m_mocked.called)
 
+    async def test_send_service_request_update_callback_should_receive_updates(self):
+        """Test if the update callback receives the schema updates instead of the service."""
+        core = _create_good_schema()
+        core.model.send_request = True
+
+        updates = []
+        core.set_update_callback(updates.append)
+
+        with patch("omni.flux.validator.manager.core.manager.send_schema_update_request") as m_mocked:
+            await core.deferred_run()
+            self.assertFalse(m_mocked.called)
+
+        self.assertTrue(updates)
+        self.assertEqual(core.model.name, loads(updates[-1])["name"])
+        self.assertEqual(100, loads(updates[-1])["progress"])
+
+    async def test_progress_should_be_coalesced_and_flushed_when_finished(self):
+        settings = carb.settings.get_settings()
+        previous_interval = settings.get(_PROGRESS_UPDATE_INTERVAL)
+        settings.set(_PROGRESS_UPDATE_INTERVAL, 60.0)
+        try:
+            core = _create_good_schema()
+        finally:
+            settings.set(_PROGRESS_UPDATE_INTERVAL, 0.1 if previous_interval is None else previous_interval)
+        core.model.send_request = True
+
+        progress_values = []
+        _sub = core.subscribe_run_progress(progress_values.append)  # noqa
+
+        with (
+            patch.object(_ManagerCore, "_send_update_request") as send_mock,
+            patch.object(_PrintPrims, "set_global_progress", autospec=True) as global_progress_mock,
+        ):
+            await core.deferred_run()
+
+        # Every progress value is still given to the subscribers
+        self.assertEqual([0.0, 50, 62.5, 75.0, 78.125, 81.25, 87.5, 90.625, 93.75, 100], progress_values)
+        # The first progress is dispatched right away, the others are coalesced until the validation is finished.
+        # The last request is the finished request.
+        self.assertEqual(3, send_mock.call_count)
+        self.assertEqual(100, core.model.progress)
+        # 3 check plugins: 1 reset + 2 dispatches each
+        global_progress_values = [c.args[1] for c in global_progress_mock.call_args_list]
+        self.assertEqual(9, len(global_progress_values))
+        self.assertEqual([100, 100, 100], global_progress_values[-3:])
+
+    async def test_run_parallel_group_should_run_checks_concurrently(self):
+        core = _create_good_schema()
+        for check_plugin in core.model.check_plugins:
+            check_plugin.parallel_group = "test"
+
+        running = 0
+        max_running = 0
+
+        async def check(*_args, **_kwargs):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.1)
+            running -= 1
+            return True, "Ok", None
+
+        progress_values = []
+        _sub = core.subscribe_run_progress(progress_values.append)  # noqa
+
+        with (
+            patch.object(_PrintPrims, "_check", side_effect=check) as check_mock,
+            patch.object(FakeResultor, "_result", return_value=(True, "Ok")) as result_mock,
+        ):
+            await core.deferred_run()
+
+        # The 2 enabled checks ran at the same time, and the disabled one didn't run
+        self.assertEqual(2, check_mock.call_count)
+        self.assertEqual(2, max_running)
+        # The resultors still ran: 2 for the check plugin + 2 for the schema
+        self.assertEqual(4, result_mock.call_count)
+        # The progress is the same as a sequential run
+        self.assertEqual([0.0, 50, 62.5, 75.0, 78.125, 81.25, 87.5, 90.625, 93.75, 100], progress_values)
+        self.assertEqual(100, core.model.progress)
+
+    async def test_run_parallel_group_failed_checks_should_finish_once(self):
+        core = _create_good_schema()
+        for check_plugin in core.model.check_plugins:
+            check_plugin.parallel_group = "test"
+            check_plugin.stop_if_fix_failed = True
+
+        async def fail(*_args, **_kwargs):
+            await asyncio.sleep(0.1)
+            return False, "Failed", None
+
+        finished_values = []
+
+        def on_finished(result, message=None):
+            finished_values.append((result, message))
+
+        _sub = core.subscribe_run_finished(on_finished)  # noqa
+
+        with (
+            patch.object(_PrintPrims, "_check", side_effect=fail),
+            patch.object(_PrintPrims, "_fix", side_effect=fail) as fix_mock,
+            self.assertRaises(ValueError),
+        ):
+            await core.deferred_run()
+
+        # Both enabled checks failed, but the end of the run is only reported once
+        self.assertEqual(2, fix_mock.call_count)
+        self.assertEqual(1, len(finished_values))
+        self.assertFalse(finished_values[0][0])
+        self.assertIn("stopped validation", finished_values[0][1])
+
     async def test_run_stopped(self):
         def sub_stopped_count_fn():
             nonlocal sub_stopped_count
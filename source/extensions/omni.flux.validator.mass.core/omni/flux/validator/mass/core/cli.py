@@ -44,7 +44,13 @@ def main():
     )
     parser.add_argument("-s", "--schema", type=str, help="Your schema file (.json)", required=True, action="append")
     parser.add_argument(
-        "-ex", "--executor", help="Executor to use: 0=async, 1=process", nargs="?", const=1, type=int, default=0
+        "-ex",
+        "--executor",
+        help="Executor to use: 0=async, 1=process, 2=worker pool",
+        nargs="?",
+        const=1,
+        type=int,
+        default=0,
     )
     parser.add_argument(
         "-p", "--print-result", help="Print the result in the stdout", default=False, action="store_true"
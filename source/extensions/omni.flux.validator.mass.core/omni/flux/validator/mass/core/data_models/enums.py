@@ -21,3 +21,4 @@ from enum import IntEnum
 class Executors(IntEnum):
     ASYNC_EXECUTOR = 0
     PROCESS_EXECUTOR = 1
+    WORKER_POOL_EXECUTOR = 2
@@ -17,3 +17,4 @@
 
 from .async_executor import AsyncExecutor
 from .process_executor import ProcessExecutor
+from .worker_pool_executor import WorkerPoolExecutor
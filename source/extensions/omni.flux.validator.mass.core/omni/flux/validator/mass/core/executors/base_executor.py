@@ -63,3 +63,9 @@ class BaseExecutor:
             The future of the job (that will hold the result)
         """
         pass
+
+    def shutdown(self):
+        """
+        Release the resources held by the executor. Jobs that are already running will finish.
+        """
+        pass
@@ -15,13 +15,18 @@
 * limitations under the License.
 """
 
+import collections
+import functools
+import os
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import traceback
 from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
 
 import carb
 import carb.settings
@@ -36,9 +41,12 @@ from omni.flux.validator.manager.core import (
 from omni.flux.validator.manager.core import (
     EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT as _EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT,
 )
+from omni.flux.validator.manager.core import SCHEMA_UPDATE_PREFIX as _SCHEMA_UPDATE_PREFIX
+from omni.flux.validator.manager.core import send_schema_update_request as _send_schema_update_request
 from omni.flux.validator.manager.core import validation_schema_json_encoder as _validation_schema_json_encoder
 
 from .base_executor import BaseExecutor as _BaseExecutor
+from .update_forwarder import SchemaUpdateForwarder as _SchemaUpdateForwarder
 
 if TYPE_CHECKING:
     from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
@@ -47,6 +55,185 @@ if TYPE_CHECKING:
 OVERRIDE_EXPERIENCE = (
     "/exts/omni.flux.validator.mass.core/override_process_experience"  # list of paths of schema separated by a coma
 )
+SCHEMA_UPDATE_INTERVAL = "/exts/omni.flux.validator.mass.core/schema_update_interval"  # in seconds
+
+_DEFAULT_SCHEMA_UPDATE_INTERVAL = 0.5
+_MAX_STDERR_LINES = 1000
+
+
+def create_schema_update_forwarder(queue_id: str | None = None) -> _SchemaUpdateForwarder:
+    """
+    Create a forwarder that sends the schema updates streamed by a validation process to the mass validation service.
+
+    Args:
+        queue_id: the queue ID to update
+
+    Returns:
+        The forwarder
+    """
+    interval = carb.settings.get_settings().get(SCHEMA_UPDATE_INTERVAL)
+    return _SchemaUpdateForwarder(
+        functools.partial(_send_schema_update_request, queue_id=queue_id),
+        _DEFAULT_SCHEMA_UPDATE_INTERVAL if interval is None else interval,
+    )
+
+
+def kill_process_tree(process: subprocess.Popen):
+    """
+    Kill a process started with a shell and all its children.
+
+    Killing only the shell would leave the child process running and holding the pipes.
+
+    Args:
+        process: a process started with `start_new_session=True` on Linux
+    """
+    if process.poll() is not None:
+        return
+    if sys.platform == "win32":
+        subprocess.run(f"taskkill /F /T /PID {process.pid}", shell=True, capture_output=True)  # noqa PLW1510
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+def stream_process(
+    command: str,
+    timeout: Optional[int] = None,
+    silent: bool = False,
+    on_update: Optional[Callable[[str], Any]] = None,
+) -> Tuple[int, List[str]]:
+    """
+    Run a command and read its output while it runs.
+
+    Schema updates printed in the stdout are given to `on_update` and the other lines are printed. The stderr is kept
+    to build the result message, up to the last `_MAX_STDERR_LINES` lines.
+
+    Args:
+        command: the command to run
+        timeout: the maximum time the command should take
+        silent: print the stdout or not
+        on_update: the callback that will receive the schema updates
+
+    Raises:
+        subprocess.TimeoutExpired: if the command didn't finish in time
+
+    Returns:
+        The return code of the command and the last lines of its stderr
+    """
+    process = subprocess.Popen(  # noqa PLR1732
+        command,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        start_new_session=sys.platform != "win32",
+    )
+
+    # Read the stderr in another thread so that neither pipe can fill up and block the process
+    stderr_lines = collections.deque(maxlen=_MAX_STDERR_LINES)
+
+    def read_stderr():
+        for line in process.stderr:
+            stderr_lines.append(line.rstrip("\n"))
+
+    stderr_reader = threading.Thread(target=read_stderr, daemon=True)
+    stderr_reader.start()
+
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        kill_process_tree(process)
+
+    timer = None
+    if timeout is not None:
+        timer = threading.Timer(timeout, kill)
+        timer.daemon = True
+        timer.start()
+
+    try:
+        for line in process.stdout:
+            line = line.rstrip("\n")  # noqa PLW2901
+            if line.startswith(_SCHEMA_UPDATE_PREFIX):
+                if on_update:
+                    on_update(line[len(_SCHEMA_UPDATE_PREFIX) :])
+                continue
+            if not silent:
+                print(line)
+        return_code = process.wait()
+        stderr_reader.join()
+    finally:
+        if timer:
+            timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout)
+
+    return return_code, list(stderr_lines)
+
+
+def get_kit_command(exec_command: str) -> List[str]:
+    """
+    Build the command that starts the mass validation Kit experience and executes a script in it.
+
+    Args:
+        exec_command: the script to execute, with its arguments
+
+    Returns:
+        The command, as a list of arguments
+    """
+    settings = carb.settings.get_settings()
+
+    exe_ext = carb.tokens.get_tokens_interface().resolve("${exe_ext}")
+    kit_folder = carb.tokens.get_tokens_interface().resolve("${kit}")
+    kit_path = Path(kit_folder) / f"kit{exe_ext}"
+    app_filename = carb.tokens.get_tokens_interface().resolve("${app_filename}")
+
+    override_experience = settings.get(OVERRIDE_EXPERIENCE)
+    if override_experience:
+        experience_path = carb.tokens.get_tokens_interface().resolve(override_experience)
+    else:
+        # grab the default experience
+        app = carb.tokens.get_tokens_interface().resolve("${omni.flux.validator.mass.core}")
+        experience_path = Path(app) / "apps" / "omni.flux.app.validator.mass_cli.kit"
+
+    cmd = [f'"{str(kit_path)}"', f'"{str(experience_path)}"', "--no-window"]
+    extra_args = sys.argv[2:] if len(sys.argv) >= 2 else []
+    ignore_arg = False
+    for extra_arg in extra_args:
+        # if this is the standalone, we delete args between --start-future-args-remove and
+        # --end-future-args-remove
+        if app_filename == "omni.flux.app.validator.mass_cli":
+            if extra_arg == "--start-future-args-remove":
+                ignore_arg = True
+            if extra_arg == "--end-future-args-remove":
+                ignore_arg = False
+                continue
+            if ignore_arg:
+                continue
+        cmd.append(f'"{extra_arg}"')
+
+    # remove error: <_overlapped.Overlapped object at 0x000002694A2C4B70> still has pending operation at
+    # deallocation, the process may crash
+    cmd.append("--/exts/omni.kit.async_engine/event_loop_windows=SelectorEventLoop")
+
+    host = settings.get(_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST)
+    port = settings.get(_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT)
+
+    cmd.append(f"--{_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST}={host}")
+    cmd.append(f"--{_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT}={port}")
+
+    prefix = settings.get(_EXTS_MASS_VALIDATOR_SERVICE_PREFIX)
+
+    if prefix:
+        cmd.append(f"--{_EXTS_MASS_VALIDATOR_SERVICE_PREFIX}={prefix}")
+
+    cmd.extend(["--exec", f'"{exec_command}"'])
+
+    return cmd
 
 
 class ProcessExecutor(_BaseExecutor):
@@ -61,7 +248,6 @@ class ProcessExecutor(_BaseExecutor):
             max_concurrent: number of job(s) we would want to run concurrently
         """
         super().__init__(max_concurrent=max_concurrent)
-        self.__settings = carb.settings.get_settings()
         if self._EXECUTOR is None:
             self._EXECUTOR = _ThreadPoolExecutor(max_workers=self._max_concurrent)
 
@@ -74,24 +260,12 @@ class ProcessExecutor(_BaseExecutor):
         standalone: Optional[bool] = False,
         queue_id: str | None = None,
     ):
-        exe_ext = carb.tokens.get_tokens_interface().resolve("${exe_ext}")
-        kit_folder = carb.tokens.get_tokens_interface().resolve("${kit}")
-        kit_path = Path(kit_folder) / f"kit{exe_ext}"
-        app_filename = carb.tokens.get_tokens_interface().resolve("${app_filename}")
-
-        override_experience = carb.settings.get_settings().get(OVERRIDE_EXPERIENCE)
-        if override_experience:
-            experience_path = carb.tokens.get_tokens_interface().resolve(override_experience)
-        else:
-            # grab the default experience
-            app = carb.tokens.get_tokens_interface().resolve("${omni.flux.validator.mass.core}")
-            experience_path = Path(app) / "apps" / "omni.flux.app.validator.mass_cli.kit"
-
         validator_cli_root_ext = carb.tokens.get_tokens_interface().resolve("${omni.flux.validator.manager.core}")
         exec_cmd = f"{Path(validator_cli_root_ext).joinpath('omni', 'flux', 'validator', 'manager', 'core', 'cli.py')}"
 
         with tempfile.NamedTemporaryFile("w", delete=False, suffix=".json") as tmp_file:
             jsonfile = tmp_file.name
+        forwarder = None
         try:  # noqa PLR1702
             # for standalone, we don't need to send a request to a micro service
             core.model.send_request = not standalone
@@ -100,71 +274,30 @@ class ProcessExecutor(_BaseExecutor):
                 core.model.json(indent=4, encoder=_validation_schema_json_encoder).encode("utf-8"),
                 raise_if_error=True,
             )
-            cmd = [f'"{str(kit_path)}"', f'"{str(experience_path)}"', "--no-window"]
-            extra_args = sys.argv[2:] if len(sys.argv) >= 2 else []
-            ignore_arg = False
-            for extra_arg in extra_args:
-                # if this is the standalone, we delete args between --start-future-args-remove and
-                # --end-future-args-remove
-                if app_filename == "omni.flux.app.validator.mass_cli":
-                    if extra_arg == "--start-future-args-remove":
-                        ignore_arg = True
-                    if extra_arg == "--end-future-args-remove":
-                        ignore_arg = False
-                        continue
-                    if ignore_arg:
-                        continue
-                cmd.append(f'"{extra_arg}"')
             sub_cmd = [f'\\"{exec_cmd}\\"']
             sub_cmd.extend(["-s", rf"\"{Path(jsonfile).resolve()}\""])
             if print_result:
                 sub_cmd.append("-p")
             if queue_id:
                 sub_cmd.extend(["-q", queue_id])
+            # The updates are streamed back and forwarded to the micro service at a limited rate
+            if not standalone:
+                sub_cmd.append("-u")
+                forwarder = create_schema_update_forwarder(queue_id=queue_id)
 
-            sub_cmd_str = " ".join(sub_cmd)
-
-            # remove error: <_overlapped.Overlapped object at 0x000002694A2C4B70> still has pending operation at
-            # deallocation, the process may crash
-            cmd.append("--/exts/omni.kit.async_engine/event_loop_windows=SelectorEventLoop")
-
-            host = self.__settings.get(_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST)
-            port = self.__settings.get(_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT)
-
-            cmd.append(f"--{_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_HOST}={host}")
-            cmd.append(f"--{_EXTS_OMNI_SERVICES_TRANSPORT_SERVER_HTTP_PORT}={port}")
-
-            prefix = self.__settings.get(_EXTS_MASS_VALIDATOR_SERVICE_PREFIX)
-
-            if prefix:
-                cmd.append(f"--{_EXTS_MASS_VALIDATOR_SERVICE_PREFIX}={prefix}")
-
-            cmd.extend(["--exec", f'"{sub_cmd_str}"'])
+            cmd = get_kit_command(" ".join(sub_cmd))
 
             print(f"Run {' '.join(cmd)}")
 
             try:
-                prev_stdout = None
-                p = subprocess.run(  # noqa PLW1510
-                    " ".join(cmd),
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    encoding="utf-8",
-                    timeout=timeout,
-                    input=prev_stdout,
+                return_code, stderr_lines = stream_process(
+                    " ".join(cmd), timeout=timeout, silent=silent, on_update=forwarder.push if forwarder else None
                 )
-                prev_stdout = p.stdout
-                if not silent:
-                    for line in prev_stdout.split("\n"):
-                        print(line)
 
                 message = "Ok"
-                if p.stderr:
-                    message = ""
-                    for line in p.stderr.split("\n"):
-                        message += f"{line}\n"  # noqa PLR1713
-                result = p.returncode == 0
+                if stderr_lines:
+                    message = "".join(f"{line}\n" for line in stderr_lines)
+                result = return_code == 0
                 if not silent:
                     # Use print to print the stderr if the result is good (carb.log_info doesn't show in the
                     # stdout anymore). If not, we use carb.log_error
@@ -181,6 +314,8 @@ class ProcessExecutor(_BaseExecutor):
             message = str(traceback.format_exc())
             carb.log_error(message)
         finally:
+            if forwarder:
+                forwarder.flush()
             omni.client.delete(jsonfile)
 
         return result, message
@@ -0,0 +1,91 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import carb
+
+
+class SchemaUpdateForwarder:
+    def __init__(self, callback: Callable[[str], Any], interval: float):
+        """
+        Coalesce the schema updates streamed by a validation process and forward them at a limited rate.
+
+        Only the latest update is kept, so a long validation never accumulates updates in memory. The latest update is
+        always forwarded, at most `interval` seconds after it was received.
+
+        Args:
+            callback: the function that will forward an update. Called from a background thread.
+            interval: the minimum time, in seconds, between 2 forwarded updates
+        """
+        self._callback = callback
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()  # keep the forwarded updates in order
+        self._pending: Optional[str] = None
+        self._last_sent = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    def push(self, data: str):
+        """
+        Receive a new update. Any update that was not forwarded yet is dropped.
+
+        Args:
+            data: the JSON serialized schema
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._pending = data
+            if self._timer is not None:
+                return
+            delay = self._last_sent + self._interval - time.monotonic()
+            if delay > 0:
+                self._timer = threading.Timer(delay, self._send_pending)
+                self._timer.daemon = True
+                self._timer.start()
+                return
+        self._send_pending()
+
+    def flush(self):
+        """
+        Forward the pending update now and stop forwarding updates.
+        """
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+        self._send_pending(force=True)
+
+    def _send_pending(self, force: bool = False):
+        with self._send_lock:
+            with self._lock:
+                if not force:
+                    self._timer = None
+                data = self._pending
+                self._pending = None
+                if data is None or (self._closed and not force):
+                    return
+                self._last_sent = time.monotonic()
+            try:
+                self._callback(data)
+            except Exception as e:  # noqa PLW0718
+                # An update that couldn't be forwarded should never stop the validation
+                carb.log_warn(f"Unable to forward the schema update: {e}")
@@ -0,0 +1,297 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import itertools
+import json
+import queue
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+import carb
+import carb.tokens
+from omni.flux.validator.manager.core import validation_schema_json_encoder as _validation_schema_json_encoder
+
+from .base_executor import BaseExecutor as _BaseExecutor
+from .process_executor import create_schema_update_forwarder as _create_schema_update_forwarder
+from .process_executor import get_kit_command as _get_kit_command
+from .process_executor import kill_process_tree as _kill_process_tree
+
+if TYPE_CHECKING:
+    from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+
+WORKER_MESSAGE_PREFIX = "[omni.flux.validator.mass.worker]"  # prefix of the protocol lines written by a worker
+
+
+class KitWorker:
+    def __init__(self, command: str):
+        """
+        A long-lived process that runs validation jobs one after the other.
+
+        Jobs are sent as JSON lines on the process stdin. The process answers with JSON lines prefixed with
+        `WORKER_MESSAGE_PREFIX` on its stdout: schema updates while a job runs and a result when the job is finished.
+        Any other output line is a log line.
+
+        Args:
+            command: the command that starts the worker process
+        """
+        self._job_count = 0
+        self._output = queue.Queue()
+        self._process = subprocess.Popen(  # noqa PLR1732
+            command,
+            shell=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+            start_new_session=sys.platform != "win32",
+        )
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+
+    @property
+    def job_count(self) -> int:
+        """The number of jobs that were sent to the worker"""
+        return self._job_count
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the worker process is still running"""
+        return self._process.poll() is None
+
+    def _read_output(self):
+        for line in self._process.stdout:
+            self._output.put(line.rstrip("\n"))
+        # Let the waiting job know that the process exited
+        self._output.put(None)
+
+    def run_job(
+        self,
+        job: dict,
+        timeout: Optional[int] = None,
+        silent: bool = False,
+        on_update: Optional[Callable[[str], Any]] = None,
+    ) -> Tuple[bool, str]:
+        """
+        Send a job to the worker and wait for its result.
+
+        Args:
+            job: the job to run. Must contain a unique "id" key.
+            timeout: the maximum time the job should take
+            silent: print the log lines of the worker or not
+            on_update: the callback that will receive the schema updates of the job
+
+        Raises:
+            subprocess.TimeoutExpired: if the job didn't finish in time
+            RuntimeError: if the worker process exited before finishing the job
+
+        Returns:
+            The result of the job and its message
+        """
+        self._job_count += 1
+        self._process.stdin.write(f"{json.dumps(job)}\n")
+        self._process.stdin.flush()
+
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            try:
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                line = self._output.get(timeout=remaining)
+            except queue.Empty as e:
+                raise subprocess.TimeoutExpired(self._process.args, timeout) from e
+            if line is None:
+                raise RuntimeError(f"The worker process exited unexpectedly (exit code {self._process.wait()})")
+            if not line.startswith(WORKER_MESSAGE_PREFIX):
+                if not silent:
+                    print(line)
+                continue
+            message = json.loads(line[len(WORKER_MESSAGE_PREFIX) :])
+            if message.get("id") != job["id"]:
+                continue
+            if "update" in message:
+                if on_update:
+                    on_update(message["update"])
+                continue
+            return message["result"], message["message"]
+
+    def stop(self, kill: bool = False):
+        """
+        Stop the worker. The worker will quit after finishing its current job.
+
+        Args:
+            kill: kill the process instead of waiting for it to quit
+        """
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        if kill:
+            _kill_process_tree(self._process)
+
+
+class WorkerPoolExecutor(_BaseExecutor):
+    def __init__(self, max_concurrent=None, max_jobs_per_worker: Optional[int] = None):
+        """
+        Executor that will run jobs in a pool of long-lived Kit processes.
+
+        Starting Kit takes a few seconds, so workers are kept alive between jobs. A worker is only restarted after a
+        crash, a timeout or after running `max_jobs_per_worker` jobs.
+
+        Args:
+            max_concurrent: number of job(s) we would want to run concurrently. This is also the maximum number of
+                            workers.
+            max_jobs_per_worker: number of job(s) a worker can run before being restarted. Workers are never
+                                 restarted if None.
+        """
+        super().__init__(max_concurrent=max_concurrent)
+        if max_jobs_per_worker is not None and max_jobs_per_worker <= 0:
+            raise ValueError("max_jobs_per_worker must be greater than 0")
+        self._max_jobs_per_worker = max_jobs_per_worker
+        self._executor = _ThreadPoolExecutor(max_workers=self._max_concurrent)
+        self._lock = threading.Lock()
+        self._idle_workers: List[KitWorker] = []
+        self._workers: List[KitWorker] = []
+        self._job_ids = itertools.count()
+
+    @property
+    def workers(self) -> List[KitWorker]:
+        """The workers that are currently running"""
+        with self._lock:
+            return list(self._workers)
+
+    def _create_worker(self) -> KitWorker:
+        root_ext = carb.tokens.get_tokens_interface().resolve("${omni.flux.validator.mass.core}")
+        worker_script = Path(root_ext).joinpath("omni", "flux", "validator", "mass", "core", "worker.py")
+        cmd = _get_kit_command(f'\\"{worker_script}\\"')
+        print(f"Start worker {' '.join(cmd)}")
+        return KitWorker(" ".join(cmd))
+
+    def _acquire_worker(self) -> KitWorker:
+        with self._lock:
+            while self._idle_workers:
+                worker = self._idle_workers.pop()
+                if worker.is_alive:
+                    return worker
+                self._workers.remove(worker)
+        # Only `max_concurrent` jobs run at the same time, so the number of workers stays bounded
+        worker = self._create_worker()
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _release_worker(self, worker: KitWorker, restart: bool = False):
+        exhausted = self._max_jobs_per_worker is not None and worker.job_count >= self._max_jobs_per_worker
+        if restart or exhausted or not worker.is_alive:
+            worker.stop(kill=restart)
+            with self._lock:
+                if worker in self._workers:
+                    self._workers.remove(worker)
+            return
+        with self._lock:
+            # The executor could have been shut down while the job was running
+            if worker not in self._workers:
+                worker.stop()
+                return
+            self._idle_workers.append(worker)
+
+    def _worker(
+        self,
+        core: "_ManagerCore",
+        print_result: bool = False,
+        silent: bool = False,
+        timeout: Optional[int] = None,
+        standalone: Optional[bool] = False,
+        queue_id: str | None = None,
+    ):
+        worker = None
+        forwarder = None
+        restart = False
+        try:
+            # for standalone, we don't need to send a request to a micro service
+            core.model.send_request = not standalone
+            job = {
+                "id": next(self._job_ids),
+                "schema": json.loads(core.model.json(encoder=_validation_schema_json_encoder)),
+                "print_result": print_result,
+                "queue_id": queue_id,
+                "stream_updates": not standalone,
+            }
+            # The updates are streamed back and forwarded to the micro service at a limited rate
+            if not standalone:
+                forwarder = _create_schema_update_forwarder(queue_id=queue_id)
+            worker = self._acquire_worker()
+            result, message = worker.run_job(
+                job, timeout=timeout, silent=silent, on_update=forwarder.push if forwarder else None
+            )
+            if not silent:
+                if result:
+                    print(message)
+                else:
+                    carb.log_error(message)
+        except subprocess.TimeoutExpired:
+            restart = True
+            result = False
+            message = f"Time out expired ({timeout}sc)"
+            carb.log_error(message)
+        except Exception:  # noqa PLW0718
+            restart = True
+            result = False
+            message = str(traceback.format_exc())
+            carb.log_error(message)
+        finally:
+            if forwarder:
+                forwarder.flush()
+            if worker:
+                self._release_worker(worker, restart=restart)
+
+        return result, message
+
+    def submit(
+        self,
+        core: "_ManagerCore",
+        print_result: bool = False,
+        silent: bool = False,
+        timeout: Optional[int] = None,
+        standalone: Optional[bool] = False,
+        queue_id: str | None = None,
+    ):
+        return self._executor.submit(
+            self._worker,
+            core,
+            print_result=print_result,
+            silent=silent,
+            timeout=timeout,
+            standalone=standalone,
+            queue_id=queue_id,
+        )
+
+    def shutdown(self):
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+            self._idle_workers.clear()
+        for worker in workers:
+            worker.stop()
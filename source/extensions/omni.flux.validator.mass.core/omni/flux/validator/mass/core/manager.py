@@ -27,10 +27,12 @@ from omni.flux.utils.common import path_utils as _path_utils
 from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
 
 from .data_models import Executors
-from .executors import AsyncExecutor, ProcessExecutor
+from .executors import AsyncExecutor, ProcessExecutor, WorkerPoolExecutor
 from .schema_tree import model as _schema_model
 
 SCHEMA_PATH_SETTING = "/exts/omni.flux.validator.mass.widget/schemas"  # list of paths of schema separated by a coma
+WORKER_POOL_MAX_WORKERS_SETTING = "/exts/omni.flux.validator.mass.core/worker_pool/max_workers"
+WORKER_POOL_MAX_JOBS_PER_WORKER_SETTING = "/exts/omni.flux.validator.mass.core/worker_pool/max_jobs_per_worker"
 
 
 class ManagerMassCore:
@@ -43,7 +45,15 @@ class ManagerMassCore:
 
         """
         self.__standalone = standalone
-        self.__executors = [AsyncExecutor(max_concurrent=1), ProcessExecutor(max_concurrent=1)]
+        settings = carb.settings.get_settings()
+        self.__executors = [
+            AsyncExecutor(max_concurrent=1),
+            ProcessExecutor(max_concurrent=1),
+            WorkerPoolExecutor(
+                max_concurrent=settings.get(WORKER_POOL_MAX_WORKERS_SETTING) or None,
+                max_jobs_per_worker=settings.get(WORKER_POOL_MAX_JOBS_PER_WORKER_SETTING) or None,
+            ),
+        ]
 
         if schema_paths is None:
             schema_paths = []
@@ -51,7 +61,7 @@ class ManagerMassCore:
         if schema_dicts is None:
             schema_dicts = []
 
-        default_schemas = carb.settings.get_settings().get(SCHEMA_PATH_SETTING)
+        default_schemas = settings.get(SCHEMA_PATH_SETTING)
         if not schema_paths and default_schemas and not schema_dicts:
             schema_paths = carb.tokens.get_tokens_interface().resolve(default_schemas)
             schema_paths = [schema_path for schema_path in schema_paths.split(",") if schema_path]
@@ -177,4 +187,5 @@ class ManagerMassCore:
         return result
 
     def destroy(self):
-        pass
+        for executor in self.__executors:
+            executor.shutdown()
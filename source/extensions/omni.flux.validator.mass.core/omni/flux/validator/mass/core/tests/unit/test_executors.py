@@ -15,10 +15,26 @@
 * limitations under the License.
 """
 
-from unittest.mock import patch
+import asyncio
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
 
 import omni.kit.app
 from omni.flux.validator.mass.core import ManagerMassCore as _ManagerMassCore
+from omni.flux.validator.mass.core import worker as _worker
+from omni.flux.validator.manager.core import SCHEMA_UPDATE_PREFIX as _SCHEMA_UPDATE_PREFIX
+from omni.flux.validator.mass.core.executors import WorkerPoolExecutor as _WorkerPoolExecutor
+from omni.flux.validator.mass.core.executors.process_executor import stream_process as _stream_process
+from omni.flux.validator.mass.core.executors.update_forwarder import SchemaUpdateForwarder as _SchemaUpdateForwarder
+from omni.flux.validator.mass.core.executors.worker_pool_executor import KitWorker as _KitWorker
+from omni.flux.validator.mass.core.executors.worker_pool_executor import (
+    WORKER_MESSAGE_PREFIX as _WORKER_MESSAGE_PREFIX,
+)
 from omni.kit.test.async_unittest import AsyncTestCase
 from omni.kit.test_suite.helpers import get_test_data_path
 
@@ -26,6 +42,35 @@ from .fake_plugins import register_fake_plugins as _register_fake_plugins
 from .fake_plugins import unregister_fake_plugins as _unregister_fake_plugins
 
 
+_FAKE_WORKER_SCRIPT = f"""
+import json
+import sys
+import time
+
+for line in sys.stdin:
+    job = json.loads(line)
+    print("log line")
+    if job.get("crash"):
+        sys.exit(1)
+    time.sleep(job.get("sleep", 0))
+    print("{_WORKER_MESSAGE_PREFIX}" + json.dumps({{"id": -1, "result": False, "message": "Other job"}}))
+    print("{_WORKER_MESSAGE_PREFIX}" + json.dumps({{"id": job["id"], "update": "progress"}}))
+    print("{_WORKER_MESSAGE_PREFIX}" + json.dumps({{"id": job["id"], "result": True, "message": "Ok"}}), flush=True)
+"""
+
+_FAKE_PROCESS_SCRIPT = f"""
+import sys
+import time
+
+print("log line")
+for i in range(3):
+    print("{_SCHEMA_UPDATE_PREFIX}" + str(i), flush=True)
+print("error line", file=sys.stderr)
+time.sleep(float(sys.argv[1]))
+sys.exit(int(sys.argv[2]))
+"""
+
+
 class TestExecutors(AsyncTestCase):
     SCHEMAS = [
         get_test_data_path(__name__, "schemas/good_material_ingestion.json"),
@@ -76,8 +121,10 @@ class TestExecutors(AsyncTestCase):
             self.assertIsNotNone(result)
 
     async def test_create_task_process_executor(self):
-        with patch("subprocess.run") as run_mock:
-            run_mock.return_value.returncode = 0
+        with patch("subprocess.Popen") as run_mock:
+            run_mock.return_value.stdout = []
+            run_mock.return_value.stderr = []
+            run_mock.return_value.wait.return_value = 0
             core = _ManagerMassCore(schema_paths=self.SCHEMAS)
             items = core.schema_model.get_item_children(None)
 
@@ -90,8 +137,10 @@ class TestExecutors(AsyncTestCase):
                 core_added_mock.assert_called_once()
 
     async def test_create_tasks_process_executor(self):
-        with patch("subprocess.run") as run_mock:
-            run_mock.return_value.returncode = 0
+        with patch("subprocess.Popen") as run_mock:
+            run_mock.return_value.stdout = []
+            run_mock.return_value.stderr = []
+            run_mock.return_value.wait.return_value = 0
             core = _ManagerMassCore(schema_paths=self.SCHEMAS)
             items = core.schema_model.get_item_children(None)
 
@@ -111,3 +160,201 @@ class TestExecutors(AsyncTestCase):
                 self.assertEqual(run_mock.call_count, 4)
                 self.assertEqual(core_added_mock.call_count, 4)
                 self.assertIsNotNone(result)
+
+    async def test_create_tasks_worker_pool_executor_should_reuse_workers(self):
+        with patch.object(_WorkerPoolExecutor, "_create_worker") as create_worker_mock:
+            worker_mock = Mock()
+            worker_mock.is_alive = True
+            worker_mock.job_count = 1
+            worker_mock.run_job.return_value = (True, "Ok")
+            create_worker_mock.return_value = worker_mock
+
+            core = _ManagerMassCore(schema_paths=self.SCHEMAS)
+            items = core.schema_model.get_item_children(None)
+
+            with patch.object(core, "_on_core_added") as core_added_mock:
+                result = await core.create_tasks(2, [item._data for item in items])  # noqa
+                for _core, task in result:
+                    self.assertEqual((True, "Ok"), task.result(timeout=10))
+
+                # add others
+                result = await core.create_tasks(2, [item._data for item in items])  # noqa
+                for _core, task in result:
+                    self.assertEqual((True, "Ok"), task.result(timeout=10))
+
+            self.assertEqual(core_added_mock.call_count, 4)
+            self.assertEqual(worker_mock.run_job.call_count, 4)
+            # Workers are only started when no idle worker is available
+            self.assertLessEqual(create_worker_mock.call_count, 2)
+            self.assertEqual(0, worker_mock.stop.call_count)
+
+            core.destroy()
+            self.assertEqual(create_worker_mock.call_count, worker_mock.stop.call_count)
+
+    async def test_worker_pool_executor_should_restart_exhausted_and_failed_workers(self):
+        executor = _WorkerPoolExecutor(max_concurrent=1, max_jobs_per_worker=2)
+
+        workers = []
+
+        def create_worker():
+            worker = Mock()
+            worker.is_alive = True
+            worker.job_count = 0
+
+            def run_job(job, **_):
+                worker.job_count += 1
+                if job["schema"].get("crash"):
+                    raise RuntimeError("Test Error")
+                return True, "Ok"
+
+            worker.run_job.side_effect = run_job
+            workers.append(worker)
+            return worker
+
+        def core(crash: bool = False):
+            core_mock = Mock()
+            core_mock.model.json.return_value = '{"crash": true}' if crash else "{}"
+            return core_mock
+
+        with patch.object(_WorkerPoolExecutor, "_create_worker", side_effect=create_worker):
+            results = [executor.submit(core(), silent=True).result(timeout=10) for _ in range(3)]
+            crash_result = executor.submit(core(crash=True), silent=True).result(timeout=10)
+            results.append(executor.submit(core(), silent=True).result(timeout=10))
+
+        self.assertListEqual([(True, "Ok")] * 4, results)
+        self.assertFalse(crash_result[0])
+        self.assertIn("Test Error", crash_result[1])
+        # 2 jobs per worker, the 2nd worker crashed on its 2nd job
+        self.assertEqual(3, len(workers))
+        self.assertEqual([call.kwargs for call in workers[0].stop.call_args_list], [{"kill": False}])
+        self.assertEqual([call.kwargs for call in workers[1].stop.call_args_list], [{"kill": True}])
+        self.assertEqual(0, workers[2].stop.call_count)
+
+        executor.shutdown()
+        self.assertEqual(1, workers[2].stop.call_count)
+
+    async def test_kit_worker_should_run_jobs_in_the_same_process(self):
+        updates = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            worker = self.__create_fake_worker(temp_dir)
+            try:
+                self.assertEqual(
+                    (True, "Ok"), worker.run_job({"id": 0}, timeout=30, silent=True, on_update=updates.append)
+                )
+                self.assertEqual((True, "Ok"), worker.run_job({"id": 1}, timeout=30, silent=True))
+                self.assertTrue(worker.is_alive)
+                self.assertEqual(2, worker.job_count)
+            finally:
+                worker.stop(kill=True)
+        self.assertListEqual(["progress"], updates)
+
+    async def test_kit_worker_timeout_should_raise_timeout_expired(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            worker = self.__create_fake_worker(temp_dir)
+            try:
+                with self.assertRaises(subprocess.TimeoutExpired):
+                    worker.run_job({"id": 0, "sleep": 10}, timeout=1, silent=True)
+            finally:
+                worker.stop(kill=True)
+
+    async def test_kit_worker_crash_should_raise_runtime_error(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            worker = self.__create_fake_worker(temp_dir)
+            try:
+                with self.assertRaises(RuntimeError):
+                    worker.run_job({"id": 0, "crash": True}, timeout=30, silent=True)
+                self.assertFalse(worker.is_alive)
+            finally:
+                worker.stop(kill=True)
+
+    async def test_worker_run_should_destroy_the_core_of_every_job(self):
+        cores = []
+
+        def create_core(_schema):
+            core = Mock()
+            core.deferred_run = AsyncMock(side_effect=None if cores else RuntimeError("Failed"))
+            cores.append(core)
+            return core
+
+        jobs = asyncio.Queue()
+        for job_id in range(2):
+            jobs.put_nowait(json.dumps({"id": job_id, "schema": {}}))
+        jobs.put_nowait(None)
+
+        with (
+            patch.object(_worker, "_ManagerCore", side_effect=create_core),
+            patch.object(_worker, "send_message") as send_message_mock,
+            patch.object(omni.kit.app, "get_app"),
+        ):
+            await _worker.run(jobs)
+
+        # The cores are destroyed when the job fails or succeeds, so the long-lived worker doesn't keep them alive
+        self.assertEqual(2, len(cores))
+        self.assertListEqual([1, 1], [core.destroy.call_count for core in cores])
+        self.assertFalse(send_message_mock.call_args_list[0].args[0]["result"])
+        self.assertTrue(send_message_mock.call_args_list[1].args[0]["result"])
+
+    async def test_stream_process_should_forward_updates_and_return_stderr(self):
+        updates = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            command = self.__create_fake_process_command(temp_dir, 0, 3)
+            return_code, stderr_lines = _stream_process(command, timeout=30, silent=True, on_update=updates.append)
+
+        self.assertEqual(3, return_code)
+        self.assertListEqual(["error line"], stderr_lines)
+        self.assertListEqual(["0", "1", "2"], updates)
+
+    async def test_stream_process_timeout_should_raise_timeout_expired(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            command = self.__create_fake_process_command(temp_dir, 10, 0)
+            with self.assertRaises(subprocess.TimeoutExpired):
+                _stream_process(command, timeout=1, silent=True)
+
+    async def test_schema_update_forwarder_should_coalesce_updates(self):
+        forwarded = []
+        forwarder = _SchemaUpdateForwarder(forwarded.append, 60)
+
+        for i in range(100):
+            forwarder.push(str(i))
+
+        # The first update is sent right away, the others are coalesced until the interval is over
+        self.assertListEqual(["0"], forwarded)
+
+        forwarder.flush()
+        self.assertListEqual(["0", "99"], forwarded)
+
+        # Updates received after a flush are ignored
+        forwarder.push("100")
+        self.assertListEqual(["0", "99"], forwarded)
+
+    async def test_schema_update_forwarder_should_send_the_latest_update_after_the_interval(self):
+        forwarded = []
+        forwarder = _SchemaUpdateForwarder(forwarded.append, 0.1)
+
+        for i in range(10):
+            forwarder.push(str(i))
+
+        for _ in range(50):
+            if len(forwarded) == 2:
+                break
+            time.sleep(0.05)
+
+        self.assertListEqual(["0", "9"], forwarded)
+        forwarder.flush()
+        self.assertListEqual(["0", "9"], forwarded)
+
+    async def test_schema_update_forwarder_callback_failure_should_not_raise(self):
+        forwarder = _SchemaUpdateForwarder(Mock(side_effect=ValueError("Test Error")), 0)
+
+        forwarder.push("0")
+        forwarder.flush()
+
+    def __create_fake_process_command(self, temp_dir: str, sleep: float, exit_code: int) -> str:
+        script = Path(temp_dir) / "fake_process.py"
+        script.write_text(_FAKE_PROCESS_SCRIPT, encoding="utf-8")
+        return f'"{sys.executable}" "{script}" {sleep} {exit_code}'
+
+    def __create_fake_worker(self, temp_dir: str) -> _KitWorker:
+        script = Path(temp_dir) / "fake_worker.py"
+        script.write_text(_FAKE_WORKER_SCRIPT, encoding="utf-8")
+        return _KitWorker(f'"{sys.executable}" "{script}"')
@@ -0,0 +1,91 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import traceback
+
+import omni.kit.app
+from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+from omni.flux.validator.mass.core.executors.worker_pool_executor import (
+    WORKER_MESSAGE_PREFIX as _WORKER_MESSAGE_PREFIX,
+)
+
+
+def main():
+    """
+    Entry point of a worker process started by the `WorkerPoolExecutor`.
+
+    Jobs are read from the stdin, one JSON line per job, and are run one after the other. The worker quits when the
+    stdin is closed.
+    """
+    loop = asyncio.get_event_loop()
+    jobs = asyncio.Queue()
+
+    def read_stdin():
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                loop.call_soon_threadsafe(jobs.put_nowait, line)
+        loop.call_soon_threadsafe(jobs.put_nowait, None)
+
+    threading.Thread(target=read_stdin, daemon=True).start()
+
+    asyncio.ensure_future(run(jobs))
+
+
+async def run(jobs: asyncio.Queue):
+    try:
+        while True:
+            line = await jobs.get()
+            if line is None:
+                break
+            await run_job(line)
+    finally:
+        omni.kit.app.get_app().post_quit(0)
+
+
+def send_message(message: dict):
+    print(f"{_WORKER_MESSAGE_PREFIX}{json.dumps(message)}", flush=True)
+
+
+async def run_job(line: str):
+    job_id = None
+    result = False
+    core = None
+    try:
+        job = json.loads(line)
+        job_id = job["id"]
+        core = _ManagerCore(job["schema"])
+        if job.get("stream_updates"):
+            core.set_update_callback(lambda data: send_message({"id": job_id, "update": data}))
+        await core.deferred_run(print_result=job.get("print_result", False), queue_id=job.get("queue_id"))
+        result = True
+        message = "Ok"
+    except Exception:  # noqa PLW0718
+        message = str(traceback.format_exc())
+    finally:
+        # The worker runs many jobs, so the plugins & subscriptions of every job should be released
+        if core is not None:
+            core.destroy()
+    send_message({"id": job_id, "result": result, "message": message})
+
+
+if __name__ == "__main__":
+    main()
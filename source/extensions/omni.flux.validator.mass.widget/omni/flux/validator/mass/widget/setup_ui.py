@@ -413,7 +413,9 @@ class ValidatorMassWidget:
                                                 "- Process executor: will run the ingestion in an external process "
                                                 "(recommended)\n"
                                                 "- Async executor: will run the ingestion asynchronously on the main "
-                                                "thread"
+                                                "thread\n"
+                                                "- Worker pool executor: will run the ingestion in a pool of external "
+                                                "processes that are reused between jobs"
                                             )
                                         )
                                         ui.Spacer()
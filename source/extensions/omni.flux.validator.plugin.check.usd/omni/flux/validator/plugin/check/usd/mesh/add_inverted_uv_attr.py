@@ -20,9 +20,11 @@ from typing import Any, Tuple
 import numpy as np
 import omni.ui as ui
 import omni.usd
-from pxr import Sdf, UsdGeom
+from pxr import Sdf, UsdGeom, Vt
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from .mesh_kernels import flip_uvs as _flip_uvs
+from .mesh_kernels import to_vt_array as _to_vt_array
 
 
 class AddInvertedUVAttr(_CheckBaseUSD):
@@ -68,15 +70,14 @@ class AddInvertedUVAttr(_CheckBaseUSD):
                     all_pass = False
                     continue
 
-                inverted_uvs = np.array(inverted_uvs_attr.Get())
-                flattened_uvs = np.array(st_prim_var.ComputeFlattened())
-                if inverted_uvs.shape != flattened_uvs.shape:
+                inverted_uvs = np.asarray(inverted_uvs_attr.Get())
+                flipped_uvs = _flip_uvs(st_prim_var.ComputeFlattened())
+                if inverted_uvs.shape != flipped_uvs.shape:
                     message += f"- FAIL, length mismatch: {str(prim.GetPath())}\n"
                     all_pass = False
                     continue
 
-                flattened_uvs[:, 1] = -flattened_uvs[:, 1]
-                if not np.equal(inverted_uvs, flattened_uvs).all():
+                if not np.array_equal(inverted_uvs, flipped_uvs):
                     message += f"- FAIL, value mismatch: {str(prim.GetPath())}\n"
                     all_pass = False
                     continue
@@ -114,9 +115,10 @@ class AddInvertedUVAttr(_CheckBaseUSD):
                 if st_prim_var:
                     # [AJAUS] Because USD and Directx8/9 assume different texture coordinate origins,
                     # invert the vertical texture coordinate
-                    uvs = np.array(st_prim_var.ComputeFlattened())
-                    uvs[:, 1] = -uvs[:, 1]
-                    prim.CreateAttribute(schema_data.attr_name, Sdf.ValueTypeNames.Float2Array, False).Set(uvs.tolist())
+                    uvs = _flip_uvs(st_prim_var.ComputeFlattened())
+                    prim.CreateAttribute(schema_data.attr_name, Sdf.ValueTypeNames.Float2Array, False).Set(
+                        _to_vt_array(Vt.Vec2fArray, uvs)
+                    )
 
                 message += f"- PASS: {str(prim.GetPath())}\n"
 
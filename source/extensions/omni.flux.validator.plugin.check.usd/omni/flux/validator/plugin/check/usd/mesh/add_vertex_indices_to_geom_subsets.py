@@ -17,11 +17,14 @@
 
 from typing import Any, Tuple
 
+import numpy as np
 import omni.ui as ui
 import omni.usd
-from pxr import Sdf, Usd, UsdGeom
+from pxr import Sdf, Usd, UsdGeom, Vt
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from .mesh_kernels import gather_subset_vertex_indices as _gather_subset_vertex_indices
+from .mesh_kernels import to_vt_array as _to_vt_array
 
 
 class AddVertexIndicesToGeomSubsets(_CheckBaseUSD):
@@ -84,16 +87,11 @@ class AddVertexIndicesToGeomSubsets(_CheckBaseUSD):
                         break
 
                     subset = UsdGeom.Subset(child_prim)
-                    face_indices = subset.GetIndicesAttr().Get()
-                    vert_indices = vert_indices_attr.Get()
-                    for i, face_index in enumerate(face_indices):
-                        if (
-                            vert_indices[i * 3 + 0] != face_vertex_indices[face_index * 3 + 0]
-                            or vert_indices[i * 3 + 1] != face_vertex_indices[face_index * 3 + 1]
-                            or vert_indices[i * 3 + 2] != face_vertex_indices[face_index * 3 + 2]
-                        ):
-                            prim_passed = False
-                            break
+                    face_indices = subset.GetIndicesAttr().Get() or []
+                    vert_indices = vert_indices_attr.Get() or []
+                    expected_vert_indices = _gather_subset_vertex_indices(face_vertex_indices, face_indices)
+                    if not np.array_equal(np.asarray(vert_indices), expected_vert_indices):
+                        prim_passed = False
                 if not prim_passed:
                     break
 
@@ -142,20 +140,19 @@ class AddVertexIndicesToGeomSubsets(_CheckBaseUSD):
                 for child_prim in children_iterator:
                     if child_prim.IsA(UsdGeom.Subset):
                         subset = UsdGeom.Subset(child_prim)
-                        face_indices = subset.GetIndicesAttr().Get()
-                        vert_indices = []
-                        for face_index in face_indices:
-                            vert_indices.append(face_vertex_indices[face_index * 3 + 0])
-                            vert_indices.append(face_vertex_indices[face_index * 3 + 1])
-                            vert_indices.append(face_vertex_indices[face_index * 3 + 2])
-                        child_prim.CreateAttribute(self._attr_name, Sdf.ValueTypeNames.IntArray).Set(vert_indices)
+                        face_indices = subset.GetIndicesAttr().Get() or []
+                        vert_indices = _gather_subset_vertex_indices(face_vertex_indices, face_indices)
+                        child_prim.CreateAttribute(self._attr_name, Sdf.ValueTypeNames.IntArray).Set(
+                            _to_vt_array(Vt.IntArray, vert_indices.astype(np.int32))
+                        )
 
                 message += f"- PASS: {str(prim.GetPath())}\n"
 
         return all_pass, message, None
 
     def _is_triangulated(self, faces):
-        return set(faces) == {3}
+        faces = np.asarray(faces)
+        return faces.size > 0 and bool(np.all(faces == 3))
 
     @omni.usd.handle_exception
     async def _build_ui(self, schema_data: Data) -> Any:
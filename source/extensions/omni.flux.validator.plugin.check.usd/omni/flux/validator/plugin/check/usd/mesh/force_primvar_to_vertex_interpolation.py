@@ -17,11 +17,15 @@
 
 from typing import Any, Tuple
 
+import numpy as np
 import omni.ui as ui
 import omni.usd
-from pxr import Sdf, Usd, UsdGeom
+from pxr import Usd, UsdGeom, Vt
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from .mesh_fix_pipeline import run_mesh_fix_pipeline as _run_mesh_fix_pipeline
+from .mesh_kernels import gather_element_values as _gather_element_values
+from .mesh_kernels import to_vt_array as _to_vt_array
 
 
 class ForcePrimvarToVertexInterpolation(_CheckBaseUSD):
@@ -88,14 +92,17 @@ class ForcePrimvarToVertexInterpolation(_CheckBaseUSD):
         """
         message = "Fix:\n"
         all_pass = True
-        with Sdf.ChangeBlock():
-            for prim in selector_plugin_data:
-                message += f"- Fixing {str(prim.GetPath())}"
-                if self._align_vertex_data(prim):
-                    message += "- PASS\n"
-                else:
-                    message += "- FAIL\n"
-                    all_pass = False
+        prims = list(selector_plugin_data)
+        results = await _run_mesh_fix_pipeline(
+            prims, self._read_vertex_data, self._compute_aligned_vertex_data, self._write_aligned_vertex_data
+        )
+        for prim, result in zip(prims, results):
+            message += f"- Fixing {str(prim.GetPath())}"
+            if result:
+                message += "- PASS\n"
+            else:
+                message += "- FAIL\n"
+                all_pass = False
         return all_pass, message, None
 
     @omni.usd.handle_exception
@@ -121,59 +128,86 @@ class ForcePrimvarToVertexInterpolation(_CheckBaseUSD):
                 return False
         return True
 
-    def _align_vertex_data(self, prim: Usd.Prim):
+    def _read_vertex_data(self, prim: Usd.Prim) -> dict | bool:
         # get the mesh schema API from the Prim
         mesh = UsdGeom.Mesh(prim)
         if mesh.GetFaceVertexCountsAttr().Get() is None:
             # the mesh is empty?
             return False
 
-        face_vertex_indices = mesh.GetFaceVertexIndicesAttr().Get()
         points = mesh.GetPointsAttr().Get()
+        normals = mesh.GetNormalsAttr().Get()
 
         primvar_api = UsdGeom.PrimvarsAPI(prim)
         geom_tokens = [UsdGeom.Tokens.faceVarying, UsdGeom.Tokens.varying, UsdGeom.Tokens.vertex]
-        primvars = [
-            {
-                "primvar": primvar,
-                "values": primvar.ComputeFlattened(),
-                "fixed_values": [],
-                "interpolation": primvar.GetInterpolation(),
-                "element_size": primvar.GetElementSize(),
-            }
-            for primvar in primvar_api.GetPrimvars()
-            if primvar.GetInterpolation() in geom_tokens
-        ]
-
-        fixed_indices = range(0, len(face_vertex_indices))
-        fixed_points = [points[face_vertex_indices[i]] for i in fixed_indices]
-
-        for primvar in primvars:
-            if primvar["interpolation"] == UsdGeom.Tokens.vertex:
-                element_size = primvar["element_size"]
-                primvar["fixed_values"] = [
-                    primvar["values"][face_vertex_indices[i] * element_size + j]
-                    for i in fixed_indices
-                    for j in range(element_size)
-                ]
+        primvars = []
+        for primvar in primvar_api.GetPrimvars():
+            interpolation = primvar.GetInterpolation()
+            if interpolation not in geom_tokens:
+                continue
+            values = primvar.ComputeFlattened()
+            primvars.append(
+                {
+                    "primvar": primvar,
+                    "values": values,
+                    # Only the vertex values need to be split per face, the other values already are
+                    "vertex_values": np.asarray(values) if interpolation == UsdGeom.Tokens.vertex else None,
+                    "element_size": primvar.GetElementSize(),
+                }
+            )
+
+        return {
+            "face_vertex_indices": np.asarray(mesh.GetFaceVertexIndicesAttr().Get()),
+            "points_type": type(points),
+            "points": np.asarray(points),
+            "normals_type": type(normals),
+            # Normals are currently in the (old) vertex order if they use the vertex interpolation
+            "normals": (
+                np.asarray(normals) if mesh.GetNormalsInterpolation() == UsdGeom.Tokens.vertex and normals else None
+            ),
+            "primvars": primvars,
+        }
+
+    @staticmethod
+    def _compute_aligned_vertex_data(data: dict) -> dict:
+        face_vertex_indices = data["face_vertex_indices"]
+        fixed = {
+            "face_vertex_indices": np.arange(len(face_vertex_indices), dtype=np.int32),
+            "points_type": data["points_type"],
+            "points": _gather_element_values(data["points"], face_vertex_indices),
+            "normals_type": data["normals_type"],
+            "normals": None,
+            "primvars": [],
+        }
+        if data["normals"] is not None:
+            # need to expand the normals to be 1 normal per vertex per face
+            fixed["normals"] = _gather_element_values(data["normals"], face_vertex_indices)
+        for primvar in data["primvars"]:
+            fixed_values = None
+            if primvar["vertex_values"] is not None:
+                fixed_values = _gather_element_values(
+                    primvar["vertex_values"], face_vertex_indices, element_size=primvar["element_size"]
+                )
+            fixed["primvars"].append({**primvar, "vertex_values": fixed_values})
+        return fixed
 
-        normals_interp = mesh.GetNormalsInterpolation()
-        normals = mesh.GetNormalsAttr().Get()
-        if normals_interp == UsdGeom.Tokens.vertex and normals:
-            # Normals are currently in the (old) vertex order.  need to expand them to be 1 normal per vertex per face
-            fixed_normals = [normals[face_vertex_indices[i]] for i in fixed_indices]
-            mesh.GetNormalsAttr().Set(fixed_normals)
+    @staticmethod
+    def _write_aligned_vertex_data(prim: Usd.Prim, data: dict) -> bool:
+        mesh = UsdGeom.Mesh(prim)
+        if data["normals"] is not None:
+            mesh.GetNormalsAttr().Set(_to_vt_array(data["normals_type"], data["normals"]))
         else:
             # Normals are already in 1 normal per vertex per face, need to set it to vertex so that triangulation
             # doesn't break it.
             mesh.SetNormalsInterpolation(UsdGeom.Tokens.vertex)
 
-        mesh.GetFaceVertexIndicesAttr().Set(fixed_indices)
-        mesh.GetPointsAttr().Set(fixed_points)
-        for primvar in primvars:
-            if primvar["interpolation"] == UsdGeom.Tokens.vertex:
-                primvar["values"] = primvar["fixed_values"]
-            primvar["primvar"].Set(primvar["values"])
+        mesh.GetFaceVertexIndicesAttr().Set(_to_vt_array(Vt.IntArray, data["face_vertex_indices"]))
+        mesh.GetPointsAttr().Set(_to_vt_array(data["points_type"], data["points"]))
+        for primvar in data["primvars"]:
+            values = primvar["values"]
+            if primvar["vertex_values"] is not None:
+                values = _to_vt_array(type(values), primvar["vertex_values"])
+            primvar["primvar"].Set(values)
             primvar["primvar"].BlockIndices()
             primvar["primvar"].SetInterpolation(UsdGeom.Tokens.vertex)
 
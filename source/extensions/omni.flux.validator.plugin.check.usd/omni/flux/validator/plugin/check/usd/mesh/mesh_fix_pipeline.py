@@ -0,0 +1,71 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["run_mesh_fix_pipeline"]
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional
+
+from pxr import Sdf, Usd
+
+
+async def run_mesh_fix_pipeline(
+    prims: Iterable[Usd.Prim],
+    read_fn: Callable[[Usd.Prim], Any],
+    compute_fn: Callable[[Any], Any],
+    write_fn: Callable[[Usd.Prim, Any], bool],
+    max_workers: Optional[int] = None,
+) -> List[bool]:
+    """
+    Fix a list of mesh prims in 3 passes so the computation of the fixes can use all the cores:
+
+    1. The data of every prim is read from the stage, on the calling thread.
+    2. The fixes are computed in a thread pool. The compute function should only work on the read data, for example
+       with NumPy, which releases the GIL.
+    3. The fixes are written back to the stage in a single change block, on the calling thread.
+
+    Args:
+        prims: the prims to fix
+        read_fn: read the data to fix from a prim. Return a boolean instead to skip the prim with this result.
+        compute_fn: compute the fix from the read data
+        write_fn: write a computed fix to a prim. Returns whether the prim was fixed.
+        max_workers: the maximum number of threads used to compute the fixes. Uses the executor default if None.
+
+    Returns:
+        Whether every prim was fixed, in the order of the prims
+    """
+    prims = list(prims)
+    inputs = [read_fn(prim) for prim in prims]
+
+    loop = asyncio.get_event_loop()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            index: loop.run_in_executor(executor, compute_fn, data)
+            for index, data in enumerate(inputs)
+            if not isinstance(data, bool)
+        }
+        outputs = dict(zip(futures.keys(), await asyncio.gather(*futures.values())))
+
+    results = []
+    with Sdf.ChangeBlock():
+        for index, prim in enumerate(prims):
+            if index in outputs:
+                results.append(write_fn(prim, outputs[index]))
+            else:
+                results.append(inputs[index])
+    return results
@@ -0,0 +1,136 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "fan_triangulate",
+    "flip_uvs",
+    "gather_element_values",
+    "gather_subset_vertex_indices",
+    "remap_subset_faces",
+    "to_vt_array",
+]
+
+from typing import Any, Tuple
+
+import numpy as np
+
+
+def fan_triangulate(face_vertex_counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fan triangulate the faces of a mesh. Faces with less than 3 vertices are dropped.
+
+    The face `[v0, v1, v2, v3]` becomes the triangles `[v0, v1, v2]` and `[v0, v2, v3]`.
+
+    Args:
+        face_vertex_counts: the number of vertices of every face
+
+    Returns:
+        The face-vertex index of every triangle corner, 3 per triangle, and the index of the face every triangle
+        comes from. The triangle vertex indices are `face_vertex_indices[corners]`.
+    """
+    counts = np.asarray(face_vertex_counts, dtype=np.int64)
+    offsets = np.cumsum(counts) - counts
+    triangle_counts = np.maximum(counts - 2, 0)
+    triangle_faces = np.repeat(np.arange(len(counts)), triangle_counts)
+    # The index of every triangle within its face
+    first_triangles = np.cumsum(triangle_counts) - triangle_counts
+    local_triangles = np.arange(len(triangle_faces)) - np.repeat(first_triangles, triangle_counts)
+    triangle_offsets = offsets[triangle_faces]
+    corners = np.stack(
+        [triangle_offsets, triangle_offsets + local_triangles + 1, triangle_offsets + local_triangles + 2], axis=1
+    )
+    return corners.ravel(), triangle_faces
+
+
+def remap_subset_faces(subset_face_indices: np.ndarray, triangle_faces: np.ndarray) -> np.ndarray:
+    """
+    Get the triangles generated from the faces of a subset
+
+    Args:
+        subset_face_indices: the face indices of the subset, before triangulation
+        triangle_faces: the index of the face every triangle comes from, as returned by `fan_triangulate`
+
+    Returns:
+        The sorted triangle indices of the subset
+    """
+    return np.flatnonzero(np.isin(triangle_faces, np.asarray(subset_face_indices)))
+
+
+def gather_element_values(values: Any, indices: np.ndarray, element_size: int = 1) -> np.ndarray:
+    """
+    Get the values of the given elements. Used to split per-vertex data into per-face-vertex data.
+
+    Args:
+        values: the values, `element_size` values per element
+        indices: the index of the element of every output element
+        element_size: the number of values of an element
+
+    Returns:
+        The `element_size` values of every index
+    """
+    values = np.asarray(values)
+    indices = np.asarray(indices, dtype=np.int64)
+    if element_size > 1:
+        indices = (indices[:, np.newaxis] * element_size + np.arange(element_size)).ravel()
+    return values[indices]
+
+
+def gather_subset_vertex_indices(face_vertex_indices: np.ndarray, subset_face_indices: np.ndarray) -> np.ndarray:
+    """
+    Get the vertex indices of the triangles of a subset
+
+    Args:
+        face_vertex_indices: the vertex indices of a triangulated mesh
+        subset_face_indices: the triangle indices of the subset
+
+    Returns:
+        The 3 vertex indices of every triangle of the subset
+    """
+    triangles = np.asarray(face_vertex_indices).reshape(-1, 3)
+    return triangles[np.asarray(subset_face_indices, dtype=np.int64)].ravel()
+
+
+def flip_uvs(uvs: Any) -> np.ndarray:
+    """
+    Invert the vertical coordinate of texture coordinates
+
+    Args:
+        uvs: the texture coordinates, 2 values per coordinate
+
+    Returns:
+        A copy of the texture coordinates with an inverted vertical coordinate
+    """
+    flipped = np.array(uvs, dtype=np.float32).reshape(-1, 2)
+    flipped[:, 1] = -flipped[:, 1]
+    return flipped
+
+
+def to_vt_array(vt_type: type, values: np.ndarray):
+    """
+    Convert a NumPy array to a Vt array without going through Python lists when possible
+
+    Args:
+        vt_type: the Vt array type, for example `Vt.Vec3fArray`
+        values: the values to convert
+
+    Returns:
+        The Vt array
+    """
+    # Strings & tokens don't have a buffer representation
+    if values.dtype.kind in "OSU":
+        return vt_type(values.tolist())
+    return vt_type.FromNumpy(np.ascontiguousarray(values))
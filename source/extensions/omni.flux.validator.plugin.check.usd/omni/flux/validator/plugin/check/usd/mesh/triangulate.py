@@ -17,11 +17,16 @@
 
 from typing import Any, Tuple
 
+import numpy as np
 import omni.ui as ui
 import omni.usd
-from pxr import Sdf, Usd, UsdGeom
+from pxr import Usd, UsdGeom, Vt
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from .mesh_fix_pipeline import run_mesh_fix_pipeline as _run_mesh_fix_pipeline
+from .mesh_kernels import fan_triangulate as _fan_triangulate
+from .mesh_kernels import remap_subset_faces as _remap_subset_faces
+from .mesh_kernels import to_vt_array as _to_vt_array
 
 
 class Triangulate(_CheckBaseUSD):
@@ -84,14 +89,17 @@ class Triangulate(_CheckBaseUSD):
         """
         message = "Fix:\n"
         all_pass = True
-        with Sdf.ChangeBlock():
-            for prim in selector_plugin_data:
-                message += f"- {str(prim.GetPath())}\n"
-                if self._triangulate_mesh(prim):
-                    message += f"- PASS: {str(prim.GetPath())}\n"
-                else:
-                    message += f"- FAIL: {str(prim.GetPath())}\n"
-                    all_pass = False
+        prims = list(selector_plugin_data)
+        results = await _run_mesh_fix_pipeline(
+            prims, self._read_mesh, self._compute_triangulation, self._write_triangulation
+        )
+        for prim, result in zip(prims, results):
+            message += f"- {str(prim.GetPath())}\n"
+            if result:
+                message += f"- PASS: {str(prim.GetPath())}\n"
+            else:
+                message += f"- FAIL: {str(prim.GetPath())}\n"
+                all_pass = False
         return all_pass, message, None
 
     @omni.usd.handle_exception
@@ -102,10 +110,10 @@ class Triangulate(_CheckBaseUSD):
         ui.Label("None")
 
     def _is_triangulated(self, faces):
-        return set(faces) == {3}
+        faces = np.asarray(faces)
+        return faces.size > 0 and bool(np.all(faces == 3))
 
-    def _triangulate_mesh(self, prim: Usd.Prim):
-        # indices and faces converted to triangles
+    def _read_mesh(self, prim: Usd.Prim) -> dict | bool:
         mesh = UsdGeom.Mesh(prim)
         faces = mesh.GetFaceVertexCountsAttr().Get()
         if faces is None:
@@ -119,42 +127,35 @@ class Triangulate(_CheckBaseUSD):
         if not indices or not faces:
             return True
 
-        indices_offset = 0
-        new_face_counts = []
-        triangles = []
-        subsets = []
-
         # need to update geom subset face lists
+        subsets = []
         display_predicate = Usd.TraverseInstanceProxies(Usd.PrimAllPrimsPredicate)
         children_iterator = iter(Usd.PrimRange(prim, display_predicate))
         for child_prim in children_iterator:
             if child_prim.IsA(UsdGeom.Subset):
                 subset = UsdGeom.Subset.Get(prim.GetStage(), child_prim.GetPath())
-                subsets.append(
-                    {
-                        "subset": subset,
-                        "old_faces": set(subset.GetIndicesAttr().Get()),  # set of old face indices in this subset
-                        "new_faces": [],  # the new face index list
-                    }
-                )
-
-        for old_face_index, face_count in enumerate(faces):
-            start_index = indices[indices_offset]
-            for face_index in range(face_count - 2):
-                for subset in subsets:
-                    if old_face_index in subset["old_faces"]:
-                        subset["new_faces"].append(len(new_face_counts))
-                new_face_counts.append(3)
-                index1 = indices_offset + face_index + 1
-                index2 = indices_offset + face_index + 2
-                triangles.append(start_index)
-                triangles.append(indices[index1])
-                triangles.append(indices[index2])
-            indices_offset += face_count
-
-        for subset in subsets:
-            subset["subset"].GetIndicesAttr().Set(subset["new_faces"])
-
-        mesh.GetFaceVertexIndicesAttr().Set(triangles)
-        mesh.GetFaceVertexCountsAttr().Set(new_face_counts)
+                subsets.append((subset, np.asarray(subset.GetIndicesAttr().Get() or [], dtype=np.int64)))
+
+        return {"faces": np.asarray(faces), "indices": np.asarray(indices), "subsets": subsets}
+
+    @staticmethod
+    def _compute_triangulation(data: dict) -> dict:
+        # indices and faces converted to triangles
+        corners, triangle_faces = _fan_triangulate(data["faces"])
+        return {
+            "indices": data["indices"][corners].astype(np.int32),
+            "faces": np.full(len(triangle_faces), 3, dtype=np.int32),
+            "subsets": [
+                (subset, _remap_subset_faces(old_faces, triangle_faces).astype(np.int32))
+                for subset, old_faces in data["subsets"]
+            ],
+        }
+
+    @staticmethod
+    def _write_triangulation(prim: Usd.Prim, data: dict) -> bool:
+        mesh = UsdGeom.Mesh(prim)
+        for subset, new_faces in data["subsets"]:
+            subset.GetIndicesAttr().Set(_to_vt_array(Vt.IntArray, new_faces))
+        mesh.GetFaceVertexIndicesAttr().Set(_to_vt_array(Vt.IntArray, data["indices"]))
+        mesh.GetFaceVertexCountsAttr().Set(_to_vt_array(Vt.IntArray, data["faces"]))
         return True
@@ -24,6 +24,8 @@ from .unit.material.test_material_shaders import *
 from .unit.mesh.test_add_inverted_uv_attr import *
 from .unit.mesh.test_add_vertex_indices_to_geom_subsets import *
 from .unit.mesh.test_force_primvar_to_vertex_interpolation import *
+from .unit.mesh.test_mesh_fix_pipeline import *
+from .unit.mesh.test_mesh_kernels import *
 from .unit.mesh.test_strip_extra_attributes import *
 from .unit.mesh.test_triangulate import *
 from .unit.meta.test_default_prim import *
@@ -31,6 +33,7 @@ from .unit.meta.test_wrap_root_prims import *
 from .unit.paths.test_relative_asset_paths import *
 from .unit.paths.test_relative_references import *
 from .unit.test_print_prims import *
+from .unit.texture.test_conversion_cache import *
 from .unit.texture.test_convert_to_dds import *
 from .unit.texture.test_convert_to_octahedral import *
 from .unit.xform.test_apply_unit_scale import *
@@ -0,0 +1,60 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import threading
+
+import omni.kit.test
+from omni.flux.validator.plugin.check.usd.mesh.mesh_fix_pipeline import run_mesh_fix_pipeline
+from pxr import Usd, UsdGeom
+
+
+class TestMeshFixPipeline(omni.kit.test.AsyncTestCase):
+    async def test_run_mesh_fix_pipeline_should_compute_in_threads_and_keep_prim_order(self):
+        # Arrange
+        stage = Usd.Stage.CreateInMemory()
+        prims = []
+        for index in range(4):
+            mesh = UsdGeom.Mesh.Define(stage, f"/Mesh{index}")
+            mesh.GetFaceVertexCountsAttr().Set([4] * (index + 1))
+            prims.append(mesh.GetPrim())
+
+        main_thread = threading.current_thread()
+        compute_threads = []
+
+        def read_fn(prim):
+            self.assertIs(threading.current_thread(), main_thread)
+            counts = UsdGeom.Mesh(prim).GetFaceVertexCountsAttr().Get()
+            # Skip the first prim with a failed result
+            return False if len(counts) == 1 else len(counts)
+
+        def compute_fn(data):
+            compute_threads.append(threading.current_thread())
+            return data * 2
+
+        def write_fn(prim, data):
+            self.assertIs(threading.current_thread(), main_thread)
+            prim.SetCustomDataByKey("fixed", data)
+            return True
+
+        # Act
+        results = await run_mesh_fix_pipeline(prims, read_fn, compute_fn, write_fn, max_workers=2)
+
+        # Assert
+        self.assertListEqual([False, True, True, True], results)
+        self.assertListEqual([None, 4, 6, 8], [prim.GetCustomDataByKey("fixed") for prim in prims])
+        self.assertEqual(3, len(compute_threads))
+        self.assertNotIn(main_thread, compute_threads)
@@ -0,0 +1,133 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import time
+
+import carb
+import numpy as np
+import omni.kit.test
+from omni.flux.validator.plugin.check.usd.mesh import mesh_kernels as _mesh_kernels
+
+
+def _fan_triangulate_python(faces, indices, subset_faces):
+    # Reference implementation: the loops the kernels replaced
+    indices_offset = 0
+    triangles = []
+    new_subset_faces = []
+    triangle_count = 0
+    for old_face_index, face_count in enumerate(faces):
+        start_index = indices[indices_offset]
+        for face_index in range(face_count - 2):
+            if old_face_index in subset_faces:
+                new_subset_faces.append(triangle_count)
+            triangle_count += 1
+            triangles.append(start_index)
+            triangles.append(indices[indices_offset + face_index + 1])
+            triangles.append(indices[indices_offset + face_index + 2])
+        indices_offset += face_count
+    return triangles, new_subset_faces
+
+
+class TestMeshKernels(omni.kit.test.AsyncTestCase):
+    async def test_fan_triangulate_should_match_python_triangulation(self):
+        # Arrange
+        rng = np.random.default_rng(0)
+        faces = rng.integers(1, 7, size=1000)
+        indices = rng.integers(0, 500, size=int(faces.sum()))
+        subset_faces = set(rng.integers(0, len(faces), size=100).tolist())
+
+        # Act
+        corners, triangle_faces = _mesh_kernels.fan_triangulate(faces)
+        triangles = indices[corners]
+        new_subset_faces = _mesh_kernels.remap_subset_faces(sorted(subset_faces), triangle_faces)
+
+        # Assert
+        expected_triangles, expected_subset_faces = _fan_triangulate_python(
+            faces.tolist(), indices.tolist(), subset_faces
+        )
+        self.assertListEqual(expected_triangles, triangles.tolist())
+        self.assertListEqual(expected_subset_faces, new_subset_faces.tolist())
+
+    async def test_fan_triangulate_quad_should_create_two_triangles(self):
+        # Act
+        corners, triangle_faces = _mesh_kernels.fan_triangulate([4, 3, 2])
+
+        # Assert
+        self.assertListEqual([0, 1, 2, 0, 2, 3, 4, 5, 6], corners.tolist())
+        self.assertListEqual([0, 0, 1], triangle_faces.tolist())
+
+    async def test_gather_element_values_should_split_elements(self):
+        # Arrange
+        values = np.array([[0, 0], [1, 1], [2, 2], [3, 3]], dtype=np.float32)
+
+        # Act
+        single_values = _mesh_kernels.gather_element_values(values, [3, 0, 3])
+        pair_values = _mesh_kernels.gather_element_values(values, [1, 0], element_size=2)
+
+        # Assert
+        self.assertListEqual([[3, 3], [0, 0], [3, 3]], single_values.tolist())
+        self.assertListEqual([[2, 2], [3, 3], [0, 0], [1, 1]], pair_values.tolist())
+
+    async def test_gather_subset_vertex_indices_should_get_triangle_vertices(self):
+        # Act
+        value = _mesh_kernels.gather_subset_vertex_indices([0, 1, 2, 2, 3, 0, 4, 5, 6], [2, 0])
+
+        # Assert
+        self.assertListEqual([4, 5, 6, 0, 1, 2], value.tolist())
+
+    async def test_flip_uvs_should_invert_vertical_coordinate(self):
+        # Arrange
+        uvs = np.array([[0.25, 0.5], [1.0, -1.0]], dtype=np.float32)
+
+        # Act
+        value = _mesh_kernels.flip_uvs(uvs)
+
+        # Assert
+        self.assertListEqual([[0.25, -0.5], [1.0, 1.0]], value.tolist())
+        self.assertListEqual([[0.25, 0.5], [1.0, -1.0]], uvs.tolist())
+
+    async def test_fan_triangulate_benchmark_should_match_python_triangulation(self):
+        # Arrange
+        face_count = 250_000  # quads, so 500k triangles
+        rng = np.random.default_rng(0)
+        faces = np.full(face_count, 4)
+        indices = rng.integers(0, face_count, size=face_count * 4)
+        subset_faces = np.arange(0, face_count, 2)
+
+        # Act
+        start = time.perf_counter()
+        corners, triangle_faces = _mesh_kernels.fan_triangulate(faces)
+        triangles = indices[corners]
+        new_subset_faces = _mesh_kernels.remap_subset_faces(subset_faces, triangle_faces)
+        kernel_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected_triangles, expected_subset_faces = _fan_triangulate_python(
+            faces.tolist(), indices.tolist(), set(subset_faces.tolist())
+        )
+        python_duration = time.perf_counter() - start
+
+        carb.log_info(
+            f"Triangulated {len(triangle_faces)} triangles in {kernel_duration:.3f}s "
+            f"({python_duration:.3f}s with Python loops)"
+        )
+
+        # Assert
+        self.assertEqual(face_count * 2 * 3, len(triangles))
+        self.assertEqual(face_count, len(new_subset_faces))
+        self.assertListEqual(expected_triangles, triangles.tolist())
+        self.assertListEqual(expected_subset_faces, new_subset_faces.tolist())
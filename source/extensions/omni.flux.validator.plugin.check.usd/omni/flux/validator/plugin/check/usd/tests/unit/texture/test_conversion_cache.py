@@ -0,0 +1,97 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import omni.kit.test
+from omni.flux.validator.plugin.check.usd.texture import conversion_cache as _conversion_cache
+
+
+class TestConversionCache(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.temp_dir = TemporaryDirectory()  # noqa PLR1732
+        self.temp_path = Path(self.temp_dir.name)
+        self.index_path = str(self.temp_path / "cache" / "index.json")
+        self.source_path = self.temp_path / "source.png"
+        self.source_path.write_bytes(b"source")
+
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    async def test_get_source_hash_should_only_hash_changed_files(self):
+        # Arrange
+        cache = _conversion_cache.ConversionCache(self.index_path)
+
+        # Act
+        with patch.object(_conversion_cache, "_hash_file", wraps=_conversion_cache._hash_file) as hash_mock:
+            first_hash = cache.get_source_hash(str(self.source_path))
+            second_hash = cache.get_source_hash(str(self.source_path))
+            self.source_path.write_bytes(b"changed source")
+            third_hash = cache.get_source_hash(str(self.source_path))
+
+        # Assert
+        self.assertEqual(first_hash, second_hash)
+        self.assertNotEqual(first_hash, third_hash)
+        self.assertEqual(hash_mock.call_count, 2)
+
+    async def test_get_key_should_change_with_args_and_tool_version(self):
+        # Act
+        key = _conversion_cache.ConversionCache.get_key("hash", ["--format", "bc7"], "1")
+
+        # Assert
+        self.assertEqual(key, _conversion_cache.ConversionCache.get_key("hash", ["--format", "bc7"], "1"))
+        self.assertNotEqual(key, _conversion_cache.ConversionCache.get_key("hash", ["--format", "bc5"], "1"))
+        self.assertNotEqual(key, _conversion_cache.ConversionCache.get_key("hash", ["--format", "bc7"], "2"))
+        self.assertNotEqual(key, _conversion_cache.ConversionCache.get_key("other", ["--format", "bc7"], "1"))
+
+    async def test_save_should_share_outputs_with_other_caches(self):
+        # Arrange
+        output_path = self.temp_path / "source.rtex.dds"
+        output_path.write_bytes(b"output")
+        cache = _conversion_cache.ConversionCache(self.index_path)
+        key = cache.get_key(cache.get_source_hash(str(self.source_path)), ["--format", "bc7"], "1")
+        other_cache = _conversion_cache.ConversionCache(self.index_path)
+        other_cache.add_output("other_key", str(output_path))
+        other_cache.save()
+
+        # Act
+        cache.add_output(key, str(output_path))
+        cache.save()
+
+        # Assert
+        new_cache = _conversion_cache.ConversionCache(self.index_path)
+        self.assertEqual(new_cache.find_output(key), str(output_path))
+        self.assertEqual(new_cache.find_output("other_key"), str(output_path))
+
+    async def test_find_output_should_ignore_modified_outputs(self):
+        # Arrange
+        output_path = self.temp_path / "source.rtex.dds"
+        output_path.write_bytes(b"output")
+        cache = _conversion_cache.ConversionCache(self.index_path)
+        cache.add_output("key", str(output_path))
+
+        # Act
+        output_path.write_bytes(b"modified output")
+        stat = output_path.stat()
+        os.utime(output_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Assert
+        self.assertIsNone(cache.find_output("key"))
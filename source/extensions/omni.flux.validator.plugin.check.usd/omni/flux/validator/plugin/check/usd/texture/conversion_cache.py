@@ -0,0 +1,142 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["ConversionCache", "get_conversion_cache", "get_tool_version"]
+
+import functools
+import hashlib
+import json
+from typing import List, Optional
+
+from omni.flux.utils.common.json_index import JsonIndex as _JsonIndex
+from omni.flux.utils.common.json_index import get_file_signature as _get_file_signature
+from omni.flux.utils.common.json_index import is_signature_unchanged as _is_signature_unchanged
+from omni.flux.utils.common.path_utils import hash_file as _hash_file
+
+
+@functools.lru_cache(maxsize=None)
+def get_tool_version(tool_path: str) -> str:
+    """
+    Get a version identifier for a conversion tool. The identifier changes when the tool executable is updated.
+
+    Args:
+        tool_path: the path of the tool executable
+
+    Returns:
+        The tool version identifier
+    """
+    signature = _get_file_signature(tool_path)
+    if signature is None:
+        return "unknown"
+    return f"{signature['size']}-{signature['mtime_ns']}"
+
+
+def get_conversion_cache(index_path: str) -> "ConversionCache":
+    """
+    Get the conversion cache using the given index file
+
+    Args:
+        index_path: the path of the index file. Can contain tokens.
+
+    Returns:
+        The conversion cache
+    """
+    return ConversionCache.get_shared(index_path)
+
+
+class ConversionCache(_JsonIndex):
+    def __init__(self, index_path: str):
+        """
+        An on-disk index of converted files, keyed by the content hash of the source file, the conversion arguments
+        and the version of the conversion tool.
+
+        The source hashes are stored with the size & modification time of the source files, so unchanged files are not
+        hashed again. The index is shared by every process using the same index file, so an output converted for a
+        project or a mass ingestion job can be reused by another one.
+
+        Args:
+            index_path: the path of the index file
+        """
+        super().__init__(index_path, ["sources", "outputs"], display_name="conversion cache index")
+
+    def get_source_hash(self, source_path: str) -> Optional[str]:
+        """
+        Get the content hash of a source file. The file is only hashed if it changed since it was last hashed.
+
+        Args:
+            source_path: the path of the source file
+
+        Returns:
+            The hash of the file, or None if the file can't be read
+        """
+        signature = _get_file_signature(source_path)
+        if signature is None:
+            return None
+        entry = self._get_entry("sources", source_path)
+        if _is_signature_unchanged(entry, signature):
+            return entry["hash"]
+        source_hash = _hash_file(source_path)
+        if source_hash is None:
+            return None
+        self._set_entry("sources", source_path, {**signature, "hash": source_hash})
+        return source_hash
+
+    @staticmethod
+    def get_key(source_hash: str, args: List[str], tool_version: str) -> str:
+        """
+        Get the key of a conversion
+
+        Args:
+            source_hash: the content hash of the source file
+            args: the conversion arguments, without the input & output paths
+            tool_version: the version of the conversion tool
+
+        Returns:
+            The conversion key
+        """
+        return hashlib.md5(json.dumps([source_hash, list(args), tool_version]).encode("utf-8")).hexdigest()
+
+    def find_output(self, key: str) -> Optional[str]:
+        """
+        Find the output file of a conversion. Outputs that were deleted or modified since the conversion are ignored.
+
+        Args:
+            key: the conversion key
+
+        Returns:
+            The path of the output file, or None if the conversion was never done
+        """
+        entry = self._get_entry("outputs", key)
+        if not entry:
+            return None
+        if not _is_signature_unchanged(entry, _get_file_signature(entry["path"])):
+            self._remove_entry("outputs", key)
+            return None
+        return entry["path"]
+
+    def add_output(self, key: str, output_path: str):
+        """
+        Record the output file of a conversion
+
+        Args:
+            key: the conversion key
+            output_path: the path of the converted file
+        """
+        signature = _get_file_signature(output_path)
+        if signature is None:
+            return
+        self._set_entry("outputs", key, {**signature, "path": output_path})
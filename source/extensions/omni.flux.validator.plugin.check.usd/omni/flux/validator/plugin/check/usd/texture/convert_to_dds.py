@@ -15,8 +15,7 @@
 * limitations under the License.
 """
 
-import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import shutil
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -31,17 +30,18 @@ from omni.flux.asset_importer.core.data_models import (
 from omni.flux.asset_importer.core.data_models import TEXTURE_TYPE_INPUT_MAP as _TEXTURE_TYPE_INPUT_MAP
 from omni.flux.asset_importer.core.data_models import TextureTypes as _TextureTypes
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
-from omni.flux.utils.common.path_utils import get_new_hash as _get_new_hash
 from omni.flux.utils.common.path_utils import get_udim_sequence as _get_udim_sequence
 from omni.flux.utils.common.path_utils import is_udim_texture as _is_udim_texture
 from omni.flux.utils.common.path_utils import texture_to_udim as _texture_to_udim
-from omni.flux.utils.common.path_utils import write_metadata as _write_metadata
+from omni.flux.utils.common.texture_process_scheduler import TextureProcessScheduler as _TextureProcessScheduler
 from omni.flux.validator.factory import InOutDataFlow as _InOutDataFlow
 from omni.flux.validator.factory import utils as _validator_factory_utils
 from pxr import Sdf
 from pydantic import BaseModel, validator
 
 from ..base.check_base_usd import CheckBaseUSD as _CheckBaseUSD  # noqa PLE0402
+from .conversion_cache import get_conversion_cache as _get_conversion_cache
+from .conversion_cache import get_tool_version as _get_tool_version
 
 
 def _generate_out_path(in_path_str: str, suffix: str):
@@ -88,6 +88,7 @@ class ConvertToDDS(_CheckBaseUSD):
         }
         replace_udim_textures_by_empty: bool = False
         suffix: str = ".rtex.dds"
+        conversion_cache_path: str = "${data}/omni.flux.validator/dds_conversion_cache.json"
 
         _compatible_data_flow_names = ["InOutData"]
         data_flows: Optional[List[_InOutDataFlow]] = None  # override base argument with the good typing
@@ -229,31 +230,32 @@ class ConvertToDDS(_CheckBaseUSD):
                             files_needed[out_path] = (texture_path, is_udim, settings, [attr])
 
         # generate all the files
-        processed_files = []
-        futures = []
-        executor = ThreadPoolExecutor(max_workers=4)
         nvtt_path = carb.tokens.get_tokens_interface().resolve(
             "${omni.flux.validator.plugin.check.usd}/../../deps/tools/nvtt/nvtt_export.exe"
         )
+        conversion_cache = _get_conversion_cache(schema_data.conversion_cache_path)
+        tool_version = _get_tool_version(nvtt_path)
+        scheduler = _TextureProcessScheduler(nvtt_path)
         for out_path_str, (in_path_str, is_udim, settings, attrs) in files_needed.items():
             out_path = Path(out_path_str)
-            src_hash = _get_new_hash(in_path_str, out_path_str)
+            src_hash = conversion_cache.get_source_hash(in_path_str)
+            conversion_key = conversion_cache.get_key(src_hash, settings.args, tool_version) if src_hash else None
+            cached_path_str = conversion_cache.find_output(conversion_key) if conversion_key else None
 
             _validator_factory_utils.push_input_data(schema_data, [in_path_str])
 
-            if not out_path.exists() or src_hash is not None:
-                cmd = [nvtt_path, in_path_str, "--output", out_path_str] + settings.args
-                carb.log_info("Queuing DDS conversion: " + str(cmd))
-                future = executor.submit(
-                    subprocess.run, cmd, check=True, capture_output=True, text=True, stdin=subprocess.DEVNULL
-                )
-                future.original_command = cmd
-                future.attrs = attrs
-                future.out_path = out_path
-                future.is_udim = is_udim
-                future.src_hash = src_hash
-                futures.append(future)
-                processed_files.append(in_path_str)
+            # The same conversion could have been done for another project or ingestion job
+            if cached_path_str and Path(cached_path_str) != out_path:
+                try:
+                    shutil.copy2(cached_path_str, out_path_str)
+                    conversion_cache.add_output(conversion_key, out_path_str)
+                except OSError as e:
+                    carb.log_warn(f"Unable to reuse the compressed texture {cached_path_str}: {e}")
+                    cached_path_str = None
+
+            if not cached_path_str:
+                carb.log_info(f"Queuing DDS conversion: {in_path_str} -> {out_path_str} {settings.args}")
+                scheduler.submit(in_path_str, out_path_str, settings.args, data=(attrs, is_udim, conversion_key))
             else:
                 # compressed texture exists and doesn't need to be updated
                 with Sdf.ChangeBlock():
@@ -268,41 +270,41 @@ class ConvertToDDS(_CheckBaseUSD):
                 message += f"- PASS: reused existing compressed texture: {out_path_str}\n"
 
         # Update all the attributes as the files are generated.
-        if futures:
-            progress = 0
-            self.on_progress(progress, "Start", True)
-            to_add = 1 / len(futures)
-            for future in as_completed(futures):
-                progress += to_add
-                try:
-                    result = future.result()
-                    carb.log_info("DDS command result: " + str(result))
-                    out_path_str = str(future.out_path)
-                    _write_metadata(out_path_str, "src_hash", future.src_hash)
-                    with Sdf.ChangeBlock():
-                        for attr in future.attrs:
-                            value = out_path_str
-                            if future.is_udim:
-                                if schema_data.replace_udim_textures_by_empty:
-                                    value = ""
-                                else:
-                                    value = _texture_to_udim(out_path_str)
-                            attr.Set(value)
-
-                    _validator_factory_utils.push_output_data(schema_data, [out_path_str])
-
-                    message += f"- PASS: created compressed texture {future.out_path}\n"
-                    self.on_progress(progress, f"Compressed to {future.out_path}", True)
-                except subprocess.CalledProcessError as e:  # noqa
-                    carb.log_error(
-                        "Exception when converting texture to dds.\n"
-                        + f"cmd: {e.cmd}\noutput: {e.output}\nstdout: {e.stdout}\nstderr: {e.stderr}"
-                    )
-                    message += f"- FAIL: failure in dds compression command: {future.original_command}.\n"
-                    self.on_progress(progress, f"Error from {future.out_path}", True)
+        job_count = scheduler.metrics.queued
+        if job_count:
+            self.on_progress(0, "Start", True)
+            for index, result in enumerate(scheduler.run()):
+                progress = (index + 1) / job_count
+                metrics = scheduler.metrics
+                status = f"{metrics.queued + metrics.running} remaining, {metrics.throughput:.1f} textures/s"
+                out_path_str = result.job.output_path
+                attrs, is_udim, conversion_key = result.job.data
+                if not result.success:
+                    carb.log_error(f"Exception when converting texture to dds.\n{result.message}")
+                    message += f"- FAIL: failure in dds compression of {result.job.input_path}.\n"
+                    self.on_progress(progress, f"Error from {out_path_str} ({status})", True)
                     all_pass = False
+                    continue
+
+                carb.log_info(f"DDS command result: {result.message}")
+                if conversion_key:
+                    conversion_cache.add_output(conversion_key, out_path_str)
+                with Sdf.ChangeBlock():
+                    for attr in attrs:
+                        value = out_path_str
+                        if is_udim:
+                            if schema_data.replace_udim_textures_by_empty:
+                                value = ""
+                            else:
+                                value = _texture_to_udim(out_path_str)
+                        attr.Set(value)
+
+                _validator_factory_utils.push_output_data(schema_data, [out_path_str])
+
+                message += f"- PASS: created compressed texture {out_path_str}\n"
+                self.on_progress(progress, f"Compressed to {out_path_str} ({status})", True)
 
-        executor.shutdown(wait=True)
+        conversion_cache.save()
         await omni.kit.app.get_app().next_update_async()
 
         return all_pass, message, None